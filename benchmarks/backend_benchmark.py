@@ -0,0 +1,54 @@
+"""Compare workbook backends on a generated workbook.
+
+Usage: python benchmarks/backend_benchmark.py [--rows 50000] [--cols 10]
+"""
+import argparse
+import tempfile
+import time
+from os.path import join
+
+from openpyxl import Workbook
+
+from exco.cell_source import as_workbook_source
+from exco.workbook_loader import load_workbook, WorkbookBackend
+
+
+def make_workbook(fname: str, rows: int, cols: int):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('data')
+    ws.append([f'col{c}' for c in range(cols)])
+    for r in range(rows):
+        ws.append([f'text{r}' if c % 2 else r * c for c in range(cols)])
+    wb.save(fname)
+
+
+def scan(fname: str, **kwargs) -> int:
+    wb = load_workbook(fname, **kwargs)
+    try:
+        sheet = as_workbook_source(wb)['data']
+        return sum(1 for values in sheet.iter_values() for v in values if v is not None)
+    finally:
+        wb.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=50000)
+    arg_parser.add_argument('--cols', type=int, default=10)
+    args = arg_parser.parse_args()
+    cases = {
+        'openpyxl': dict(backend=WorkbookBackend.OPENPYXL),
+        'openpyxl read_only': dict(backend=WorkbookBackend.OPENPYXL, read_only=True),
+        'xml': dict(backend=WorkbookBackend.XML),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = join(tmp, 'benchmark.xlsx')
+        make_workbook(fname, args.rows, args.cols)
+        for name, kwargs in cases.items():
+            start = time.perf_counter()
+            n = scan(fname, **kwargs)
+            print(f'{name:>20}: {time.perf_counter() - start:.3f}s ({n} cells)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare derefing a large spec with regex work on every string against precompiled interpolation plans.
+
+Usage: python benchmarks/deref_benchmark.py [--specs 2000] [--repeat 5]
+"""
+import argparse
+import time
+
+from openpyxl import Workbook
+
+from exco import CellLocation, setting
+from exco.dereferator import Dereferator
+from exco.extractor_spec import CellExtractionSpec, ExcelProcessorSpec
+
+
+class RegexDereferator(Dereferator):
+    """Dereferator before interpolation plans: findall, sub and search on every string."""
+
+    def deref_text(self, text):
+        if text and isinstance(text, str):
+            pure_match = len(self.deref_re.findall(text)) == 1 and self.deref_re.sub('', text) == ''
+            if pure_match:
+                return self.resolve_match(self.deref_re.search(text))
+            return self.deref_re.sub(lambda x: str(self.resolve_match(x)), str(text))
+        return text
+
+
+def make_spec(n: int) -> ExcelProcessorSpec:
+    cell_specs = {}
+    for i in range(n):
+        cl = CellLocation('Sheet', f'B{i + 1}')
+        cell_specs[cl] = [CellExtractionSpec.from_dict({
+            'key': f'key_{i}',
+            'parser': 'float',
+            'params': {'unit': '==A1==', 'label': 'value in ==A1== per ==A2==', 'scale': 1000},
+            'fallback': '==A3==',
+            'metadata': {'description': f'plain text {i}', 'tags': ['a', 'b', '==A2==']},
+            'validations': [{'key': 'range', 'name': 'between', 'low': 0, 'high': '==A4=='}],
+        })]
+    return ExcelProcessorSpec(cell_specs=cell_specs, table_specs={})
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--specs', type=int, default=2000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Sheet'
+    for coordinate, value in {'A1': 'km', 'A2': 'hour', 'A3': 0, 'A4': 100}.items():
+        ws[coordinate] = value
+    spec = make_spec(args.specs)
+    plans = {}
+    spec.extract_time_references(plans)  # compiled with the tasks, see ExcelProcessor._static_processor
+    cases = {
+        'regex': lambda workbook, anchor: RegexDereferator(setting.spec_to_extractor_deref_re, workbook, anchor),
+        'plan': lambda workbook, anchor: Dereferator.spec_to_extractor(workbook, anchor, plans=plans),
+    }
+    results = {}
+    for name, make_dereferator in cases.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            results[name] = spec._deref(wb, make_dereferator)
+        print(f'{name:>6}: {(time.perf_counter() - start) / args.repeat:.3f}s per deref')
+    assert results['regex'] == results['plan']
+
+
+if __name__ == '__main__':
+    main()
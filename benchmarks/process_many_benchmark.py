@@ -0,0 +1,36 @@
+"""Compare processing many workbooks one after another with ExcelProcessor.process_many on a process pool.
+
+Usage: python benchmarks/process_many_benchmark.py [--files 200] [--jobs 4] [--chunksize 4]
+"""
+import argparse
+import os
+import time
+from os.path import join, dirname
+
+import exco
+
+sample_dir = join(dirname(__file__), '../sample/test')
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--files', type=int, default=200)
+    arg_parser.add_argument('--jobs', type=int, default=os.cpu_count())
+    arg_parser.add_argument('--chunksize', type=int, default=4)
+    args = arg_parser.parse_args()
+    template = join(sample_dir, 'everything/everything_template.xlsx')
+    processor = exco.from_excel(template)
+    paths = [template] * args.files
+
+    start = time.perf_counter()
+    for path in paths:
+        processor.process_excel(path)
+    print(f'{"serial":>12}: {time.perf_counter() - start:.3f}s')
+
+    start = time.perf_counter()
+    n = sum(1 for _ in processor.process_many(paths, jobs=args.jobs, chunksize=args.chunksize))
+    print(f'{f"{args.jobs} jobs":>12}: {time.perf_counter() - start:.3f}s ({n} files)')
+
+
+if __name__ == '__main__':
+    main()
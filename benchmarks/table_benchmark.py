@@ -0,0 +1,54 @@
+"""Compare reading table rows in windows with reading them cell by cell.
+
+Usage: python benchmarks/table_benchmark.py [--rows 9000] [--cols 5] [--backend openpyxl]
+"""
+import argparse
+import tempfile
+import time
+from os.path import join
+
+from openpyxl import Workbook
+
+from exco import CellLocation, setting
+from exco.cell_location import CellOffset
+from exco.extractor.cell_extraction_task import CellExtractionTask
+from exco.extractor.locator.built_in.at_comment_cell_locator import AtCommentCellLocator
+from exco.extractor.parser.built_in.float_parser import FloatParser
+from exco.extractor.table_extraction_task import EndConditionCollection, TableExtractionTask
+from exco.workbook_loader import load_workbook
+
+
+def make_workbook(fname: str, rows: int, cols: int):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('data')
+    for r in range(rows):
+        ws.append([r * c + 0.5 for c in range(cols)])
+    wb.save(fname)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=9000)
+    arg_parser.add_argument('--cols', type=int, default=5)
+    arg_parser.add_argument('--backend', type=str, default='openpyxl')
+    args = arg_parser.parse_args()
+    setting.table_infinite_loop_guard = max(setting.table_infinite_loop_guard, args.rows + 2)
+    task = TableExtractionTask(
+        key='table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(0, c): CellExtractionTask.simple(key=f'c{c}', parser=FloatParser())
+                 for c in range(args.cols)},
+        end_condition=EndConditionCollection.default())
+    anchor = CellLocation('data', 'A1')
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = join(tmp, 'table.xlsx')
+        make_workbook(fname, args.rows, args.cols)
+        wb = load_workbook(fname, backend=args.backend)
+        for name, process in [('windows', task._process_windows), ('cells', task._process_cells)]:
+            start = time.perf_counter()
+            result = process(task.locator.locate(anchor, wb), wb)
+            print(f'{name:>8}: {time.perf_counter() - start:.3f}s ({len(result.row_results)} rows)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compare template scanning through openpyxl with reading the comment parts directly.
+
+Usage: python benchmarks/template_scan_benchmark.py [--rows 5000] [--cols 10] [--comments 200]
+"""
+import argparse
+import tempfile
+import time
+from os.path import join
+
+import openpyxl
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+from openpyxl.styles import Font
+
+from exco import ExcoTemplate
+
+
+def make_template(fname: str, rows: int, cols: int, comments: int):
+    wb = Workbook()
+    ws = wb.active
+    bold = Font(bold=True)
+    for r in range(1, rows + 1):
+        for c in range(1, cols + 1):
+            cell = ws.cell(row=r, column=c, value=r * c)
+            cell.font = bold
+    step = max(rows // comments, 1)
+    for i in range(comments):
+        ws.cell(row=i * step + 1, column=1).comment = Comment(f'{{{{--\nkey: k{i}\nparser: int\n--}}}}', 'exco')
+    wb.save(fname)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=5000)
+    arg_parser.add_argument('--cols', type=int, default=10)
+    arg_parser.add_argument('--comments', type=int, default=200)
+    args = arg_parser.parse_args()
+    cases = {
+        'openpyxl workbook': lambda fname: ExcoTemplate.from_workbook(openpyxl.load_workbook(fname)),
+        'comment parts': ExcoTemplate.from_excel,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = join(tmp, 'template.xlsx')
+        make_template(fname, args.rows, args.cols, args.comments)
+        for name, scan in cases.items():
+            start = time.perf_counter()
+            n = scan(fname).n_exco_blocks()
+            print(f'{name:>20}: {time.perf_counter() - start:.3f}s ({n} blocks)')
+
+
+if __name__ == '__main__':
+    main()
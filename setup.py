@@ -24,7 +24,8 @@ setup(name='exco',
       packages=find_packages('src'),
       py_modules=['exco'],
       entry_points={
-          'console_scripts': ['exco_watch_simple=exco.exco_watch:ExcoWatch.main'],
+          'console_scripts': ['exco_watch_simple=exco.exco_watch:ExcoWatch.main',
+                              'exco=exco.cli:main'],
       },
       install_requires=[
           'openpyxl',
@@ -46,6 +47,17 @@ setup(name='exco',
               'pytest',
               'pytest-cov',
               'flake8'
+          ],
+          'numpy': [
+              'numpy'
+          ],
+          'pandas': [
+              'numpy',
+              'pandas'
+          ],
+          'arrow': [
+              'numpy',
+              'pyarrow'
           ]
       },
       license='Private',
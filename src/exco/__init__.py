@@ -9,9 +9,12 @@ from exco.extractor_spec import AssumptionSpec, \
     LocatorSpec, \
     ExcelProcessorSpec
 
-from exco.extractor import ExcelProcessorFactory, ExcelProcessor
-from exco.shortcut import from_excel
+from exco.extractor import ExcelProcessorFactory, ExcelProcessor, MultiProcessor
+from exco.sheet_name_alias import ExactSheetName, CaseInsensitiveSheetName, GlobSheetName, RegexSheetName, \
+    AnySheetName
+from exco.shortcut import from_excel, from_compiled
 
 __all__ = ['version', 'util', 'exception', 'CellLocation', 'ExcoTemplate', 'ExcoBlock',
            'AssumptionSpec', 'ValidatorSpec', 'CellExtractionSpec', 'LocatorSpec', 'ExcelProcessorSpec',
-           'ExcelProcessorFactory', 'ExcelProcessor', 'from_excel']
+           'ExcelProcessorFactory', 'ExcelProcessor', 'MultiProcessor', 'from_excel', 'from_compiled',
+           'ExactSheetName', 'CaseInsensitiveSheetName', 'GlobSheetName', 'RegexSheetName', 'AnySheetName']
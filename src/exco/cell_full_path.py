@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Union
 
 from openpyxl import Workbook
 from openpyxl.cell import Cell
@@ -9,13 +9,14 @@ from openpyxl.worksheet.worksheet import Worksheet
 if TYPE_CHECKING:
     from exco.cell_location \
         import CellLocation
+    from exco.cell_source import SheetSource, WorkbookSource
 
 
 @dataclass
 class CellFullPath:
-    workbook: Workbook
-    sheet: Worksheet
-    cell: Cell
+    workbook: Union[Workbook, 'WorkbookSource']
+    sheet: Union[Worksheet, 'SheetSource']
+    cell: Union[Cell, Any]  # openpyxl's Cell or cell like object from SheetSource
 
     @property
     def sheetname(self) -> str:
@@ -53,5 +54,4 @@ class CellFullPath:
             CellLocation
         """
         from exco.cell_location import CellLocation
-        return CellLocation(sheet_name=self.sheetname,
-                            coordinate=self.cell.coordinate)
+        return CellLocation(self.sheetname, row=self.cell.row, col=self.cell.column)
@@ -3,7 +3,6 @@ from typing import Tuple, Optional
 
 from openpyxl import Workbook
 from openpyxl.utils import coordinate_to_tuple
-from openpyxl.worksheet.worksheet import Worksheet
 
 from exco.cell_full_path import CellFullPath
 from exco.excel_extraction_scope import ExcelExtractionScope
@@ -19,14 +18,52 @@ class CellOffset:
         return hash((self.row, self.col))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, init=False, repr=False)
 class CellLocation(ExcelExtractionScope):
-    """Workbook agnostic cell location."""
+    """Workbook agnostic cell location.
+
+    Stored as sheet name plus integer row and column; the A1 coordinate string is rendered on first use.
+    Constructed either from a coordinate, CellLocation('Sheet1', 'B9'), or from row and col,
+    CellLocation('Sheet1', row=9, col=2). Equal locations hash equally however they were constructed.
+
+    The dataclass fields are sheet_name, row and col, so dataclasses.asdict gives those rather than the
+    coordinate. dataclasses.replace accepts any of them or coordinate.
+    """
+    __slots__ = ('sheet_name', 'row', 'col', '_coordinate')
     sheet_name: str
-    coordinate: str
+    row: int
+    col: int
+
+    def __init__(self, sheet_name: str, coordinate: Optional[str] = None,
+                 row: Optional[int] = None, col: Optional[int] = None):
+        if coordinate is not None:
+            row, col = coordinate_to_tuple(coordinate)
+        elif row is None or col is None:
+            raise TypeError('CellLocation requires either coordinate or row and col.')
+        object.__setattr__(self, 'sheet_name', sheet_name)
+        object.__setattr__(self, 'row', row)
+        object.__setattr__(self, 'col', col)
+        object.__setattr__(self, '_coordinate', coordinate)
 
     def __hash__(self):
-        return hash((self.sheet_name, self.coordinate))
+        return hash((self.sheet_name, self.row, self.col))
+
+    def __repr__(self) -> str:
+        return f'CellLocation(sheet_name={self.sheet_name!r}, coordinate={self.coordinate!r})'
+
+    def __reduce__(self):
+        return CellLocation, (self.sheet_name, None, self.row, self.col)
+
+    @property
+    def coordinate(self) -> str:
+        """
+
+        Returns:
+            str. Ex: B9
+        """
+        if self._coordinate is None:
+            object.__setattr__(self, '_coordinate', tuple_to_coordinate(self.row, self.col))
+        return self._coordinate
 
     def shift_row(self, offset: int) -> 'CellLocation':
         """Shift the cell by given offset in row direction
@@ -37,9 +74,7 @@ class CellLocation(ExcelExtractionScope):
         Returns:
             CellLocation
         """
-        row, col = self.row_col
-        return CellLocation(sheet_name=self.sheet_name,
-                            coordinate=tuple_to_coordinate(row + offset, col))
+        return CellLocation(self.sheet_name, row=self.row + offset, col=self.col)
 
     def shift_col(self, offset: int) -> 'CellLocation':
         """Shift the cell by given offset in column direction.
@@ -50,9 +85,7 @@ class CellLocation(ExcelExtractionScope):
         Returns:
             CellLocation
         """
-        row, col = self.row_col
-        return CellLocation(sheet_name=self.sheet_name,
-                            coordinate=tuple_to_coordinate(row, col + offset))
+        return CellLocation(self.sheet_name, row=self.row, col=self.col + offset)
 
     def new_one_at(self, sheet_name: Optional[str] = None, coordinate: Optional[str] = None) -> 'CellLocation':
         """
@@ -63,10 +96,10 @@ class CellLocation(ExcelExtractionScope):
         Returns:
             A new cell location at new sheet if specified and/or new coordinate is specified.
         """
-        return CellLocation(
-            sheet_name=self.sheet_name if sheet_name is None else sheet_name,
-            coordinate=self.coordinate if coordinate is None else coordinate
-        )
+        sheet_name = self.sheet_name if sheet_name is None else sheet_name
+        if coordinate is None:
+            return CellLocation(sheet_name, row=self.row, col=self.col)
+        return CellLocation(sheet_name, coordinate)
 
     @property
     def short_name(self) -> str:
@@ -77,26 +110,6 @@ class CellLocation(ExcelExtractionScope):
         """
         return f"{self.sheet_name}!{self.coordinate}"
 
-    @property
-    def row(self) -> int:
-        """
-
-        Returns:
-            row number.
-        """
-        r, _ = self.row_col
-        return r
-
-    @property
-    def col(self) -> int:
-        """
-
-        Returns:
-            column number
-        """
-        _, c = self.row_col
-        return c
-
     @property
     def row_col(self) -> Tuple[int, int]:
         """
@@ -104,22 +117,24 @@ class CellLocation(ExcelExtractionScope):
         Returns:
             Tuple[int, int]. row, col
         """
-        return coordinate_to_tuple(self.coordinate)
+        return self.row, self.col
 
     def get_cell_full_path(self, wb: Workbook) -> CellFullPath:
         """ Obtain cell full path
 
         Args:
-            wb (Workbook):
+            wb (Workbook): openpyxl's Workbook or WorkbookSource.
 
         Returns:
             CellFullPath
         """
-        sheet: Worksheet = wb[self.sheet_name]
+        from exco.cell_source import as_workbook_source
+        source = as_workbook_source(wb)
+        sheet = source[self.sheet_name]
         return CellFullPath(
-            workbook=wb,
+            workbook=source,
             sheet=sheet,
-            cell=sheet[self.coordinate]
+            cell=sheet.cell(self.row, self.col)
         )
 
     def offset_to(self, other: 'CellLocation') -> CellOffset:
@@ -131,12 +146,7 @@ class CellLocation(ExcelExtractionScope):
         Returns:
             Tuple[int, int]. row, col
         """
-        our_r, our_c = self.row_col
-        other_r, other_c = other.row_col
-        return CellOffset(other_r - our_r, other_c - our_c)
+        return CellOffset(other.row - self.row, other.col - self.col)
 
     def shift(self, offset: CellOffset) -> 'CellLocation':
-        return CellLocation(
-            sheet_name=self.sheet_name,
-            coordinate=tuple_to_coordinate(self.row + offset.row, self.col + offset.col)
-        )
+        return CellLocation(self.sheet_name, row=self.row + offset.row, col=self.col + offset.col)
@@ -0,0 +1,13 @@
+from exco.cell_source.cell_source import SourceCell, WindowCell, SheetSource, WorkbookSource, as_sheet_source, \
+    as_workbook_source
+from exco.cell_source.value_sheet_source import ValueSheetSource
+from exco.cell_source.openpyxl_source import OpenpyxlSheetSource, OpenpyxlWorkbookSource
+from exco.cell_source.xml_source import XmlSheetSource, XmlWorkbookSource
+from exco.cell_source.read_only_source import ReadOnlySheetSource, ReadOnlyWorkbookSource
+from exco.cell_source.snapshot_source import SheetSnapshot, SnapshotSheetSource, SnapshotWorkbookSource, with_snapshot
+from exco.cell_source.aliased_source import AliasedSheetSource, AliasedWorkbookSource
+
+__all__ = ['SourceCell', 'WindowCell', 'SheetSource', 'WorkbookSource', 'as_sheet_source', 'as_workbook_source',
+           'ValueSheetSource', 'OpenpyxlSheetSource', 'OpenpyxlWorkbookSource', 'XmlSheetSource', 'XmlWorkbookSource',
+           'ReadOnlySheetSource', 'ReadOnlyWorkbookSource', 'SheetSnapshot', 'SnapshotSheetSource',
+           'SnapshotWorkbookSource', 'with_snapshot', 'AliasedSheetSource', 'AliasedWorkbookSource']
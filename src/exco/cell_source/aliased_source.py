@@ -0,0 +1,106 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+from exco.cell_source.cell_source import SheetSource, WorkbookSource
+from exco.util import CellValue
+
+
+class AliasedSheetSource(SheetSource):
+    """View of a sheet source under another title. Everything else, caches included, is the wrapped source's,
+    so views of one sheet share its value and merged range indexes.
+    """
+
+    def __init__(self, source: SheetSource, title: str):
+        self.source = source
+        self.title = title
+
+    def __getattr__(self, item: str) -> Any:
+        if item == 'source':
+            raise AttributeError(item)
+        return getattr(self.source, item)
+
+    @property
+    def sheet_state(self) -> str:
+        return self.source.sheet_state
+
+    @property
+    def max_row(self) -> int:
+        return self.source.max_row
+
+    @property
+    def max_column(self) -> int:
+        return self.source.max_column
+
+    def value(self, row: int, column: int) -> CellValue:
+        return self.source.value(row, column)
+
+    def merged_ranges(self) -> List[CellRange]:
+        return self.source.merged_ranges()
+
+    def hyperlink(self, row: int, column: int) -> Optional[Hyperlink]:
+        return self.source.hyperlink(row, column)
+
+    def comment(self, row: int, column: int) -> Optional[str]:
+        return self.source.comment(row, column)
+
+    def comments(self) -> Dict[Tuple[int, int], str]:
+        return self.source.comments()
+
+    def merged_range_at(self, row: int, column: int) -> Optional[CellRange]:
+        return self.source.merged_range_at(row, column)
+
+    def iter_values(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                    min_col: Optional[int] = None, max_col: Optional[int] = None
+                    ) -> Iterator[Tuple[CellValue, ...]]:
+        return self.source.iter_values(min_row, max_row, min_col, max_col)
+
+    def cell(self, row: int, column: int) -> Any:
+        return self.source.cell(row, column)
+
+    def window_cell(self, row: int, column: int, value: CellValue) -> Any:
+        return self.source.window_cell(row, column, value)
+
+    def find(self, match: Callable[[CellValue], bool]) -> Optional[Any]:
+        return self.source.find(match)
+
+    def value_index(self) -> Dict[CellValue, Tuple[int, int]]:
+        return self.source.value_index()
+
+    def find_value(self, value: CellValue) -> Optional[Any]:
+        return self.source.find_value(value)
+
+
+class AliasedWorkbookSource(WorkbookSource):
+    """View of a workbook source with sheets renamed or left out, without touching the workbook.
+    Many views, of many processors, can read one loaded workbook at the same time.
+    """
+
+    def __init__(self, source: WorkbookSource, titles: Dict[str, Optional[str]]):
+        """
+        Args:
+            source (WorkbookSource):
+            titles (Dict[str, Optional[str]]): sheet title in source -> title in this view. None leaves the sheet
+                out. Sheets not in titles keep their title.
+        """
+        self.source = source
+        self._worksheets: List[SheetSource] = []
+        self._by_title: Dict[str, SheetSource] = {}
+        for sheet in source.worksheets:
+            title = titles.get(sheet.title, sheet.title)
+            if title is None:
+                continue
+            view = sheet if title == sheet.title else AliasedSheetSource(sheet, title)
+            self._worksheets.append(view)
+            self._by_title[title] = view
+
+    @property
+    def worksheets(self) -> List[SheetSource]:
+        return self._worksheets
+
+    def __getitem__(self, key: str) -> SheetSource:
+        try:
+            return self._by_title[key]
+        except KeyError:
+            raise KeyError(f"Worksheet {key} does not exist.") from None
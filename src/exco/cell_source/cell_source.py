@@ -0,0 +1,352 @@
+import abc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple, Union
+
+from openpyxl.comments import Comment
+from openpyxl.utils import coordinate_to_tuple, get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+from exco.util import CellValue
+
+
+@dataclass
+class SourceCell:
+    """Light weight stand-in for openpyxl's Cell returned by sheet sources which do not keep cell objects."""
+    row: int
+    column: int
+    value: CellValue = None
+    hyperlink: Optional[Hyperlink] = None
+    comment: Optional[Comment] = None
+
+    @property
+    def coordinate(self) -> str:
+        """
+
+        Returns:
+            str. Ex: B9
+        """
+        return get_column_letter(self.column) + str(self.row)
+
+
+class WindowCell:
+    """Cell like object for a value read in bulk (see SheetSource.iter_values).
+    row, column, coordinate and value are served from the window; any other attribute
+    (hyperlink, comment, number_format, ...) is read from sheet.cell(row, column) on demand.
+    """
+    __slots__ = ('sheet', 'row', 'column', 'value')
+
+    def __init__(self, sheet: 'SheetSource', row: int, column: int, value: CellValue):
+        self.sheet = sheet
+        self.row = row
+        self.column = column
+        self.value = value
+
+    @property
+    def coordinate(self) -> str:
+        return get_column_letter(self.column) + str(self.row)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.sheet.cell(self.row, self.column), item)
+
+    def __repr__(self) -> str:
+        return f'<WindowCell {self.sheet.title!r}.{self.coordinate}>'
+
+
+class SheetSource(abc.ABC):
+    """Read access to the cells of one worksheet. Every actor reads cells through this protocol,
+    so the backend loading the workbook (openpyxl, xml iterparse, ...) can be swapped.
+
+    Implementations provide value, merged_ranges, hyperlink, comment and the sheet dimension.
+    The openpyxl-like conveniences (cell, [] and iter_rows) are built on top of those.
+    """
+    title: str
+    sheet_state: str
+    _value_index: Optional[Dict[CellValue, Tuple[int, int]]] = None
+    _merged_index: Optional[Dict[int, List[CellRange]]] = None
+
+    @property
+    def min_row(self) -> int:
+        return 1
+
+    @property
+    def min_column(self) -> int:
+        return 1
+
+    @property
+    @abc.abstractmethod
+    def max_row(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def max_column(self) -> int:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def value(self, row: int, column: int) -> CellValue:
+        """Value of the cell at row, column. None if the cell is blank.
+
+        Args:
+            row (int):
+            column (int):
+
+        Returns:
+            CellValue
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def merged_ranges(self) -> List[CellRange]:
+        """
+        Returns:
+            List of merged cell ranges in this sheet.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def hyperlink(self, row: int, column: int) -> Optional[Hyperlink]:
+        """
+        Args:
+            row (int):
+            column (int):
+
+        Returns:
+            Hyperlink of the cell at row, column. None if the cell has no hyperlink.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def comment(self, row: int, column: int) -> Optional[str]:
+        """
+        Args:
+            row (int):
+            column (int):
+
+        Returns:
+            Comment text of the cell at row, column. None if the cell has no comment.
+        """
+        raise NotImplementedError()
+
+    def comments(self) -> Dict[Tuple[int, int], str]:
+        """All comments of this sheet. Default asks comment for every cell; sources which can read
+        the comments without visiting every cell override this.
+
+        Returns:
+            Dict of (row, column) to comment text.
+        """
+        ret = {}
+        for row in range(1, self.max_row + 1):
+            for column in range(1, self.max_column + 1):
+                comment = self.comment(row, column)
+                if comment is not None:
+                    ret[(row, column)] = comment
+        return ret
+
+    def merged_range_at(self, row: int, column: int) -> Optional[CellRange]:
+        """Find the merged range containing the cell at row, column using a per row index of merged ranges.
+        The index is built on first use and kept for the lifetime of this source.
+
+        Args:
+            row (int):
+            column (int):
+
+        Returns:
+            CellRange if the cell is a part of a merged range. None otherwise.
+        """
+        if self._merged_index is None:
+            index: Dict[int, List[CellRange]] = {}
+            for merged_range in self.merged_ranges():
+                for merged_row in range(merged_range.min_row, merged_range.max_row + 1):
+                    index.setdefault(merged_row, []).append(merged_range)
+            self._merged_index = index
+        for merged_range in self._merged_index.get(row, ()):
+            if merged_range.min_col <= column <= merged_range.max_col:
+                return merged_range
+        return None
+
+    def iter_values(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                    min_col: Optional[int] = None, max_col: Optional[int] = None
+                    ) -> Iterator[Tuple[CellValue, ...]]:
+        """Iterate over the values of a rectangular region row by row.
+
+        Args:
+            min_row (Optional[int]): Optional. Default 1.
+            max_row (Optional[int]): Optional. Default max_row.
+            min_col (Optional[int]): Optional. Default 1.
+            max_col (Optional[int]): Optional. Default max_column.
+
+        Returns:
+            Iterator of tuple of values for each row.
+        """
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        for row in range(min_row, max_row + 1):
+            yield tuple(self.value(row, col) for col in range(min_col, max_col + 1))
+
+    def cell(self, row: int, column: int) -> Any:
+        """
+        Args:
+            row (int):
+            column (int):
+
+        Returns:
+            Cell like object at row, column. It has row, column, coordinate, value, hyperlink and comment.
+        """
+        value = self.value(row, column)
+        hyperlink = self.hyperlink(row, column)
+        if value is None and hyperlink is not None:
+            value = hyperlink.target or hyperlink.location
+        comment = self.comment(row, column)
+        return SourceCell(row=row, column=column, value=value, hyperlink=hyperlink,
+                          comment=Comment(comment, None) if comment is not None else None)
+
+    def __getitem__(self, coordinate: str) -> Any:
+        row, column = coordinate_to_tuple(coordinate)
+        return self.cell(row, column)
+
+    def iter_rows(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                  min_col: Optional[int] = None, max_col: Optional[int] = None,
+                  values_only: bool = False) -> Generator[Tuple[Union[Any, CellValue], ...], None, None]:
+        """Same as openpyxl's Worksheet.iter_rows.
+
+        Args:
+            min_row (Optional[int]): Optional. Default 1.
+            max_row (Optional[int]): Optional. Default max_row.
+            min_col (Optional[int]): Optional. Default 1.
+            max_col (Optional[int]): Optional. Default max_column.
+            values_only (bool): yield values instead of cells.
+
+        Returns:
+            Generator of tuple of cells (or values) for each row.
+        """
+        if values_only:
+            yield from self.iter_values(min_row, max_row, min_col, max_col)
+            return
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        for row in range(min_row, max_row + 1):
+            yield tuple(self.cell(row, col) for col in range(min_col, max_col + 1))
+
+    def window_cell(self, row: int, column: int, value: CellValue) -> Any:
+        """Cell like object at row, column whose value was already read by iter_values.
+
+        Args:
+            row (int):
+            column (int):
+            value (CellValue): value of the cell read by iter_values.
+
+        Returns:
+            WindowCell. The cell itself for a blank cell with a hyperlink, since its value comes from the link.
+        """
+        if value is None and self.hyperlink(row, column) is not None:
+            return self.cell(row, column)
+        return WindowCell(self, row, column, value)
+
+    def find(self, match: Callable[[CellValue], bool]) -> Optional[Any]:
+        """Find the first cell, in row major order, whose value matches.
+
+        Args:
+            match (Callable[[CellValue], bool]): predicate on cell value. Blank cells are passed as None.
+
+        Returns:
+            Cell like object of the first match. None if nothing matches.
+        """
+        for row, values in enumerate(self.iter_values(), start=1):
+            for column, value in enumerate(values, start=1):
+                if match(value):
+                    return self.cell(row, column)
+        return None
+
+    def value_index(self) -> Dict[CellValue, Tuple[int, int]]:
+        """Inverted index from cell value to the (row, column) of its first cell in row major order.
+        It is built by a single pass over the sheet on first use and kept for the lifetime of this source.
+
+        Returns:
+            Dict of non blank value to (row, column).
+        """
+        if self._value_index is None:
+            index = {}
+            for row, values in enumerate(self.iter_values(), start=1):
+                for column, value in enumerate(values, start=1):
+                    if value is not None and value not in index:
+                        index[value] = (row, column)
+            self._value_index = index
+        return self._value_index
+
+    def find_value(self, value: CellValue) -> Optional[Any]:
+        """Find the first cell, in row major order, whose value equals value. Same as find(lambda v: v == value)
+        but uses value_index.
+
+        Args:
+            value (CellValue): value to find.
+
+        Returns:
+            Cell like object of the first match. None if nothing matches.
+        """
+        if value is None:
+            return self.find(lambda v: v is None)
+        try:
+            location = self.value_index().get(value)
+        except TypeError:  # unhashable value can not be in the index
+            return self.find(lambda v: v == value)
+        return None if location is None else self.cell(*location)
+
+
+class WorkbookSource(abc.ABC):
+    """Read access to the worksheets of a workbook. See SheetSource."""
+
+    @property
+    @abc.abstractmethod
+    def worksheets(self) -> List[SheetSource]:
+        raise NotImplementedError()
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return [ws.title for ws in self.worksheets]
+
+    def __getitem__(self, key: str) -> SheetSource:
+        for sheet in self.worksheets:
+            if sheet.title == key:
+                return sheet
+        raise KeyError(f"Worksheet {key} does not exist.")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.sheetnames
+
+    def close(self):
+        """Release the resources held by the source. Default does nothing."""
+
+
+def as_sheet_source(sheet: Any) -> SheetSource:
+    """Adapt sheet to SheetSource. openpyxl's Worksheet is wrapped by OpenpyxlSheetSource.
+
+    Args:
+        sheet (Any): SheetSource or openpyxl's Worksheet.
+
+    Returns:
+        SheetSource
+    """
+    if isinstance(sheet, SheetSource):
+        return sheet
+    from exco.cell_source.openpyxl_source import OpenpyxlSheetSource
+    return OpenpyxlSheetSource(sheet)
+
+
+def as_workbook_source(workbook: Any) -> WorkbookSource:
+    """Adapt workbook to WorkbookSource. openpyxl's Workbook is wrapped by OpenpyxlWorkbookSource.
+
+    Args:
+        workbook (Any): WorkbookSource or openpyxl's Workbook.
+
+    Returns:
+        WorkbookSource
+    """
+    if isinstance(workbook, WorkbookSource):
+        return workbook
+    from exco.cell_source.openpyxl_source import OpenpyxlWorkbookSource
+    return OpenpyxlWorkbookSource(workbook)
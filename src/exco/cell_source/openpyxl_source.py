@@ -0,0 +1,121 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.worksheet.worksheet import Worksheet
+
+from exco.cell_source.cell_source import SheetSource, SourceCell, WorkbookSource
+from exco.util import CellValue
+
+
+class OpenpyxlSheetSource(SheetSource):
+    """Sheet source over a fully loaded openpyxl worksheet.
+
+    cell, [] and iter_rows return openpyxl's own cells so custom actors relying on cell
+    attributes (number_format, font, ...) keep working. Cells the worksheet does not hold are returned as
+    blank SourceCell instead of being created, so reading never modifies the workbook.
+    Other attributes are forwarded to the worksheet.
+    """
+
+    def __init__(self, worksheet: Worksheet):
+        self.worksheet = worksheet
+
+    def __getattr__(self, item: str) -> Any:
+        if item == 'worksheet':
+            raise AttributeError(item)
+        return getattr(self.worksheet, item)
+
+    @property
+    def title(self) -> str:
+        return self.worksheet.title
+
+    @title.setter
+    def title(self, value: str):
+        self.worksheet.title = value
+
+    @property
+    def sheet_state(self) -> str:
+        return self.worksheet.sheet_state
+
+    @property
+    def max_row(self) -> int:
+        return self.worksheet.max_row
+
+    @property
+    def max_column(self) -> int:
+        return self.worksheet.max_column
+
+    def _existing_cell(self, row: int, column: int) -> Optional[Cell]:
+        # lookup without creating the cell, unlike Worksheet.cell
+        return self.worksheet._cells.get((row, column))
+
+    def value(self, row: int, column: int) -> CellValue:
+        cell = self._existing_cell(row, column)
+        return None if cell is None else cell.value
+
+    def iter_values(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                    min_col: Optional[int] = None, max_col: Optional[int] = None
+                    ) -> Iterator[Tuple[CellValue, ...]]:
+        # unlike Worksheet.iter_rows, reading outside the existing cells does not create cells
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.worksheet.max_row
+        max_col = max_col or self.worksheet.max_column
+        get = self.worksheet._cells.get
+        columns = range(min_col, max_col + 1)
+        for row in range(min_row, max_row + 1):
+            cells = [get((row, col)) for col in columns]
+            yield tuple(None if cell is None else cell.value for cell in cells)
+
+    def merged_ranges(self) -> List[CellRange]:
+        return list(self.worksheet.merged_cells.ranges)
+
+    def hyperlink(self, row: int, column: int) -> Optional[Hyperlink]:
+        cell = self._existing_cell(row, column)
+        return None if cell is None else cell.hyperlink
+
+    def comment(self, row: int, column: int) -> Optional[str]:
+        cell = self._existing_cell(row, column)
+        return None if cell is None or cell.comment is None else cell.comment.text
+
+    def comments(self) -> Dict[Tuple[int, int], str]:
+        # only the cells held by the worksheet, blank cells in the dimension are not created
+        return {key: cell.comment.text for key, cell in self.worksheet._cells.items() if cell.comment is not None}
+
+    def cell(self, row: int, column: int) -> Union[Cell, SourceCell]:
+        # Worksheet.cell would create, and keep, a blank cell in the caller's workbook
+        cell = self._existing_cell(row, column)
+        return SourceCell(row=row, column=column) if cell is None else cell
+
+
+class OpenpyxlWorkbookSource(WorkbookSource):
+    """Workbook source over an openpyxl workbook. Other attributes are forwarded to the workbook."""
+
+    def __init__(self, workbook: Workbook):
+        self.workbook = workbook
+        self._sources: Dict[int, OpenpyxlSheetSource] = {}
+
+    def __getattr__(self, item: str) -> Any:
+        if item == 'workbook':
+            raise AttributeError(item)
+        return getattr(self.workbook, item)
+
+    def _source(self, worksheet: Worksheet) -> OpenpyxlSheetSource:
+        # keep one source per worksheet so per sheet caches survive between lookups
+        key = id(worksheet)
+        if key not in self._sources:
+            self._sources[key] = OpenpyxlSheetSource(worksheet)
+        return self._sources[key]
+
+    @property
+    def worksheets(self) -> List[SheetSource]:
+        return [self._source(ws) for ws in self.workbook.worksheets]
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return self.workbook.sheetnames
+
+    def close(self):
+        self.workbook.close()
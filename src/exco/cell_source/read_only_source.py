@@ -0,0 +1,115 @@
+import warnings
+from typing import Dict, List, Tuple
+
+from openpyxl import Workbook
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+from exco.cell_source.cell_source import SheetSource, WorkbookSource
+from exco.cell_source.value_sheet_source import ValueSheetSource
+from exco.cell_source.xml_source import read_comments
+
+try:  # private openpyxl api, see _has_parser_api
+    from openpyxl.worksheet._reader import WorkSheetParser
+except ImportError:  # pragma: no cover
+    WorkSheetParser = None
+
+
+def _has_parser_api(worksheet: ReadOnlyWorksheet) -> bool:
+    """Whether this openpyxl exposes the private attributes used to parse the sheet xml directly.
+    They are feature checked since openpyxl is not pinned. See ReadOnlySheetSource.
+    """
+    workbook = worksheet.parent
+    return WorkSheetParser is not None \
+        and all(hasattr(worksheet, name) for name in ('_get_source', '_shared_strings', '_worksheet_path')) \
+        and all(hasattr(workbook, name) for name in ('_archive', '_date_formats', '_timedelta_formats'))
+
+
+class ReadOnlySheetSource(ValueSheetSource):
+    """Random access sheet source over an openpyxl read-only worksheet.
+
+    openpyxl's read-only worksheet re-parses the sheet xml on every cell access.
+    This source parses the xml once, on first access, and keeps the values of the whole sheet
+    in memory as tuples (see ValueSheetSource). It does not stream: peak memory grows with the
+    sheet, but it is much lower than a fully loaded openpyxl worksheet.
+
+    The xml is parsed with openpyxl's WorkSheetParser, which also gives merged ranges and hyperlinks.
+    If this openpyxl lacks the private attributes it needs, the public iter_rows is used instead,
+    with a warning: values only, without merged ranges, hyperlinks and comments.
+    """
+
+    def __init__(self, worksheet: ReadOnlyWorksheet):
+        super().__init__(title=worksheet.title, sheet_state=worksheet.sheet_state)
+        self.worksheet = worksheet
+
+    def _load(self):
+        if not _has_parser_api(self.worksheet):
+            self._load_values()
+            return
+        ws = self.worksheet
+        wb = ws.parent
+        with ws._get_source() as src:
+            parser = WorkSheetParser(src, ws._shared_strings,
+                                     data_only=wb.data_only,
+                                     epoch=wb.epoch,
+                                     date_formats=wb._date_formats,
+                                     timedelta_formats=wb._timedelta_formats)
+            for idx, row in parser.parse():
+                if not row:
+                    continue
+                values = [None] * row[-1]['column']
+                for cell in row:
+                    values[cell['column'] - 1] = cell['value']
+                self.add_row(idx, tuple(values))
+        merged_cells = getattr(parser, 'merged_cells', None)
+        if merged_cells is not None:
+            for mc in merged_cells.mergeCell:
+                self.add_merged_range(mc.ref)
+        if getattr(parser, 'hyperlinks', None) is not None:
+            self._load_hyperlinks(parser)
+
+    def _load_values(self):
+        warnings.warn(f'This openpyxl version does not expose the worksheet parser; sheet {self.title!r} '
+                      'is read with iter_rows, without merged ranges, hyperlinks and comments.')
+        for idx, row in enumerate(self.worksheet.iter_rows(min_row=1, min_col=1, values_only=True), start=1):
+            end = len(row)
+            while end and row[end - 1] is None:
+                end -= 1
+            if end:
+                self.add_row(idx, tuple(row[:end]))
+
+    def _load_hyperlinks(self, parser: 'WorkSheetParser'):
+        archive = self.worksheet.parent._archive
+        rels_path = get_rels_path(self.worksheet._worksheet_path)
+        rels = get_dependents(archive, rels_path) if rels_path in archive.namelist() else None
+        for link in parser.hyperlinks.hyperlink:
+            if link.id and rels is not None:
+                link.target = rels.get(link.id).Target
+            self.add_hyperlink(link)
+
+    def _load_comments(self) -> Dict[Tuple[int, int], str]:
+        if not _has_parser_api(self.worksheet):
+            return {}
+        return read_comments(self.worksheet.parent._archive, self.worksheet._worksheet_path)
+
+
+class ReadOnlyWorkbookSource(WorkbookSource):
+    """Workbook loaded with openpyxl's read_only mode whose worksheets support random access.
+    See ReadOnlySheetSource. Worksheets skipped while loading are kept as empty sheets.
+    """
+
+    def __init__(self, workbook: Workbook):
+        self.workbook = workbook
+        self._worksheets: List[SheetSource] = [
+            ReadOnlySheetSource(ws) if isinstance(ws, ReadOnlyWorksheet)
+            else ValueSheetSource(title=ws.title, sheet_state=ws.sheet_state)
+            for ws in workbook.worksheets
+        ]
+
+    @property
+    def worksheets(self) -> List[SheetSource]:
+        return self._worksheets
+
+    def close(self):
+        """Close the underlying xlsx archive."""
+        self.workbook.close()
@@ -0,0 +1,199 @@
+from numbers import Number
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+from exco.cell_source.cell_source import SheetSource, WorkbookSource, as_workbook_source
+from exco.util import CellValue
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class SheetSnapshot:
+    """Dense 2-D numpy object array of the values of a sheet from A1 to (max_row, max_column).
+    values[row - 1, column - 1] is the value of the cell at row, column. The null mask and the
+    numeric view are built on first use and let table end conditions skip the object array.
+    """
+
+    def __init__(self, values: 'np.ndarray'):
+        self.values = values
+        self._null_mask: Optional['np.ndarray'] = None
+        self._numeric_view: Optional[Tuple['np.ndarray', 'np.ndarray']] = None
+
+    @classmethod
+    def from_sheet(cls, sheet: SheetSource) -> 'SheetSnapshot':
+        """
+        Args:
+            sheet (SheetSource):
+
+        Returns:
+            SheetSnapshot of every value in sheet.
+        """
+        if np is None:
+            raise ImportError('numpy is required for workbook snapshot. Install it with pip install exco[numpy].')
+        values = np.full((sheet.max_row, sheet.max_column), None, dtype=object)
+        for i, row in enumerate(sheet.iter_values(max_row=sheet.max_row, max_col=sheet.max_column)):
+            values[i, :len(row)] = row
+        return cls(values)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """
+        Returns:
+            Tuple[int, int]. max_row, max_column
+        """
+        return self.values.shape
+
+    @property
+    def null_mask(self) -> 'np.ndarray':
+        """
+        Returns:
+            Boolean array. True where the cell is blank.
+        """
+        if self._null_mask is None:
+            self._null_mask = np.equal(self.values, None)
+        return self._null_mask
+
+    @property
+    def numeric_view(self) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Typed view of the numeric cells. Booleans are not numbers here.
+
+        Returns:
+            Tuple of float64 array (nan where not numeric) and boolean mask. True where the cell is numeric.
+        """
+        if self._numeric_view is None:
+            is_number = np.frompyfunc(lambda v: isinstance(v, Number) and not isinstance(v, bool), 1, 1)
+            mask = is_number(self.values).astype(bool)
+            numbers = np.full(self.shape, np.nan, dtype=np.float64)
+            numbers[mask] = self.values[mask].astype(np.float64)
+            self._numeric_view = numbers, mask
+        return self._numeric_view
+
+    def window(self, rows: 'np.ndarray', columns: 'np.ndarray'
+               ) -> Tuple['np.ndarray', 'np.ndarray', Tuple['np.ndarray', 'np.ndarray']]:
+        """Gather the cells at (rows[i, j], columns[i, j]) from values, null_mask and numeric_view in one go.
+        Cells outside the sheet are blank.
+
+        Args:
+            rows (np.ndarray): int array of row numbers.
+            columns (np.ndarray): int array of column numbers, same shape as rows.
+
+        Returns:
+            Tuple of values, null mask and numeric view (float64 array and numeric mask) of those cells.
+        """
+        n_row, n_col = self.shape
+        inside = (rows >= 1) & (rows <= n_row) & (columns >= 1) & (columns <= n_col)
+        if not inside.any():
+            return np.full(rows.shape, None, dtype=object), np.ones(rows.shape, dtype=bool), \
+                (np.full(rows.shape, np.nan), np.zeros(rows.shape, dtype=bool))
+        index = np.where(inside, rows - 1, 0), np.where(inside, columns - 1, 0)
+        numbers, is_number = self.numeric_view
+        return np.where(inside, self.values[index], None), np.where(inside, self.null_mask[index], True), \
+            (np.where(inside, numbers[index], np.nan), np.where(inside, is_number[index], False))
+
+
+class SnapshotSheetSource(SheetSource):
+    """Sheet source reading values from a SheetSnapshot of another sheet source.
+    The snapshot is built on first access. Merged ranges, hyperlinks and comments come from the wrapped source.
+    Cells are returned as SourceCell.
+    """
+
+    def __init__(self, source: SheetSource):
+        self.source = source
+        self._snapshot: Optional[SheetSnapshot] = None
+
+    @property
+    def title(self) -> str:
+        return self.source.title
+
+    @title.setter
+    def title(self, value: str):
+        self.source.title = value
+
+    @property
+    def sheet_state(self) -> str:
+        return self.source.sheet_state
+
+    @property
+    def snapshot(self) -> SheetSnapshot:
+        if self._snapshot is None:
+            self._snapshot = SheetSnapshot.from_sheet(self.source)
+        return self._snapshot
+
+    @property
+    def max_row(self) -> int:
+        return self.snapshot.shape[0]
+
+    @property
+    def max_column(self) -> int:
+        return self.snapshot.shape[1]
+
+    def value(self, row: int, column: int) -> CellValue:
+        values = self.snapshot.values
+        n_row, n_col = values.shape
+        if 0 < row <= n_row and 0 < column <= n_col:
+            return values[row - 1, column - 1]
+        return None
+
+    def iter_values(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                    min_col: Optional[int] = None, max_col: Optional[int] = None
+                    ) -> Iterator[Tuple[CellValue, ...]]:
+        values = self.snapshot.values
+        n_row, n_col = values.shape
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or n_row
+        max_col = max_col or n_col
+        width = max_col - min_col + 1
+        for region in values[min_row - 1:max_row, min_col - 1:max_col]:
+            row = tuple(region)
+            yield row + (None,) * (width - len(row)) if len(row) < width else row
+        blank = (None,) * width
+        for _ in range(max(min_row, n_row + 1), max_row + 1):
+            yield blank
+
+    def merged_ranges(self) -> List[CellRange]:
+        return self.source.merged_ranges()
+
+    def hyperlink(self, row: int, column: int) -> Optional[Hyperlink]:
+        return self.source.hyperlink(row, column)
+
+    def comment(self, row: int, column: int) -> Optional[str]:
+        return self.source.comment(row, column)
+
+    def comments(self) -> Dict[Tuple[int, int], str]:
+        return self.source.comments()
+
+
+class SnapshotWorkbookSource(WorkbookSource):
+    """Workbook source whose sheets are read from snapshots. See SnapshotSheetSource.
+    Snapshots are built once, for the sheets actually used, and shared by every actor.
+    """
+
+    def __init__(self, source: WorkbookSource):
+        self.source = source
+        self._worksheets: List[SheetSource] = [SnapshotSheetSource(ws) for ws in source.worksheets]
+
+    @property
+    def worksheets(self) -> List[SheetSource]:
+        return self._worksheets
+
+    def close(self):
+        self.source.close()
+
+
+def with_snapshot(workbook: Any) -> SnapshotWorkbookSource:
+    """
+    Args:
+        workbook (Any): WorkbookSource or openpyxl's Workbook.
+
+    Returns:
+        SnapshotWorkbookSource over workbook. workbook itself if it is already one.
+    """
+    if isinstance(workbook, SnapshotWorkbookSource):
+        return workbook
+    return SnapshotWorkbookSource(as_workbook_source(workbook))
@@ -0,0 +1,134 @@
+import threading
+from copy import copy
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+from exco.cell_source.cell_source import SheetSource
+from exco.util import CellValue
+
+
+class ValueSheetSource(SheetSource):
+    """Sheet source keeping only cell values as plain tuples (one per non empty row),
+    plus merged ranges, hyperlinks and comments. This is an order of magnitude smaller than
+    a fully loaded openpyxl worksheet.
+
+    Subclasses fill the storage lazily in _load, on first access. A bare ValueSheetSource is an
+    empty sheet, which is used as a placeholder for sheets that are skipped while loading.
+    Loading is done once under a lock, so one source can be shared by threads.
+    """
+
+    def __init__(self, title: str, sheet_state: str = 'visible'):
+        self.title = title
+        self.sheet_state = sheet_state
+        self._rows: Optional[Dict[int, Tuple[CellValue, ...]]] = None
+        self._loading_rows: Dict[int, Tuple[CellValue, ...]] = {}
+        self._load_lock = threading.Lock()
+        self._merged_ranges: List[CellRange] = []
+        self._hyperlinks: Dict[Tuple[int, int], Hyperlink] = {}
+        self._comments: Optional[Dict[Tuple[int, int], str]] = None
+        self._max_row = 0
+        self._max_column = 0
+
+    def _load(self):
+        """Fill the storage with add_row, add_merged_range and add_hyperlink. Default loads nothing."""
+
+    def _load_comments(self) -> Dict[Tuple[int, int], str]:
+        """Comments are only needed by templates so they are loaded separately on first use. Default none.
+
+        Returns:
+            Dict of (row, column) to comment text.
+        """
+        return {}
+
+    def _loaded_rows(self) -> Dict[int, Tuple[CellValue, ...]]:
+        rows = self._rows
+        if rows is None:
+            with self._load_lock:
+                rows = self._rows
+                if rows is None:
+                    # rows are published only once fully loaded. A failed load leaves nothing behind and is retried
+                    self._loading_rows, self._merged_ranges, self._hyperlinks = {}, [], {}
+                    self._max_row = self._max_column = 0
+                    self._load()
+                    rows, self._loading_rows = self._loading_rows, {}
+                    self._rows = rows
+        return rows
+
+    def add_row(self, row: int, values: Tuple[CellValue, ...]):
+        """
+        Args:
+            row (int): row number.
+            values (Tuple[CellValue, ...]): values from column 1.
+        """
+        self._loading_rows[row] = values
+        if row > self._max_row:
+            self._max_row = row
+        if len(values) > self._max_column:
+            self._max_column = len(values)
+
+    def add_merged_range(self, ref: str):
+        """
+        Args:
+            ref (str): Ex: A1:B3
+        """
+        self._merged_ranges.append(CellRange(ref))
+
+    def add_hyperlink(self, hyperlink: Hyperlink):
+        """
+        Args:
+            hyperlink (Hyperlink): hyperlink with resolved target. It applies to every cell in hyperlink.ref.
+        """
+        for row, col in CellRange(hyperlink.ref).cells:
+            self._hyperlinks[(row, col)] = copy(hyperlink)
+
+    @property
+    def max_row(self) -> int:
+        self._loaded_rows()
+        return self._max_row
+
+    @property
+    def max_column(self) -> int:
+        self._loaded_rows()
+        return self._max_column
+
+    def value(self, row: int, column: int) -> CellValue:
+        values = self._loaded_rows().get(row)
+        if values is None or column > len(values):
+            return None
+        return values[column - 1]
+
+    def iter_values(self, min_row: Optional[int] = None, max_row: Optional[int] = None,
+                    min_col: Optional[int] = None, max_col: Optional[int] = None
+                    ) -> Iterator[Tuple[CellValue, ...]]:
+        rows = self._loaded_rows()
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self._max_row
+        max_col = max_col or self._max_column
+        width = max_col - min_col + 1
+        blank = (None,) * width
+        for row in range(min_row, max_row + 1):
+            values = rows.get(row)
+            if values is None:
+                yield blank
+                continue
+            region = values[min_col - 1:max_col]
+            yield region + (None,) * (width - len(region)) if len(region) < width else region
+
+    def merged_ranges(self) -> List[CellRange]:
+        self._loaded_rows()
+        return self._merged_ranges
+
+    def hyperlink(self, row: int, column: int) -> Optional[Hyperlink]:
+        self._loaded_rows()
+        return self._hyperlinks.get((row, column))
+
+    def comment(self, row: int, column: int) -> Optional[str]:
+        return self.comments().get((row, column))
+
+    def comments(self) -> Dict[Tuple[int, int], str]:
+        if self._comments is None:
+            self._comments = self._load_comments()
+        return self._comments
@@ -0,0 +1,384 @@
+import posixpath
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from zipfile import ZipFile
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils import coordinate_to_tuple
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH, from_excel, from_ISO8601
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.xml.constants import PKG_REL_NS, REL_NS, SHEET_MAIN_NS
+
+from exco.cell_source.cell_source import SheetSource, WorkbookSource
+from exco.cell_source.value_sheet_source import ValueSheetSource
+
+try:
+    from lxml.etree import iterparse
+    _HAS_PARENT = True  # lxml elements know their parent, see _iterparse_children
+except ImportError:  # pragma: no cover
+    from xml.etree.ElementTree import iterparse
+    _HAS_PARENT = False
+
+_ROW_TAG = f'{{{SHEET_MAIN_NS}}}row'
+_CELL_TAG = f'{{{SHEET_MAIN_NS}}}c'
+_VALUE_TAG = f'{{{SHEET_MAIN_NS}}}v'
+_INLINE_STRING_TAG = f'{{{SHEET_MAIN_NS}}}is'
+_TEXT_TAG = f'{{{SHEET_MAIN_NS}}}t'
+_RICH_TEXT_RUN_TAG = f'{{{SHEET_MAIN_NS}}}r'
+_STRING_ITEM_TAG = f'{{{SHEET_MAIN_NS}}}si'
+_MERGE_CELL_TAG = f'{{{SHEET_MAIN_NS}}}mergeCell'
+_HYPERLINK_TAG = f'{{{SHEET_MAIN_NS}}}hyperlink'
+_COMMENT_TAG = f'{{{SHEET_MAIN_NS}}}comment'
+_COMMENT_TEXT_TAG = f'{{{SHEET_MAIN_NS}}}text'
+_SHEET_TAG = f'{{{SHEET_MAIN_NS}}}sheet'
+_WORKBOOK_PR_TAG = f'{{{SHEET_MAIN_NS}}}workbookPr'
+_NUM_FMT_TAG = f'{{{SHEET_MAIN_NS}}}numFmt'
+_CELL_XFS_TAG = f'{{{SHEET_MAIN_NS}}}cellXfs'
+_SKIPPED_STYLE_TAGS = {f'{{{SHEET_MAIN_NS}}}{tag}'
+                       for tag in ['fonts', 'fills', 'borders', 'cellStyleXfs', 'cellStyles', 'dxfs', 'colors']}
+_SHEET_DATA_TAG = f'{{{SHEET_MAIN_NS}}}sheetData'
+_MERGE_CELLS_TAG = f'{{{SHEET_MAIN_NS}}}mergeCells'
+_HYPERLINKS_TAG = f'{{{SHEET_MAIN_NS}}}hyperlinks'
+_SST_TAG = f'{{{SHEET_MAIN_NS}}}sst'
+_COMMENT_LIST_TAG = f'{{{SHEET_MAIN_NS}}}commentList'
+_RELATIONSHIP_TAG = f'{{{PKG_REL_NS}}}Relationship'
+_REL_ID_ATTR = f'{{{REL_NS}}}id'
+
+
+@dataclass(frozen=True)
+class Relationship:
+    type: str
+    target: str  # part name inside the archive, or url for external targets
+
+
+def _iterparse_children(src: IO[bytes], parent_tags: Set[str], child_tags: Set[str]) -> Iterator[Any]:
+    """iterparse yielding each element with child_tags once parsed. When the caller is done with it, the element is
+    cleared and removed from its parent (one of parent_tags), so memory does not grow with the document.
+
+    Args:
+        src (IO[bytes]): xml part.
+        parent_tags (Set[str]): tags of the parents of the elements read.
+        child_tags (Set[str]): tags of the elements read.
+
+    Returns:
+        Iterator of elements.
+    """
+    if _HAS_PARENT:
+        for _, el in iterparse(src, tag=list(child_tags)):
+            yield el
+            el.clear()
+            parent = el.getparent()
+            if parent is not None:
+                parent.remove(el)
+        return
+    # xml.etree elements do not know their parent, so start events are used instead of end events: they give the
+    # parent, and an element is complete once the next one starts (children never nest here)
+    parent, pending, pending_parent = None, None, None
+    for _, el in iterparse(src, events=('start',)):
+        tag = el.tag
+        if tag in parent_tags:
+            parent = el
+        elif tag in child_tags:
+            if pending is not None:
+                yield pending
+                pending.clear()
+                if pending_parent is not None:
+                    pending_parent.remove(pending)
+            pending, pending_parent = el, parent
+    if pending is not None:
+        yield pending
+        pending.clear()
+        if pending_parent is not None:
+            pending_parent.remove(pending)
+
+
+def _has_part(archive: ZipFile, part: str) -> bool:
+    try:
+        archive.getinfo(part)
+        return True
+    except KeyError:
+        return False
+
+
+def read_relationships(archive: ZipFile, part: str) -> Dict[str, Relationship]:
+    """Read relationships of a part. Internal targets are resolved to part names.
+
+    Args:
+        archive (ZipFile): xlsx archive.
+        part (str): part name. Ex: xl/worksheets/sheet1.xml. Empty string for the package itself.
+
+    Returns:
+        Dict of relationship id to Relationship. Empty if the part has no relationships.
+    """
+    folder, name = posixpath.split(part)
+    rels_part = posixpath.join(folder, '_rels', name + '.rels')
+    if not _has_part(archive, rels_part):
+        return {}
+    ret = {}
+    with archive.open(rels_part) as src:
+        for _, el in iterparse(src):
+            if el.tag != _RELATIONSHIP_TAG:
+                continue
+            target = el.get('Target')
+            if el.get('TargetMode') != 'External':
+                target = target[1:] if target.startswith('/') else posixpath.normpath(posixpath.join(folder, target))
+            ret[el.get('Id')] = Relationship(type=el.get('Type'), target=target)
+    return ret
+
+
+def _text_content(el) -> str:
+    # same as openpyxl's Text.content: plain text followed by rich text runs. Phonetic runs are ignored.
+    parts = []
+    for child in el:
+        if child.tag == _TEXT_TAG:
+            parts.append(child.text or '')
+        elif child.tag == _RICH_TEXT_RUN_TAG:
+            t = child.find(_TEXT_TAG)
+            if t is not None:
+                parts.append(t.text or '')
+    return ''.join(parts)
+
+
+def read_shared_strings(src: IO[bytes]) -> List[str]:
+    """
+    Args:
+        src (IO[bytes]): sharedStrings.xml
+
+    Returns:
+        List of shared strings.
+    """
+    return [_text_content(el).replace('x005F_', '')
+            for el in _iterparse_children(src, {_SST_TAG}, {_STRING_ITEM_TAG})]
+
+
+def read_date_styles(src: IO[bytes]) -> Tuple[Set[int], Set[int]]:
+    """Read only the number formats of the cell styles. Fonts, fills, borders etc. are skipped.
+
+    Args:
+        src (IO[bytes]): styles.xml
+
+    Returns:
+        Tuple of set of date style ids and set of timedelta style ids.
+    """
+    custom_formats: Dict[int, str] = {}
+    xf_format_ids: List[int] = []
+    for _, el in iterparse(src):
+        tag = el.tag
+        if tag == _NUM_FMT_TAG:
+            custom_formats[int(el.get('numFmtId'))] = el.get('formatCode')
+        elif tag == _CELL_XFS_TAG:
+            xf_format_ids = [int(xf.get('numFmtId', 0)) for xf in el]
+            el.clear()
+        elif tag in _SKIPPED_STYLE_TAGS:
+            el.clear()
+    date_styles, timedelta_styles = set(), set()
+    for style_id, format_id in enumerate(xf_format_ids):
+        fmt = custom_formats[format_id] if format_id in custom_formats else BUILTIN_FORMATS.get(format_id)
+        if fmt is None:
+            continue
+        if is_date_format(fmt):
+            date_styles.add(style_id)
+        if is_timedelta_format(fmt):
+            timedelta_styles.add(style_id)
+    return date_styles, timedelta_styles
+
+
+def read_comments(archive: ZipFile, sheet_part: str) -> Dict[Tuple[int, int], str]:
+    """
+    Args:
+        archive (ZipFile): xlsx archive.
+        sheet_part (str): worksheet part name. Ex: xl/worksheets/sheet1.xml
+
+    Returns:
+        Dict of (row, column) to comment text.
+    """
+    ret = {}
+    for rel in read_relationships(archive, sheet_part).values():
+        if not rel.type.endswith('/comments') or not _has_part(archive, rel.target):
+            continue
+        with archive.open(rel.target) as src:
+            for el in _iterparse_children(src, {_COMMENT_LIST_TAG}, {_COMMENT_TAG}):
+                text = el.find(_COMMENT_TEXT_TAG)
+                ret[coordinate_to_tuple(el.get('ref'))] = _text_content(text) if text is not None else ''
+    return ret
+
+
+def _column_index(ref: str) -> int:
+    # AB12 -> 28. Faster than openpyxl's regex based coordinate_to_tuple.
+    col = 0
+    for ch in ref:
+        if ch <= '9':
+            break
+        col = col * 26 + ord(ch) - 64
+    return col
+
+
+def _cast_number(value: str) -> Union[int, float]:
+    if '.' in value or 'E' in value or 'e' in value:
+        return float(value)
+    return int(value)
+
+
+class XmlSheetSource(ValueSheetSource):
+    """Sheet source reading the worksheet xml straight from the archive with iterparse.
+    Only cell values (cached values for formulas), merged cells and hyperlinks are read, on first access.
+    """
+
+    def __init__(self, workbook: 'XmlWorkbookSource', title: str, sheet_state: str, part: str):
+        super().__init__(title=title, sheet_state=sheet_state)
+        self.workbook = workbook
+        self.part = part
+
+    def _load(self):
+        shared_strings = self.workbook.shared_strings
+        date_styles, timedelta_styles = self.workbook.date_styles
+        epoch = self.workbook.epoch
+        hyperlinks = []
+        row = 0
+        with self.workbook.archive.open(self.part) as src:
+            for el in _iterparse_children(src, {_SHEET_DATA_TAG, _MERGE_CELLS_TAG, _HYPERLINKS_TAG},
+                                          {_ROW_TAG, _MERGE_CELL_TAG, _HYPERLINK_TAG}):
+                tag = el.tag
+                if tag == _ROW_TAG:
+                    r = el.get('r')
+                    row = int(r) if r is not None else row + 1
+                    values = []
+                    column = 0
+                    for c in el:
+                        if c.tag != _CELL_TAG:
+                            continue
+                        ref = c.get('r')
+                        column = _column_index(ref) if ref is not None else column + 1
+                        data_type = c.get('t', 'n')
+                        if data_type == 'inlineStr':
+                            inline = c.find(_INLINE_STRING_TAG)
+                            value = _text_content(inline) if inline is not None else None
+                        else:
+                            value = c.findtext(_VALUE_TAG) or None
+                            if value is None:
+                                pass
+                            elif data_type == 'n':
+                                value = _cast_number(value)
+                                style_id = int(c.get('s', 0))
+                                if style_id in date_styles:
+                                    try:
+                                        value = from_excel(value, epoch, timedelta=style_id in timedelta_styles)
+                                    except (OverflowError, ValueError):
+                                        value = '#VALUE!'
+                            elif data_type == 's':
+                                value = shared_strings[int(value)]
+                            elif data_type == 'b':
+                                value = bool(int(value))
+                            elif data_type == 'd':
+                                value = from_ISO8601(value)
+                        if column > len(values):
+                            values.extend([None] * (column - len(values)))
+                        values[column - 1] = value
+                    if values:
+                        self.add_row(row, tuple(values))
+                elif tag == _MERGE_CELL_TAG:
+                    self.add_merged_range(el.get('ref'))
+                else:
+                    hyperlinks.append(dict(el.attrib))  # the element is cleared once read
+        self._load_hyperlinks(hyperlinks)
+
+    def _load_hyperlinks(self, attributes: List[Dict[str, str]]):
+        if not attributes:
+            return
+        rels = read_relationships(self.workbook.archive, self.part)
+        for attrib in attributes:
+            rel_id = attrib.get(_REL_ID_ATTR)
+            rel = rels.get(rel_id) if rel_id else None
+            self.add_hyperlink(Hyperlink(ref=attrib.get('ref'),
+                                         location=attrib.get('location'),
+                                         tooltip=attrib.get('tooltip'),
+                                         display=attrib.get('display'),
+                                         id=rel_id,
+                                         target=rel.target if rel is not None else None))
+
+    def _load_comments(self) -> Dict[Tuple[int, int], str]:
+        return read_comments(self.workbook.archive, self.part)
+
+
+class XmlWorkbookSource(WorkbookSource):
+    """Workbook source reading xlsx with iterparse instead of openpyxl.
+
+    Only workbook.xml, the relationships, sharedStrings.xml, the number formats in styles.xml
+    and the worksheets actually accessed are parsed. Drawings, themes and the rest of the styles are never read.
+    Worksheets are parsed lazily on first access into compact value rows. See ValueSheetSource.
+    The source keeps the archive open; close it after use.
+    """
+
+    def __init__(self, fname: Union[str, IO[bytes]], sheet_filter: Optional[Callable[[str], bool]] = None):
+        self.archive = ZipFile(fname)
+        self.epoch = WINDOWS_EPOCH
+        self._shared_strings_part: Optional[str] = None
+        self._styles_part: Optional[str] = None
+        self._shared_strings: Optional[List[str]] = None
+        self._date_styles: Optional[Tuple[Set[int], Set[int]]] = None
+        try:
+            self._worksheets = self._read_workbook(sheet_filter)
+        except Exception:
+            self.archive.close()
+            raise
+
+    def _read_workbook(self, sheet_filter: Optional[Callable[[str], bool]]) -> List[SheetSource]:
+        package_rels = read_relationships(self.archive, '')
+        workbook_part = next(rel.target for rel in package_rels.values() if rel.type.endswith('/officeDocument'))
+        rels = read_relationships(self.archive, workbook_part)
+        for rel in rels.values():
+            if rel.type.endswith('/sharedStrings'):
+                self._shared_strings_part = rel.target
+            elif rel.type.endswith('/styles'):
+                self._styles_part = rel.target
+
+        worksheets = []
+        with self.archive.open(workbook_part) as src:
+            for _, el in iterparse(src):
+                if el.tag == _WORKBOOK_PR_TAG:
+                    if el.get('date1904') in ('1', 'true'):
+                        self.epoch = CALENDAR_MAC_1904
+                elif el.tag == _SHEET_TAG:
+                    rel = rels.get(el.get(_REL_ID_ATTR))
+                    if rel is None or not rel.type.endswith('/worksheet') or not _has_part(self.archive, rel.target):
+                        continue  # chartsheets etc.
+                    title, sheet_state = el.get('name'), el.get('state', 'visible')
+                    if sheet_filter is None or sheet_filter(title):
+                        worksheets.append(XmlSheetSource(self, title=title, sheet_state=sheet_state,
+                                                         part=rel.target))
+                    else:
+                        worksheets.append(ValueSheetSource(title=title, sheet_state=sheet_state))
+        return worksheets
+
+    @property
+    def worksheets(self) -> List[SheetSource]:
+        return self._worksheets
+
+    @property
+    def shared_strings(self) -> List[str]:
+        # built before it is assigned, so threads sharing the source never see a partial list
+        if self._shared_strings is None:
+            shared_strings = []
+            if self._shared_strings_part is not None and _has_part(self.archive, self._shared_strings_part):
+                with self.archive.open(self._shared_strings_part) as src:
+                    shared_strings = read_shared_strings(src)
+            self._shared_strings = shared_strings
+        return self._shared_strings
+
+    @property
+    def date_styles(self) -> Tuple[Set[int], Set[int]]:
+        """
+        Returns:
+            Tuple of set of date style ids and set of timedelta style ids.
+        """
+        if self._date_styles is None:
+            date_styles = (set(), set())
+            if self._styles_part is not None and _has_part(self.archive, self._styles_part):
+                with self.archive.open(self._styles_part) as src:
+                    date_styles = read_date_styles(src)
+            self._date_styles = date_styles
+        return self._date_styles
+
+    def close(self):
+        """Close the underlying xlsx archive."""
+        self.archive.close()
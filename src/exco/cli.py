@@ -0,0 +1,46 @@
+import argparse
+import sys
+from os.path import splitext
+from typing import List, Optional
+
+from exco.exception import ExcoException
+from exco.extractor_spec import ExcelProcessorSpec
+from exco.extractor_spec.compiled_spec import dump_compiled_spec
+
+
+def compile_template(template: str, output: Optional[str] = None) -> str:
+    """Compile template to a compiled spec artifact. See exco.from_compiled.
+
+    Args:
+        template (str): template excel file name.
+        output (Optional[str]): Optional. Default template file name with .exco.json extension.
+
+    Returns:
+        str. output file name.
+    """
+    output = output if output is not None else splitext(template)[0] + '.exco.json'
+    spec = ExcelProcessorSpec.from_excel_template(template, data_only=True)
+    dump_compiled_spec(spec, output)
+    return output
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='exco', description='Excel Comment ORM.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser('compile', help='Compile a template to a compiled spec artifact.')
+    compile_parser.add_argument('template', type=str, help='Path to template file')
+    compile_parser.add_argument('-o', '--output', type=str, default=None,
+                                help='Output path. Default: template path with .exco.json extension')
+
+    args = parser.parse_args(argv)
+    try:
+        output = compile_template(args.template, args.output)
+    except ExcoException as e:
+        print(f'Unable to compile {args.template}: {e}', file=sys.stderr)
+        return 1
+    print(output)
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -1,10 +1,69 @@
 import re
-from dataclasses import dataclass
-from typing import Pattern, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Pattern, Any, Dict, List, Callable, Optional, Tuple
 
 from exco import CellLocation, setting
 from exco.util import CellValue
 from openpyxl import Workbook
+from openpyxl.utils import coordinate_to_tuple
+
+
+@dataclass(frozen=True)
+class InterpolationPlan:
+    """Text pre-split at the references. segments alternate literal text and coordinate:
+    segments[0], segments[2], ... are literals; segments[1], segments[3], ... are coordinates.
+    Filling the plan needs no regex work.
+    """
+    segments: Tuple[str, ...]
+
+    @property
+    def pure_coordinate(self) -> Optional[str]:
+        """
+        Returns:
+            The coordinate if the text is exactly one reference (Ex: '<<A1>>'). None otherwise.
+        """
+        return self.segments[1] if len(self.segments) == 3 and not self.segments[0] and not self.segments[2] \
+            else None
+
+    def fill(self, resolve: Callable[[str], CellValue]) -> CellValue:
+        """
+        Args:
+            resolve (Callable[[str], CellValue]): coordinate to cell value.
+
+        Returns:
+            Cell value itself for a pure reference. String with each reference substituted otherwise.
+        """
+        pure = self.pure_coordinate
+        if pure is not None:
+            return resolve(pure)
+        segments = self.segments
+        return ''.join(segment if i % 2 == 0 else str(resolve(segment)) for i, segment in enumerate(segments))
+
+    @staticmethod
+    @lru_cache(maxsize=setting.interpolation_plan_cache_size)
+    def compile(deref_re: Pattern, text: str) -> Optional['InterpolationPlan']:
+        """Split text at the matches of deref_re. Plans are cached by pattern and text so every
+        distinct spec string is split once. Extraction time plans are compiled ahead, see Dereferator.plans.
+
+        Args:
+            deref_re (Pattern): reference pattern with the coordinate as group 1.
+            text (str):
+
+        Returns:
+            InterpolationPlan. None if text has no reference.
+        """
+        segments = deref_re.split(text)  # literal, group 1, literal, ...
+        return InterpolationPlan(tuple(segments)) if len(segments) > 1 else None
+
+
+@lru_cache(maxsize=setting.interpolation_plan_cache_size)
+def _row_col(coordinate: str) -> Tuple[int, int]:
+    return coordinate_to_tuple(coordinate)
+
+
+# spec string -> its plan, None if it has no reference. See Dereferator.plans
+Plans = Dict[str, Optional[InterpolationPlan]]
 
 
 @dataclass
@@ -12,6 +71,10 @@ class Dereferator:
     deref_re: Pattern
     workbook: Workbook
     anchor: CellLocation
+    # plans compiled when the spec was built, ex: by ExcelProcessorSpec.extract_time_references.
+    # Strings not in plans are compiled on use and added.
+    plans: Optional[Plans] = field(default=None, repr=False, compare=False)
+    _sheet: Any = field(default=None, init=False, repr=False, compare=False)  # anchor's sheet, looked up once
 
     def resolve_coordinate(self, coordinate: str) -> CellValue:
         """Resolve string coordinate ex: A1 to cell value
@@ -22,9 +85,11 @@ class Dereferator:
         Returns:
             CellValue
         """
-        new_loc = self.anchor.new_one_at(coordinate=coordinate)
-        cfp = new_loc.get_cell_full_path(self.workbook)
-        return cfp.cell.value
+        if self._sheet is None:
+            from exco.cell_source import as_workbook_source
+            self._sheet = as_workbook_source(self.workbook)[self.anchor.sheet_name]
+        row, col = _row_col(coordinate)
+        return self._sheet.cell(row, col).value
 
     def resolve_match(self, match_obj: re.Match) -> CellValue:
         """Resolve value from regex MatchObject
@@ -66,18 +131,20 @@ class Dereferator:
             CellValue
         """
         if text and isinstance(text, str):
-            # single match return the whole value
-            pure_match = len(self.deref_re.findall(text)) == 1 and self.deref_re.sub('', text) == ''
-            if pure_match:
-                return self.resolve_match(self.deref_re.search(text))
-            else:  # otherwise do simple string interpolation
-                def str_resolve(x):
-                    return str(self.resolve_match(x))
-
-                return self.deref_re.sub(str_resolve, str(text))
+            plan = self._plan(text)
+            return text if plan is None else plan.fill(self.resolve_coordinate)
         else:
             return text
 
+    def _plan(self, text: str) -> Optional[InterpolationPlan]:
+        if self.plans is None:
+            return InterpolationPlan.compile(self.deref_re, text)
+        try:
+            return self.plans[text]
+        except KeyError:
+            plan = self.plans[text] = InterpolationPlan.compile(self.deref_re, text)
+            return plan
+
     @classmethod
     def template_to_spec(cls, workbook: Workbook, anchor: CellLocation):
         return Dereferator(
@@ -87,9 +154,38 @@ class Dereferator:
         )
 
     @classmethod
-    def spec_to_extractor(cls, workbook: Workbook, anchor: CellLocation):
+    def spec_to_extractor(cls, workbook: Workbook, anchor: CellLocation, plans: Optional[Plans] = None):
         return Dereferator(
             deref_re=setting.spec_to_extractor_deref_re,
             workbook=workbook,
-            anchor=anchor
+            anchor=anchor,
+            plans=plans
+        )
+
+
+@dataclass
+class ReferenceProbe(Dereferator):
+    """Dereferator which resolves nothing but records the coordinates it is asked to resolve.
+    Derefing a spec with it tells which cells the spec depends on without reading a workbook.
+    Given plans, the plan of every string of the spec is compiled into it on the way.
+    """
+    coordinates: List[str] = field(default_factory=list)
+
+    @property
+    def found(self) -> bool:
+        return len(self.coordinates) > 0
+
+    def resolve_coordinate(self, coordinate: str) -> CellValue:
+        if coordinate not in self.coordinates:
+            self.coordinates.append(coordinate)
+        return None
+
+    @classmethod
+    def spec_to_extractor(cls, workbook: Workbook = None, anchor: CellLocation = None,
+                          plans: Optional[Plans] = None) -> 'ReferenceProbe':
+        return ReferenceProbe(
+            deref_re=setting.spec_to_extractor_deref_re,
+            workbook=workbook,
+            anchor=anchor,
+            plans=plans
         )
@@ -8,6 +8,7 @@ T = TypeVar('T')
 
 
 class ExcelExtractionScope(abc.ABC):
+    __slots__ = ()
 
     @abc.abstractmethod
     def get_cell_full_path(self, wb: Workbook) -> CellFullPath:
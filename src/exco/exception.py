@@ -82,3 +82,7 @@ class NoEndConditionError(ExcoException):
 
 class YamlParseError(ExcoException):
     pass
+
+
+class CompiledSpecFormatError(ExcoException):
+    pass
@@ -1,5 +1,7 @@
+import copy
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from typing import List, Iterable, Dict, Any
 
 import yaml
@@ -11,6 +13,11 @@ from exco.extractor_spec.spec_source import SpecSource
 from exco.setting import k_table_key
 from yaml.scanner import ScannerError
 
+try:
+    from yaml import CFullLoader as _YamlLoader  # libyaml
+except ImportError:  # pragma: no cover
+    from yaml import FullLoader as _YamlLoader
+
 
 @dataclass
 class LineCollector:
@@ -26,6 +33,17 @@ class LineCollector:
         self.raw.append(line)
 
 
+@lru_cache(maxsize=setting.yaml_cache_size)
+def _parse_yaml(raw: str) -> Any:
+    """Parse yaml of an exco block. Blocks with the same raw string, common among column blocks,
+    are parsed once. The result is shared; do not modify it.
+    """
+    try:
+        return yaml.load(raw, Loader=_YamlLoader)
+    except ScannerError as e:
+        raise YamlParseError(raw) from e
+
+
 @dataclass
 class ExcoBlock(SpecSource):
     start_line: int
@@ -38,7 +56,7 @@ class ExcoBlock(SpecSource):
         Returns:
             str. table key for this block.
         """
-        d = self.to_dict()
+        d = _parse_yaml(self.raw)
         try:
             return d[k_table_key]
         except LookupError as e:
@@ -51,18 +69,16 @@ class ExcoBlock(SpecSource):
         Returns:
             str. key for this block
         """
-        return self.to_dict()[setting.k_key]
+        return _parse_yaml(self.raw)[setting.k_key]
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary.
+        """Convert to dictionary. The parsed yaml is cached by raw string (see _parse_yaml),
+        this returns a copy so the caller is free to modify it.
 
         Returns:
             Dict[str, Any]
         """
-        try:
-            return yaml.load(self.raw, Loader=yaml.FullLoader)
-        except ScannerError as e:
-            raise YamlParseError(self.raw) from e
+        return copy.deepcopy(_parse_yaml(self.raw))
 
     def to_cell_extractor_task_spec(self) -> CellExtractionSpec:
         """To CellExtractionSpec
@@ -1,11 +1,12 @@
 import itertools
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Union
 
 import openpyxl as opx
 from exco import util
 from exco.cell_location import CellLocation
+from exco.cell_source import WorkbookSource, XmlWorkbookSource, as_workbook_source
 from exco.exception import ExcoException, BadTemplateException, CommentWithNoExcoBlockWarning, TableKeyNotFound, \
     TableHasNoColumn, MissingTableBlock
 from exco.exco_template.exco_block import ExcoBlock, ExcoBlockCollection
@@ -13,7 +14,7 @@ from exco.extractor_spec.cell_extraction_spec import CellExtractionSpec
 from exco.extractor_spec.excel_processor_spec import ExcelProcessorSpec
 from exco.extractor_spec.spec_source import SpecSource
 from exco.extractor_spec.table_extraction_spec import TableExtractionSpec, ColumnSpecDict
-from openpyxl.cell.read_only import EmptyCell
+from exco.workbook_loader import ExcelSource, open_excel_source
 import warnings
 
 
@@ -123,24 +124,21 @@ class ExcoTemplate:
             len(self.column_blocks) + len(self.cell_blocks)
 
     @classmethod
-    def from_workbook(cls, workbook: opx.Workbook) -> 'ExcoTemplate':
-        """Construct from Excel workbook
+    def from_workbook(cls, workbook: Union[opx.Workbook, WorkbookSource]) -> 'ExcoTemplate':
+        """Construct from Excel workbook. Only the comments of each sheet are visited, not every cell.
 
         Args:
-            workbook (workbook):
+            workbook (Union[opx.Workbook, WorkbookSource]): workbook
 
         Returns:
             ExcoTemplate
         """
-        wb = workbook
         ret = ExcoTemplate.empty()
-        for cfp in util.iterate_cells_in_workbook(wb):
-            if not isinstance(
-                    cfp.cell, EmptyCell) and cfp.cell.comment is not None:
-                cell_loc = cfp.to_cell_location()
+        for sheet in as_workbook_source(workbook).worksheets:
+            for (row, column), text in sorted(sheet.comments().items()):  # row major like the cells
+                cell_loc = CellLocation(sheet.title, row=row, col=column)
                 try:
-                    ebc = ExcoBlockCollection.from_string(
-                        cfp.cell.comment.text)
+                    ebc = ExcoBlockCollection.from_string(text)
                     if ebc.n_total_blocks() == 0:
                         warnings.warn(
                             f"{cell_loc.short_name} has comment but no exco block.",
@@ -152,16 +150,21 @@ class ExcoTemplate:
         return ret
 
     @classmethod
-    def from_excel(cls, fname: str) -> 'ExcoTemplate':
-        """Construct from excel file.
+    def from_excel(cls, fname: ExcelSource) -> 'ExcoTemplate':
+        """Construct from excel file. The comment parts (xl/comments*.xml) are read directly;
+        the cells of the template are never loaded, so formula cells give the same template as with openpyxl.
 
         Args:
-            fname (str): file name.
+            fname (ExcelSource): file name, xlsx content or seekable binary stream.
 
         Returns:
             ExcoTemplate
         """
-        return cls.from_workbook(workbook=opx.load_workbook(fname))
+        workbook = XmlWorkbookSource(open_excel_source(fname))
+        try:
+            return cls.from_workbook(workbook=workbook)
+        finally:
+            workbook.close()
 
     def column_block_dict_by_table_key(
             self) -> Dict[str, List[ExcoBlockWithLocation]]:
@@ -1,6 +1,7 @@
 from .excel_processor import ExcelProcessorFactory, ExcelProcessor
+from .multi_processor import MultiProcessor
 from .parser.parser import Parser
 from .locator.locator import Locator
 from .validator.validator import Validator
 from .assumption.assumption import Assumption
-__all__ = ['ExcelProcessorFactory', 'ExcelProcessor', 'Parser', 'Locator', 'Validator', 'Assumption']
+__all__ = ['ExcelProcessorFactory', 'ExcelProcessor', 'MultiProcessor', 'Parser', 'Locator', 'Validator', 'Assumption']
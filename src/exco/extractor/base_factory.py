@@ -1,5 +1,5 @@
 import abc
-from typing import TypeVar, Generic, Dict, Type, List
+from typing import TypeVar, Generic, Dict, Type, List, Tuple
 
 from exco import util
 from exco.exception import ActorCreationFailException
@@ -80,6 +80,14 @@ class BaseFactory(abc.ABC, Generic[ActorType, SpecType]):
         """
         return list(self.class_map.keys())
 
+    def signature(self) -> Tuple[Tuple[str, str], ...]:
+        """
+
+        Returns:
+            Sorted tuple of (key, fully qualified class name) of every registered class.
+        """
+        return tuple(sorted((k, f'{clz.__module__}.{clz.__qualname__}') for k, clz in self.class_map.items()))
+
     def create_from_spec(self, spec: SpecType) -> ActorType:
         """Create Actor from the given spec
 
@@ -3,6 +3,7 @@ from typing import Generic, Dict, TypeVar, Any
 
 from openpyxl import Workbook
 
+from exco.cell_full_path import CellFullPath
 from exco.cell_location import CellLocation
 from exco.extractor.assumption.assumption import Assumption
 from exco.extractor.assumption.assumption_result import AssumptionResult
@@ -110,7 +111,18 @@ class CellExtractionTask(Generic[T]):
                 fallback=self.fallback,
                 metadata=self.metadata)
         cfp = locating_result.location.get_cell_full_path(workbook)
+        return self.process_located(locating_result, cfp)
 
+    def process_located(self, locating_result: LocatingResult, cfp: CellFullPath) -> CellExtractionTaskResult[T]:
+        """Check assumptions, parse and validate the cell already located.
+
+        Args:
+            locating_result (LocatingResult): good locating result.
+            cfp (CellFullPath): the located cell.
+
+        Returns:
+            CellExtractionTaskResult
+        """
         assumption_results = {k: assumption.assume(
             cfp) for k, assumption in self.assumptions.items()}
         if any(not ar.is_ok for ar in assumption_results.values()):
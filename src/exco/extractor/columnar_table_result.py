@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, TYPE_CHECKING
+
+from exco.extractor.cell_extraction_task import CellExtractionTask, CellExtractionTaskResult
+from exco.extractor.locator.locating_result import LocatingResult
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    from exco.extractor.table_extraction_task import EndConditionCollectionResult
+
+
+@dataclass
+class ColumnFailure:
+    """A cell of a column which is not ok."""
+    index: int
+    """row index in the table"""
+    result: CellExtractionTaskResult
+    """full result of the cell. Why it failed and its fallback value"""
+
+
+@dataclass
+class TableColumn:
+    """One column of a columnar table.
+    values[i] is the value of row i when valid[i]. Other slots hold 0, nan or NaT (object columns None)
+    and the reason is in failures.
+    """
+    key: str
+    values: 'np.ndarray'
+    valid: 'np.ndarray'
+    failures: List[ColumnFailure] = field(default_factory=list)
+
+    @property
+    def is_ok(self) -> bool:
+        return not self.failures
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def to_list(self) -> List[Any]:
+        """
+        Returns:
+            Python values of the column. Failed cells get the value of their result (usually the fallback),
+            same as TableExtractionTaskResult.get_value.
+        """
+        ret = self.values.tolist()
+        for failure in self.failures:
+            ret[failure.index] = failure.result.get_value()
+        return ret
+
+
+@dataclass
+class ColumnarTableResult:
+    """Extraction Result for a Table stored column by column. See TableExtractionTask.process with columnar=True.
+    Only the failing cells keep their CellExtractionTaskResult.
+    """
+    key: str
+    locating_result: LocatingResult
+    columns: Dict[str, TableColumn] = field(default_factory=dict)
+    n_rows: int = 0
+    end_conditions_ok: bool = True
+
+    @property
+    def is_ok(self) -> bool:
+        return self.locating_result.is_ok and \
+            self.end_conditions_ok and \
+            all(column.is_ok for column in self.columns.values())
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __getitem__(self, key: str) -> TableColumn:
+        return self.columns[key]
+
+    @classmethod
+    def fail_locating_result(cls, key: str, locating_result: LocatingResult) -> 'ColumnarTableResult':
+        return ColumnarTableResult(key=key, locating_result=locating_result)
+
+    def get_value(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            Python Equivalent Value. Same as TableExtractionTaskResult.get_value.
+        """
+        columns = {k: column.to_list() for k, column in self.columns.items()}
+        return [{k: values[i] for k, values in columns.items()} for i in range(self.n_rows)]
+
+
+class ColumnarTableBuilder:
+    """Collect the rows of a table column by column. The dtype of each column comes from its parser.
+    See Parser.column_dtype.
+    """
+
+    def __init__(self, columns: List[CellExtractionTask]):
+        if np is None:
+            raise ImportError('numpy is required for columnar table results. Install it with pip install exco[numpy].')
+        self._dtypes = {cet.key: cet.parser.column_dtype for cet in columns}
+        self._values: Dict[str, List[Any]] = {k: [] for k in self._dtypes}
+        self._failures: Dict[str, List[ColumnFailure]] = {k: [] for k in self._dtypes}
+        self._n_rows = 0
+
+    def add_row(self, cell_results: List[CellExtractionTaskResult]):
+        """
+        Args:
+            cell_results (List[CellExtractionTaskResult]): result of every column of the row.
+        """
+        for cr in cell_results:
+            if cr.is_ok:
+                self._values[cr.key].append(cr.get_value())
+            else:
+                self._values[cr.key].append(None)
+                self._failures[cr.key].append(ColumnFailure(index=self._n_rows, result=cr))
+        self._n_rows += 1
+
+    def build(self, key: str, locating_result: LocatingResult,
+              end_condition_results: List['EndConditionCollectionResult']) -> ColumnarTableResult:
+        """
+        Args:
+            key (str): table key.
+            locating_result (LocatingResult): locating result of the table.
+            end_condition_results (List[EndConditionCollectionResult]): end condition result of every row tested.
+
+        Returns:
+            ColumnarTableResult
+        """
+        columns = {}
+        for k, values in self._values.items():
+            valid = np.ones(len(values), dtype=bool)
+            valid[[failure.index for failure in self._failures[k]]] = False
+            columns[k] = TableColumn(key=k, values=self._array(values, valid, self._dtypes[k]),
+                                     valid=valid, failures=self._failures[k])
+        return ColumnarTableResult(
+            key=key,
+            locating_result=locating_result,
+            columns=columns,
+            n_rows=self._n_rows,
+            end_conditions_ok=all(ec.is_ok for ec in end_condition_results)
+        )
+
+    @staticmethod
+    def _array(values: List[Any], valid: 'np.ndarray', dtype: str) -> 'np.ndarray':
+        """Typed array of values. Falls back to an object array if a value does not fit dtype."""
+        dtype = np.dtype(dtype)
+        if dtype != object:
+            if dtype.kind in 'iub':
+                values = [v if ok else 0 for v, ok in zip(values, valid)]
+            try:
+                return np.array(values, dtype=dtype)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        ret = np.empty(len(values), dtype=object)
+        for i, v in enumerate(values):
+            ret[i] = v
+        return ret
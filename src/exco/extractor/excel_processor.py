@@ -1,29 +1,47 @@
-import secrets
-from dataclasses import dataclass
-from typing import TypeVar, Dict, Any, List, Optional, Generic, Type
+import asyncio
+import functools
+import itertools
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import TypeVar, Dict, Any, List, Optional, Generic, Type, Set, Union, BinaryIO, Tuple, Iterator, \
+    Iterable, AsyncIterable, AsyncIterator, Deque
 
-import openpyxl
 from openpyxl import Workbook
 
+from exco import setting
 from exco.cell_location import CellLocation
+from exco.cell_source import AliasedWorkbookSource, WorkbookSource, as_workbook_source, with_snapshot
+from exco.dereferator import Dereferator, Plans
 from exco.exception import ExcoException, ExtractionTaskCreationException, TableExtractionTaskCreationException
 from exco.extractor.assumption.assumption import Assumption
 from exco.extractor.assumption.assumption_factory import AssumptionFactory
 from exco.extractor.cell_extraction_task import CellExtractionTaskResult, CellExtractionTask
+from exco.extractor.columnar_table_result import ColumnarTableResult
 from exco.extractor.locator.locator import Locator
 from exco.extractor.locator.locator_factory import LocatorFactory
 from exco.extractor.parser.parser import Parser
 from exco.extractor.parser.parser_factory import ParserFactory
+from exco.extractor.result_export import to_arrow, to_dataframes
 from exco.extractor.table_end_conditions.table_end_condition import TableEndCondition
 from exco.extractor.table_end_conditions.table_end_condition_factory import TableEndConditionFactory
 from exco.extractor.table_extraction_task import TableExtractionTask, EndConditionCollection, TableExtractionTaskResult
 from exco.extractor.validator.validator import Validator
 from exco.extractor.validator.validator_factory import ValidatorFactory
 from exco.extractor_spec import CellExtractionSpec, ExcelProcessorSpec
+from exco.extractor_spec.compiled_spec import load_compiled_spec
 from exco.extractor_spec.table_extraction_spec import TableExtractionSpec
-from exco.sheet_name_alias import SheetName, SheetNameAliasCheckers
+from exco.sheet_name_alias import SheetName, SheetNameAliasCheckers, SheetNameAliasMatcher
+from exco.template_cache import TemplateCache
+from exco.workbook_loader import load_workbook, WorkbookBackend, ExcelSource, Buffer, open_excel_source
 
 T = TypeVar('T')
+References = Dict[Tuple[CellLocation, int], Tuple[str, ...]]  # See ExcelProcessorSpec.extract_time_references
+PathLike = Union[str, 'os.PathLike[str]']
 
 
 @dataclass
@@ -42,45 +60,87 @@ class LookupResult(Generic[T]):
 
 
 @dataclass
-class ExcelProcessingResult:
+class ExcelProcessingResult(Mapping):
+    """Results of every cell and table task. It is also a read only mapping from key to the task result,
+    the same keys as to_dict.
+
+    Lookups by key use an index built on first use. Results are not expected to change after that.
+    """
     cell_results: Dict[CellLocation, List[CellExtractionTaskResult]]
-    table_results: Dict[CellLocation, List[TableExtractionTaskResult]]
+    table_results: Dict[CellLocation, List[Union[TableExtractionTaskResult, ColumnarTableResult]]]
+    # (first cell result for key, first table result for key, results by key as in to_dict). See _index
+    _key_index: Optional[Tuple[Dict[str, LookupResult], Dict[str, LookupResult], Dict[str, Any]]] = \
+        field(default=None, init=False, repr=False, compare=False)
 
     @property
     def is_ok(self):
         return all(cr.is_ok for crs in self.cell_results.values() for cr in crs) and \
                all(tr.is_ok for trs in self.table_results.values() for tr in trs)
 
-    @staticmethod
-    def _lookup_for_key(d: Dict[CellLocation,
-                                List[T]],
-                        key: str) -> Optional[LookupResult[T]]:
-        for cl, results in d.items():
-            for result in results:
-                if key == result.key:
-                    return LookupResult(cl, result)
-        return None
+    def _index(self) -> Tuple[Dict[str, LookupResult], Dict[str, LookupResult], Dict[str, Any]]:
+        """Key indexes built by a single pass over the results.
+        Lookups return the first result for a key; to_dict, like before, the last one (tables after cells).
+        """
+        if self._key_index is None:
+            cell_index: Dict[str, LookupResult] = {}
+            table_index: Dict[str, LookupResult] = {}
+            by_key: Dict[str, Any] = {}
+            for index, d in ((cell_index, self.cell_results), (table_index, self.table_results)):
+                for cl, results in d.items():
+                    for result in results:
+                        if result.key not in index:
+                            index[result.key] = LookupResult(cl, result)
+                        by_key[result.key] = result
+            self._key_index = cell_index, table_index, by_key
+        return self._key_index
 
     def cell_result_for_key(
             self, key: str) -> Optional[LookupResult[CellExtractionTaskResult]]:
-        return self._lookup_for_key(self.cell_results, key)
+        return self._index()[0].get(key)
 
     def table_result_for_key(
-            self, key: str) -> Optional[LookupResult[TableExtractionTaskResult]]:
-        return self._lookup_for_key(self.table_results, key)
+            self, key: str) -> Optional[LookupResult[Union[TableExtractionTaskResult, ColumnarTableResult]]]:
+        return self._index()[1].get(key)
+
+    def __getitem__(self, key: str) -> Union[CellExtractionTaskResult, TableExtractionTaskResult, ColumnarTableResult]:
+        return self._index()[2][key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index()[2])
+
+    def __len__(self) -> int:
+        return len(self._index()[2])
+
+    def __bool__(self) -> bool:
+        # a result without key is still a result, truthy like before it was a mapping
+        return True
 
     def to_dict(self) -> Dict[str, Any]:
-        ret = {}
-        for results in self.cell_results.values(
-        ):
-            for result in results:
-                ret[result.key] = result.get_value()
-
-        for results in self.table_results.values(
-        ):
-            for result in results:
-                ret[result.key] = result.get_value()
-        return ret
+        return {key: result.get_value() for key, result in self._index()[2].items()}
+
+    def to_dataframes(self, cells_key: str = 'cells') -> Dict[str, Any]:
+        """pandas DataFrame of each table, built from column data. Requires pandas.
+        See exco.extractor.result_export.to_dataframes.
+
+        Args:
+            cells_key (str): Optional. Default cells. Key of the single row frame of the cell results.
+
+        Returns:
+            Dict of table key (and cells_key) to DataFrame.
+        """
+        return to_dataframes(self, cells_key)
+
+    def to_arrow(self, cells_key: str = 'cells') -> Dict[str, Any]:
+        """Arrow RecordBatch of each table, built from column data. Requires pyarrow.
+        See exco.extractor.result_export.to_arrow.
+
+        Args:
+            cells_key (str): Optional. Default cells. Key of the single row batch of the cell results.
+
+        Returns:
+            Dict of table key (and cells_key) to RecordBatch.
+        """
+        return to_arrow(self, cells_key)
 
 
 @dataclass
@@ -88,20 +148,96 @@ class ExcelDerefedProcessor:
     cell_processors: Dict[CellLocation, List[CellExtractionTask]]
     table_processors: Dict[CellLocation, List[TableExtractionTask]]
 
-    def process_workbook(self, workbook: Workbook) -> ExcelProcessingResult:
+    def process_workbook(self, workbook: Workbook, snapshot: bool = False,
+                         columnar: bool = False) -> ExcelProcessingResult:
+        """
+        Args:
+            workbook (Workbook): openpyxl's Workbook or WorkbookSource.
+            snapshot (bool): Optional. Default False. Read values from a dense numpy snapshot of each used sheet,
+                built once and shared by every task. Requires numpy. See exco.cell_source.SnapshotWorkbookSource.
+            columnar (bool): Optional. Default False. Table results are ColumnarTableResult, one typed numpy array
+                per column, instead of a result per row. Requires numpy. See TableExtractionTask.process.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        workbook = with_snapshot(workbook) if snapshot else as_workbook_source(workbook)
         cell_result = {}
         for loc, cets in self.cell_processors.items():
             cell_result[loc] = [cet.process(loc, workbook) for cet in cets]
 
         table_result = {}
         for loc, tets in self.table_processors.items():
-            table_result[loc] = [tet.process(loc, workbook) for tet in tets]
+            table_result[loc] = [tet.process(loc, workbook, columnar=columnar) for tet in tets]
         return ExcelProcessingResult(
             cell_results=cell_result, table_results=table_result)
 
-    def process_excel(self, fname: str) -> ExcelProcessingResult:
-        wb = openpyxl.load_workbook(fname, data_only=True)
-        return self.process_workbook(wb)
+    def sheet_names(self) -> Set[SheetName]:
+        """
+        Returns:
+            Set of sheet names referenced by cell processors and table processors.
+        """
+        return {cl.sheet_name for cl in itertools.chain(self.cell_processors.keys(), self.table_processors.keys())}
+
+    def process_excel(self, fname: ExcelSource, read_only: bool = False,
+                      backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                      snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """Load and process excel file. Only the sheets in sheet_names() are parsed.
+
+        Args:
+            fname (ExcelSource): file name, xlsx content or seekable binary stream.
+            read_only (bool): Optional. Default False. Load the workbook in openpyxl read-only mode.
+                See exco.workbook_loader.load_workbook.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. Library used to read the workbook.
+                See exco.workbook_loader.WorkbookBackend.
+            snapshot (bool): Optional. Default False. See process_workbook.
+            columnar (bool): Optional. Default False. See process_workbook.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        sheet_names = self.sheet_names()
+        wb = load_workbook(fname, read_only=read_only, backend=backend,
+                           sheet_filter=lambda sheet_name: sheet_name in sheet_names)
+        try:
+            return self.process_workbook(wb, snapshot=snapshot, columnar=columnar)
+        finally:
+            wb.close()
+
+    def process_bytes(self, data: Buffer, read_only: bool = False,
+                      backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                      snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """Process xlsx content in memory without copying it or writing it to disk.
+
+        Args:
+            data (Buffer): bytes, bytearray or memoryview of xlsx content.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        return self.process_excel(open_excel_source(data), read_only=read_only, backend=backend, snapshot=snapshot,
+                                  columnar=columnar)
+
+    def process_stream(self, stream: BinaryIO, read_only: bool = False,
+                       backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                       snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """Process xlsx content from a seekable binary stream. The stream is not closed.
+
+        Args:
+            stream (BinaryIO): seekable binary stream. Ex: an uploaded file.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        return self.process_excel(stream, read_only=read_only, backend=backend, snapshot=snapshot, columnar=columnar)
 
     def __str__(self):
         tmp = []
@@ -120,52 +256,408 @@ class ExcelProcessor:
     factory: 'ExcelProcessorFactory'
     sheet_name_checkers: SheetNameAliasCheckers
     accept_only_visible_sheets: bool
+    # built once from spec. See _static_processor
+    _static: Optional[Tuple[ExcelProcessorSpec, ExcelDerefedProcessor, References, References, Plans]] = \
+        field(default=None, init=False, repr=False, compare=False)
+    # (is table, anchor, index, referenced values) -> task built for those values. See _referencing_task
+    _task_memo: 'OrderedDict[Tuple[bool, CellLocation, int, tuple], Any]' = \
+        field(default_factory=OrderedDict, init=False, repr=False, compare=False)
+    # (checkers, matcher compiled from them). See _alias_matcher
+    _alias_matcher_cache: Optional[Tuple[SheetNameAliasCheckers, SheetNameAliasMatcher]] = \
+        field(default=None, init=False, repr=False, compare=False)
+    # guards building _static and every access to _task_memo, so one processor can be shared across threads
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # tasks, memos and compiled matchers are rebuilt on first use, so pickling only carries the spec and factory
+        state = dict(self.__dict__)
+        state.update(_static=None, _task_memo=OrderedDict(), _alias_matcher_cache=None)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _static_processor(self) -> Tuple[ExcelDerefedProcessor, References, References]:
+        """Tasks for the specs without extraction time references are the same for every workbook.
+        They are built once; the specs with references are marked to be built for each workbook, and
+        the interpolation plans of their strings are compiled for _referencing_task.
+
+        Returns:
+            Tuple of processor (tasks of referencing specs are None), referencing cell specs
+            and referencing table specs. See ExcelProcessorSpec.extract_time_references.
+        """
+        static = self._static
+        if static is None or static[0] is not self.spec:
+            with self._lock:
+                static = self._static
+                if static is None or static[0] is not self.spec:
+                    raw_spec = self.spec
+                    plans: Plans = {}
+                    cell_refs, table_refs = raw_spec.extract_time_references(plans)
+                    processor = ExcelDerefedProcessor(
+                        cell_processors={cl: [None if (cl, i) in cell_refs
+                                              else self.factory.create_extraction_task(spec)
+                                              for i, spec in enumerate(specs)]
+                                         for cl, specs in raw_spec.cell_specs.items()},
+                        table_processors={cl: [None if (cl, i) in table_refs
+                                               else self.factory.create_table_extraction_task(spec)
+                                               for i, spec in enumerate(specs)]
+                                          for cl, specs in raw_spec.table_specs.items()})
+                    static = raw_spec, processor, cell_refs, table_refs, plans
+                    self._task_memo.clear()
+                    self._static = static
+        return static[1:4]
+
+    def _referencing_task(self, workbook: Workbook, is_table: bool, cl: CellLocation, i: int,
+                          coordinates: Tuple[str, ...]) -> Union[CellExtractionTask, TableExtractionTask]:
+        """Task for a spec with extraction time references. The task only depends on the values of the
+        referenced cells, so tasks are memoized by those values: workbooks from the same source,
+        with the same unit, currency etc. in those cells, reuse the task instead of building it again.
+        """
+        static = self._static
+        spec = static[0]
+        dereferator = Dereferator.spec_to_extractor(workbook, cl, plans=static[4])
+        values = tuple((type(v), v) for v in (dereferator.resolve_coordinate(c) for c in coordinates))
+        memo_key = (is_table, cl, i, values)
+        with self._lock:
+            try:
+                task = self._task_memo.get(memo_key)
+            except TypeError:  # unhashable value
+                memo_key, task = None, None
+            if task is not None:
+                self._task_memo.move_to_end(memo_key)
+                return task
+        # built outside the lock; two threads may build the same task, the last one is kept
+        if is_table:
+            task = self.factory.create_table_extraction_task(spec.table_specs[cl][i].deref(dereferator))
+        else:
+            task = self.factory.create_extraction_task(spec.cell_specs[cl][i].deref(dereferator))
+        if memo_key is not None:
+            with self._lock:
+                if self._static is static:  # not a task of a spec replaced meanwhile
+                    self._task_memo[memo_key] = task
+                    while len(self._task_memo) > setting.deref_task_cache_size:
+                        self._task_memo.popitem(last=False)
+        return task
 
     def deref(self, workbook: Optional[Workbook]) -> ExcelDerefedProcessor:
-        if workbook is not None:
-            derefed_spec = self.spec.spec_to_extractor_deref(workbook)
-            return self.factory.create_derefed_processor_from_spec(derefed_spec)
-        else:
+        if workbook is None:
             return self.factory.create_derefed_processor_from_spec(self.spec)
-
-    def process_workbook(self, workbook: Workbook) -> ExcelProcessingResult:
+        processor, cell_refs, table_refs = self._static_processor()
+        if not cell_refs and not table_refs:
+            return processor
+        cell_processors = {cl: list(tasks) for cl, tasks in processor.cell_processors.items()}
+        for (cl, i), coordinates in cell_refs.items():
+            cell_processors[cl][i] = self._referencing_task(workbook, False, cl, i, coordinates)
+        table_processors = {cl: list(tasks) for cl, tasks in processor.table_processors.items()}
+        for (cl, i), coordinates in table_refs.items():
+            table_processors[cl][i] = self._referencing_task(workbook, True, cl, i, coordinates)
+        return ExcelDerefedProcessor(cell_processors=cell_processors, table_processors=table_processors)
+
+    def process_workbook(self, workbook: Workbook, snapshot: bool = False,
+                         columnar: bool = False) -> ExcelProcessingResult:
+        """
+        Args:
+            workbook (Workbook): openpyxl's Workbook or WorkbookSource.
+            snapshot (bool): Optional. Default False. See ExcelDerefedProcessor.process_workbook.
+            columnar (bool): Optional. Default False. See ExcelDerefedProcessor.process_workbook.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        if workbook is not None:
+            workbook = with_snapshot(workbook) if snapshot else as_workbook_source(workbook)
         workbook = self.normalize_workbook_sheet_names(workbook)
-        return self.deref(workbook).process_workbook(workbook)
-
-    def deal_with_duplicates(self, workbook: Workbook, template_sheet_names: List[str]) -> Workbook:
-        hidden_sheet_names = [sheet.title for sheet in workbook.worksheets if sheet.sheet_state == "hidden"]
-        for template_sheet_name in template_sheet_names:
-            if template_sheet_name in hidden_sheet_names:
-                workbook[template_sheet_name].title = "duplicate_sheet_name" + str(secrets.randbelow(10000))
-        return workbook
-
-    def normalize_workbook_sheet_names(self, workbook: Workbook) -> Workbook:
+        return self.deref(workbook).process_workbook(workbook, columnar=columnar)  # snapshot already taken
+
+    def deal_with_duplicates(self, workbook: Workbook, template_sheet_names: List[str]) -> WorkbookSource:
+        """Leave out the hidden sheets named as a template sheet, so that a visible alias can take the name.
+        The workbook is not modified.
+
+        Args:
+            workbook (Workbook): openpyxl's Workbook or WorkbookSource.
+            template_sheet_names (List[str]):
+
+        Returns:
+            WorkbookSource view of workbook without those sheets.
+        """
+        source = as_workbook_source(workbook)
+        return AliasedWorkbookSource(source, {sheet.title: None for sheet in source.worksheets
+                                              if sheet.sheet_state == "hidden" and sheet.title in template_sheet_names})
+
+    def _alias_matcher(self) -> SheetNameAliasMatcher:
+        """
+        Returns:
+            SheetNameAliasMatcher of sheet_name_checkers, compiled once.
+        """
+        if self._alias_matcher_cache is None or self._alias_matcher_cache[0] is not self.sheet_name_checkers:
+            self._alias_matcher_cache = self.sheet_name_checkers, SheetNameAliasMatcher(self.sheet_name_checkers)
+        return self._alias_matcher_cache[1]
+
+    def normalize_workbook_sheet_names(self, workbook: Workbook) -> Union[Workbook, WorkbookSource]:
+        """View of workbook where the sheets accepted by sheet_name_checkers have their template sheet name.
+        The workbook is not modified, so one loaded workbook can be processed by many processors, also at the
+        same time. A sheet already named as a template sheet keeps the name; other sheets accepted for that
+        template sheet keep their own names.
+
+        Args:
+            workbook (Workbook): openpyxl's Workbook or WorkbookSource.
+
+        Returns:
+            AliasedWorkbookSource. workbook itself if there is no sheet name checker.
+        """
         if not self.sheet_name_checkers:
             return workbook
+        source = as_workbook_source(workbook)
         if self.accept_only_visible_sheets:
-            workbook = self.deal_with_duplicates(workbook, list(self.sheet_name_checkers.keys()))
+            source = self.deal_with_duplicates(source, list(self.sheet_name_checkers.keys()))
+        matcher = self._alias_matcher()
         name_mapping: Dict[SheetName, SheetName] = {}
-        for sheet in workbook.worksheets:
-            sheet_name = sheet.title
-            for template_sheet_name, checker in self.sheet_name_checkers.items():
-                if self.accept_only_visible_sheets and sheet.sheet_state == "hidden":
-                    continue
-                if checker(sheet_name):
-                    name_mapping[sheet_name] = template_sheet_name
-                    break
+        for sheet in source.worksheets:
+            if self.accept_only_visible_sheets and sheet.sheet_state == "hidden":
+                continue
+            template_sheet_name = matcher.match(sheet.title)
+            if template_sheet_name is not None and template_sheet_name != sheet.title:
+                name_mapping[sheet.title] = template_sheet_name
+        taken = {sheet.title for sheet in source.worksheets if sheet.title not in name_mapping}
+        titles: Dict[SheetName, Optional[SheetName]] = {}
         for sheet_name, template_sheet_name in name_mapping.items():
-            workbook[sheet_name].title = template_sheet_name
-        return workbook
-
-    def process_excel(self, fname: str) -> ExcelProcessingResult:
-        wb = openpyxl.load_workbook(fname, data_only=True)
-        return self.process_workbook(wb)
+            if template_sheet_name not in taken:
+                titles[sheet_name] = template_sheet_name
+                taken.add(template_sheet_name)
+        return AliasedWorkbookSource(source, titles)
+
+    def is_sheet_used(self, sheet_name: SheetName) -> bool:
+        """Check if the sheet of to-be-extracted workbook may be used by this processor.
+        That is, the sheet name is one of the sheet names in the spec or
+        one of those sheet names' alias checker accepts it.
+
+        Args:
+            sheet_name (SheetName): sheet name in to-be-extracted workbook.
+
+        Returns:
+            bool. True if the sheet may be used.
+        """
+        sheet_names = self.spec.sheet_names()
+        if sheet_name in sheet_names:
+            return True
+        checkers = self.sheet_name_checkers or {}
+        return any(checker(sheet_name) for template_sheet_name, checker in checkers.items()
+                   if template_sheet_name in sheet_names)
+
+    def process_excel(self, fname: ExcelSource, read_only: bool = False,
+                      backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                      snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """Load and process excel file. Only the sheets this processor may use are parsed.
+
+        Args:
+            fname (ExcelSource): file name, xlsx content or seekable binary stream.
+            read_only (bool): Optional. Default False. Load the workbook in openpyxl read-only mode.
+                See exco.workbook_loader.load_workbook.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. Library used to read the workbook.
+                See exco.workbook_loader.WorkbookBackend.
+            snapshot (bool): Optional. Default False. See process_workbook.
+            columnar (bool): Optional. Default False. See process_workbook.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        wb = load_workbook(fname, read_only=read_only, sheet_filter=self.is_sheet_used, backend=backend)
+        try:
+            return self.process_workbook(wb, snapshot=snapshot, columnar=columnar)
+        finally:
+            wb.close()
+
+    def process_bytes(self, data: Buffer, read_only: bool = False,
+                      backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                      snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """Process xlsx content in memory without copying it or writing it to disk.
+
+        Args:
+            data (Buffer): bytes, bytearray or memoryview of xlsx content.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        return self.process_excel(open_excel_source(data), read_only=read_only, backend=backend, snapshot=snapshot,
+                                  columnar=columnar)
+
+    def process_stream(self, stream: BinaryIO, read_only: bool = False,
+                       backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                       snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """Process xlsx content from a seekable binary stream. The stream is not closed.
+
+        Args:
+            stream (BinaryIO): seekable binary stream. Ex: an uploaded file.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        return self.process_excel(stream, read_only=read_only, backend=backend, snapshot=snapshot, columnar=columnar)
+
+    def process_many(self, paths: Iterable[PathLike], jobs: Optional[int] = None, chunksize: int = 1,
+                     ordered: bool = True, read_only: bool = False,
+                     backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                     snapshot: bool = False, columnar: bool = False
+                     ) -> Iterator[Tuple[PathLike, Union[ExcelProcessingResult, Exception]]]:
+        """Process many excel files on a pool of worker processes.
+        This processor is sent to each worker once, when the worker starts, and only paths and results go through
+        the pool afterward. Each worker builds the tasks from the spec once. Where workers are spawned instead of
+        forked, the processor is pickled: use exco.sheet_name_alias.SheetNameMatcher, not lambdas, as sheet name
+        checkers.
+
+        Args:
+            paths (Iterable[PathLike]): excel file names. Consumed as the workers go.
+            jobs (Optional[int]): Optional. Default os.cpu_count(). Number of worker processes.
+                1 processes the files in this process.
+            chunksize (int): Optional. Default 1. Number of paths sent to a worker at a time. Larger chunks cut
+                the overhead for many small files.
+            ordered (bool): Optional. Default True. Yield in the order of paths. False yields as soon as
+                each file is done.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            Iterator of (path, ExcelProcessingResult). The exception raised instead of the result
+            if processing the file failed.
+        """
+        options = dict(read_only=read_only, backend=backend, snapshot=snapshot, columnar=columnar)
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1:
+            yield from (_process_path(self, path, options) for path in paths)
+            return
+        with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(self, options)) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            yield from imap(_process_in_worker, paths, chunksize)
+
+    async def aprocess_excel(self, fname: ExcelSource, executor: Optional[Executor] = None,
+                             read_only: bool = False,
+                             backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                             snapshot: bool = False, columnar: bool = False) -> ExcelProcessingResult:
+        """process_excel off the event loop, in executor.
+        Cancelling the call cancels the work if it has not started yet; work already running finishes in
+        the executor and its result is dropped.
+
+        Args:
+            fname (ExcelSource): file name, xlsx content or seekable binary stream.
+                Streams can not be sent to a process pool.
+            executor (Optional[Executor]): Optional. Default the loop's default executor (threads).
+                A ProcessPoolExecutor sends this processor with every call.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            ExcelProcessingResult
+        """
+        # build the tasks here, not in every executor thread. A pickled processor rebuilds them, see __getstate__
+        self._static_processor()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(
+            self.process_excel, fname, read_only=read_only, backend=backend, snapshot=snapshot, columnar=columnar))
+
+    async def aprocess_many(self, sources: Union[Iterable[ExcelSource], AsyncIterable[ExcelSource]],
+                            executor: Optional[Executor] = None, concurrency: Optional[int] = None,
+                            ordered: bool = True, read_only: bool = False,
+                            backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                            snapshot: bool = False, columnar: bool = False
+                            ) -> AsyncIterator[Tuple[ExcelSource, Union[ExcelProcessingResult, BaseException]]]:
+        """Process many excel files in executor with at most concurrency files in flight.
+        Sources are read only as slots free up. Closing the iterator (await its aclose() after a break, or
+        contextlib.aclosing on Python 3.10+), or cancelling the task iterating, cancels the files in flight.
+        See aprocess_excel.
+
+        Args:
+            sources (Union[Iterable[ExcelSource], AsyncIterable[ExcelSource]]): file names or xlsx contents.
+            executor (Optional[Executor]): Optional. Default the loop's default executor. See aprocess_excel.
+            concurrency (Optional[int]): Optional. Default os.cpu_count(). Maximum number of files in flight.
+            ordered (bool): Optional. Default True. Yield in the order of sources. False yields as soon as
+                each file is done.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            Async iterator of (source, ExcelProcessingResult). The exception raised instead of the result
+            if processing the file failed, or asyncio.CancelledError if it was cancelled.
+        """
+        limit = concurrency or os.cpu_count() or 1
+        in_flight: Deque[Tuple[ExcelSource, asyncio.Future]] = deque()
+        try:
+            async for source in _async_iterate(sources):
+                in_flight.append((source, asyncio.ensure_future(self.aprocess_excel(
+                    source, executor, read_only=read_only, backend=backend, snapshot=snapshot, columnar=columnar))))
+                if len(in_flight) >= limit:
+                    yield await _next_done(in_flight, ordered)
+            while in_flight:
+                yield await _next_done(in_flight, ordered)
+        finally:
+            for _, future in in_flight:
+                future.cancel()
 
     def __str__(self) -> str:
         processor = self.deref(None)
         return str(processor)
 
 
+async def _async_iterate(sources: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if hasattr(sources, '__aiter__'):
+        async for source in sources:
+            yield source
+    else:
+        for source in sources:
+            yield source
+
+
+async def _next_done(in_flight: Deque[Tuple[T, asyncio.Future]], ordered: bool
+                     ) -> Tuple[T, Union[ExcelProcessingResult, BaseException]]:
+    """Wait for the first of in_flight (any of them if not ordered) and remove it. See ExcelProcessor.aprocess_many"""
+    futures = [in_flight[0][1]] if ordered else [future for _, future in in_flight]
+    await asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
+    for i, (source, future) in enumerate(in_flight):
+        if future.done():
+            del in_flight[i]
+            if future.cancelled():
+                return source, asyncio.CancelledError()
+            return source, future.exception() or future.result()
+
+
+# processor and process_excel options of this worker process. See ExcelProcessor.process_many
+_worker_processor: Optional[ExcelProcessor] = None
+_worker_options: Dict[str, Any] = {}
+
+
+def _init_worker(processor: Optional[ExcelProcessor], options: Dict[str, Any]):
+    global _worker_processor, _worker_options
+    _worker_processor, _worker_options = processor, options
+
+
+def _process_path(processor: ExcelProcessor, path: PathLike, options: Dict[str, Any]
+                  ) -> Tuple[PathLike, Union[ExcelProcessingResult, Exception]]:
+    try:
+        return path, processor.process_excel(os.fspath(path), **options)
+    except Exception as e:
+        return path, e
+
+
+def _process_in_worker(path: PathLike) -> Tuple[PathLike, Union[ExcelProcessingResult, Exception]]:
+    return _process_path(_worker_processor, path, _worker_options)
+
+
 @dataclass
 class ExcelProcessorFactory:
     locator_factory: LocatorFactory
@@ -190,6 +682,18 @@ class ExcelProcessorFactory:
             table_end_condition_factory=TableEndConditionFactory.default(extras=extra_table_end_conditions)
         )
 
+    def signature(self) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+        """
+
+        Returns:
+            Signatures of every factory. See BaseFactory.signature.
+        """
+        return (self.locator_factory.signature(),
+                self.assumption_factory.signature(),
+                self.parser_factory.signature(),
+                self.validator_factory.signature(),
+                self.table_end_condition_factory.signature())
+
     def create_extraction_task(
             self, spec: CellExtractionSpec) -> CellExtractionTask:
         try:
@@ -250,14 +754,53 @@ class ExcelProcessorFactory:
                               accept_only_visible_sheets=accept_only_visible_sheets)
 
     def create_from_template_excel(self,
-                                   fname: str,
+                                   fname: ExcelSource,
                                    sheet_name_checkers: Optional[SheetNameAliasCheckers] = None,
-                                   accept_only_visible_sheets: bool = False
+                                   accept_only_visible_sheets: bool = False,
+                                   template_cache: Optional[TemplateCache] = None
                                    ) -> ExcelProcessor:
-        workbook = openpyxl.load_workbook(fname, data_only=True)
-        return self.create_from_template_workbook(workbook,
-                                                  sheet_name_checkers=sheet_name_checkers,
-                                                  accept_only_visible_sheets=accept_only_visible_sheets)
+        """
+        Args:
+            fname (ExcelSource): template file name, xlsx content or seekable binary stream.
+            sheet_name_checkers (Optional[SheetNameAliasCheckers]): Optional. Default None. sheetname alias checker.
+            accept_only_visible_sheets (bool): Optional. Default False. Accept only visible sheets.
+            template_cache (Optional[TemplateCache]): Optional. Default None(no cache). Reuse the spec and
+                the tasks built from the same template content with the same registered actors.
+
+        Returns:
+            ExcelProcessor
+        """
+        if template_cache is None:
+            return self.create_from_spec(ExcelProcessorSpec.from_excel_template(fname, data_only=True),
+                                         sheet_name_checkers=sheet_name_checkers,
+                                         accept_only_visible_sheets=accept_only_visible_sheets)
+        key = template_cache.key(fname, self)
+        cached = template_cache.get(key, self)
+        if cached is None:
+            cached = self.create_from_spec(ExcelProcessorSpec.from_excel_template(fname, data_only=True))
+            template_cache.put(key, cached)
+        processor = self.create_from_spec(cached.spec,
+                                          sheet_name_checkers=sheet_name_checkers,
+                                          accept_only_visible_sheets=accept_only_visible_sheets)
+        processor._static = cached._static  # tasks built once for the template, see TemplateCache
+        return processor
+
+    def create_from_compiled_spec(self,
+                                  fname: str,
+                                  sheet_name_checkers: Optional[SheetNameAliasCheckers] = None,
+                                  accept_only_visible_sheets: bool = False) -> ExcelProcessor:
+        """
+        Args:
+            fname (str): compiled spec artifact. See exco compile and exco.extractor_spec.compiled_spec.
+            sheet_name_checkers (Optional[SheetNameAliasCheckers]): Optional. Default None. sheetname alias checker.
+            accept_only_visible_sheets (bool): Optional. Default False. Accept only visible sheets.
+
+        Returns:
+            ExcelProcessor
+        """
+        return self.create_from_spec(load_compiled_spec(fname),
+                                     sheet_name_checkers=sheet_name_checkers,
+                                     accept_only_visible_sheets=accept_only_visible_sheets)
 
     def create_from_template_workbook(
             self,
@@ -2,10 +2,10 @@ import re
 from dataclasses import dataclass
 
 from exco import CellLocation, util
+from exco.cell_source import as_workbook_source
 from exco.extractor.locator.locating_result import LocatingResult
 from exco.extractor.locator.locator import Locator
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
 
 @dataclass(frozen=True)
@@ -15,16 +15,15 @@ class BelowOfRegexLocator(Locator):
 
     def locate(self, anchor_cell_location: CellLocation,
                workbook: Workbook) -> LocatingResult:
-        sheet: Worksheet = workbook[anchor_cell_location.sheet_name]
+        sheet = as_workbook_source(workbook)[anchor_cell_location.sheet_name]
         compiled_regex = re.compile(self.regex)
-        for row in sheet.iter_rows():
-            for cell in row:
-                if compiled_regex.fullmatch(str(cell.value)) is not None:
-                    coord = util.get_bottommost_coordinate(sheet=sheet, cell=cell)
-                    cell_loc = CellLocation(
-                        sheet_name=anchor_cell_location.sheet_name,
-                        coordinate=util.shift_coord(coord.coordinate, (self.n, 0))
-                    )
-                    return LocatingResult.good(cell_loc)
+        cell = sheet.find(lambda value: compiled_regex.fullmatch(str(value)) is not None)
+        if cell is not None:
+            coord = util.get_bottommost_coordinate(sheet=sheet, cell=cell)
+            cell_loc = CellLocation(
+                sheet_name=anchor_cell_location.sheet_name,
+                coordinate=util.shift_coord(coord.coordinate, (self.n, 0))
+            )
+            return LocatingResult.good(cell_loc)
         return LocatingResult.bad(
             msg=f"Unable to find cell below of {self.regex}")
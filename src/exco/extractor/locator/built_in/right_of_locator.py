@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
 from exco import CellLocation, util
+from exco.cell_source import as_workbook_source
 from exco.extractor.locator.locating_result import LocatingResult
 from exco.extractor.locator.locator import Locator
 
@@ -15,15 +15,14 @@ class RightOfLocator(Locator):
 
     def locate(self, anchor_cell_location: CellLocation,
                workbook: Workbook) -> LocatingResult:
-        sheet: Worksheet = workbook[anchor_cell_location.sheet_name]
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value == self.label:
-                    coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
-                    cell_loc = CellLocation(
-                        sheet_name=anchor_cell_location.sheet_name,
-                        coordinate=util.shift_coord(coord.coordinate, (0, self.n))
-                    )
-                    return LocatingResult.good(cell_loc)
+        sheet = as_workbook_source(workbook)[anchor_cell_location.sheet_name]
+        cell = sheet.find_value(self.label)
+        if cell is not None:
+            coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
+            cell_loc = CellLocation(
+                sheet_name=anchor_cell_location.sheet_name,
+                coordinate=util.shift_coord(coord.coordinate, (0, self.n))
+            )
+            return LocatingResult.good(cell_loc)
         return LocatingResult.bad(
             msg=f"Unable to find cell to the right of {self.label}")
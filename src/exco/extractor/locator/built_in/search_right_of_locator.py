@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
 from exco import CellLocation, util
+from exco.cell_source import SheetSource, as_workbook_source
 from exco.extractor.locator.locating_result import LocatingResult
 from exco.extractor.locator.locator import Locator
 
@@ -15,21 +15,20 @@ class SearchRightOfLocator(Locator):
 
     def locate(self, anchor_cell_location: CellLocation,
                workbook: Workbook) -> LocatingResult:
-        sheet: Worksheet = workbook[anchor_cell_location.sheet_name]
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value == self.label:
-                    coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
-                    cell_cor = self._search_empty_col(coord.coordinate, sheet)
-                    cell_loc = CellLocation(
-                        sheet_name=anchor_cell_location.sheet_name,
-                        coordinate=cell_cor
-                    )
-                    return LocatingResult.good(cell_loc)
+        sheet = as_workbook_source(workbook)[anchor_cell_location.sheet_name]
+        cell = sheet.find_value(self.label)
+        if cell is not None:
+            coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
+            cell_cor = self._search_empty_col(coord.coordinate, sheet)
+            cell_loc = CellLocation(
+                sheet_name=anchor_cell_location.sheet_name,
+                coordinate=cell_cor
+            )
+            return LocatingResult.good(cell_loc)
         return LocatingResult.bad(
             msg=f"Unable to find cell to the right of {self.label}")
 
-    def _search_empty_col(self, cell_cor: str, sheet: Worksheet) -> str:
+    def _search_empty_col(self, cell_cor: str, sheet: SheetSource) -> str:
         for _ in range(0, self.max_empty_col_search):
             cell_cor = util.shift_coord(cell_cor, (0, 1))
             if sheet[cell_cor].value is not None:
@@ -4,9 +4,9 @@ from dataclasses import dataclass
 from openpyxl import Workbook
 
 from exco import CellLocation, util
+from exco.cell_source import SheetSource, as_workbook_source
 from exco.extractor.locator.locating_result import LocatingResult
 from exco.extractor.locator.locator import Locator
-from openpyxl.worksheet.worksheet import Worksheet
 
 
 @dataclass
@@ -16,22 +16,21 @@ class SearchRightOfRegexLocator(Locator):
 
     def locate(self, anchor_cell_location: CellLocation,
                workbook: Workbook) -> LocatingResult:
-        sheet: Worksheet = workbook[anchor_cell_location.sheet_name]
+        sheet = as_workbook_source(workbook)[anchor_cell_location.sheet_name]
         compiled_regex = re.compile(self.regex)
-        for row in sheet.iter_rows():
-            for cell in row:
-                if compiled_regex.fullmatch(str(cell.value)) is not None:
-                    coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
-                    cell_cor = self._search_empty_col(coord.coordinate, sheet)
-                    cell_loc = CellLocation(
-                                sheet_name=anchor_cell_location.sheet_name,
-                                coordinate=cell_cor
-                            )
-                    return LocatingResult.good(cell_loc)
+        cell = sheet.find(lambda value: compiled_regex.fullmatch(str(value)) is not None)
+        if cell is not None:
+            coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
+            cell_cor = self._search_empty_col(coord.coordinate, sheet)
+            cell_loc = CellLocation(
+                sheet_name=anchor_cell_location.sheet_name,
+                coordinate=cell_cor
+            )
+            return LocatingResult.good(cell_loc)
         return LocatingResult.bad(
             msg=f"Unable to find cell right of {self.regex}")
 
-    def _search_empty_col(self, cell_cor: str, sheet: Worksheet) -> str:
+    def _search_empty_col(self, cell_cor: str, sheet: SheetSource) -> str:
         for _ in range(0, self.max_empty_col_search):
             cell_cor = util.shift_coord(cell_cor, (0, 1))
             if sheet[cell_cor].value is not None:
@@ -2,9 +2,9 @@ from dataclasses import dataclass
 
 from openpyxl import Workbook
 from openpyxl.cell import Cell
-from openpyxl.worksheet.worksheet import Worksheet
 
 from exco import CellLocation, util
+from exco.cell_source import SheetSource, as_workbook_source
 from exco.extractor.locator.locating_result import LocatingResult
 from exco.extractor.locator.locator import Locator
 
@@ -21,21 +21,20 @@ class WithinLocator(Locator):
 
     def locate(self, anchor_cell_location: CellLocation,
                workbook: Workbook) -> LocatingResult:
-        sheet: Worksheet = workbook[anchor_cell_location.sheet_name]
+        sheet = as_workbook_source(workbook)[anchor_cell_location.sheet_name]
         if self.direction not in self.valid_directions:
             return LocatingResult.bad(
                 msg=f"Incorrect direction, must be one of the following {self.valid_directions}")
         if self.perform not in self.valid_directions:  # might be a better errors to throw here
             return LocatingResult.bad(
                 msg=f"Incorrect perform, must be one of the following {self.valid_directions}")
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value == self.label:
-                    return self._search_for_cell(sheet=sheet, cell=cell)
+        cell = sheet.find_value(self.label)
+        if cell is not None:
+            return self._search_for_cell(sheet=sheet, cell=cell)
         return LocatingResult.bad(
             msg=f"Unable to find cell with label {self.label}")
 
-    def _search_for_cell(self, sheet: Worksheet, cell: Cell) -> LocatingResult:
+    def _search_for_cell(self, sheet: SheetSource, cell: Cell) -> LocatingResult:
         found_cell = None
         if self.direction == "right_of":
             found_cell = util.search_right_of_scope(sheet=sheet, cell=cell, label=self.find)
@@ -47,7 +46,7 @@ class WithinLocator(Locator):
         cell_loc = self._get_cell(sheet=sheet, cell=found_cell)
         return LocatingResult.good(cell_loc)
 
-    def _get_cell(self, sheet: Worksheet, cell: Cell) -> CellLocation:
+    def _get_cell(self, sheet: SheetSource, cell: Cell) -> CellLocation:
         if self.perform == "right_of":
             coord = util.get_rightmost_coordinate(sheet=sheet, cell=cell)
             return CellLocation(
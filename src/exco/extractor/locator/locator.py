@@ -14,4 +14,13 @@ class Locator(Actor, abc.ABC):
     @abc.abstractmethod
     def locate(self, anchor_cell_location: CellLocation,
                workbook: Workbook) -> LocatingResult:
+        """
+        Args:
+            anchor_cell_location (CellLocation):
+            workbook (Workbook): WorkbookSource of the workbook being processed. Its sheets are SheetSource,
+                not openpyxl's Worksheet; see exco.cell_source.as_workbook_source and as_sheet_source.
+
+        Returns:
+            LocatingResult
+        """
         raise NotImplementedError()
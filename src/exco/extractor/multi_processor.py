@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import BinaryIO, List, Union
+
+from openpyxl import Workbook
+
+from exco.cell_source import as_workbook_source, with_snapshot
+from exco.extractor.excel_processor import ExcelProcessingResult, ExcelProcessor
+from exco.sheet_name_alias import SheetName
+from exco.workbook_loader import Buffer, ExcelSource, WorkbookBackend, load_workbook, open_excel_source
+
+
+@dataclass
+class MultiProcessor:
+    """Apply many processors (templates) to one workbook. The workbook is loaded once, with every sheet any of
+    the processors may use, and all processors read the same WorkbookSource. Per sheet caches, such as the value
+    index, the merged range index and the snapshots, are built once and shared.
+    """
+    processors: List[ExcelProcessor]
+
+    def process_workbook(self, workbook: Workbook, snapshot: bool = False,
+                         columnar: bool = False) -> List[ExcelProcessingResult]:
+        """
+        Args:
+            workbook (Workbook): openpyxl's Workbook or WorkbookSource.
+            snapshot (bool): Optional. Default False. See ExcelProcessor.process_workbook.
+            columnar (bool): Optional. Default False. See ExcelProcessor.process_workbook.
+
+        Returns:
+            List of ExcelProcessingResult, one for each of processors in the same order.
+        """
+        source = with_snapshot(workbook) if snapshot else as_workbook_source(workbook)
+        return [processor.process_workbook(source, columnar=columnar) for processor in self.processors]
+
+    def is_sheet_used(self, sheet_name: SheetName) -> bool:
+        """
+        Args:
+            sheet_name (SheetName): sheet name in to-be-extracted workbook.
+
+        Returns:
+            bool. True if any of processors may use the sheet. See ExcelProcessor.is_sheet_used.
+        """
+        return any(processor.is_sheet_used(sheet_name) for processor in self.processors)
+
+    def process_excel(self, fname: ExcelSource, read_only: bool = False,
+                      backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                      snapshot: bool = False, columnar: bool = False) -> List[ExcelProcessingResult]:
+        """Load excel file once and process it with every processor.
+
+        Args:
+            fname (ExcelSource): file name, xlsx content or seekable binary stream.
+            read_only (bool): Optional. Default False. See ExcelProcessor.process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See ExcelProcessor.process_excel.
+            snapshot (bool): Optional. Default False. See process_workbook.
+            columnar (bool): Optional. Default False. See process_workbook.
+
+        Returns:
+            List of ExcelProcessingResult, one for each of processors in the same order.
+        """
+        wb = load_workbook(fname, read_only=read_only, sheet_filter=self.is_sheet_used, backend=backend)
+        try:
+            return self.process_workbook(wb, snapshot=snapshot, columnar=columnar)
+        finally:
+            wb.close()
+
+    def process_bytes(self, data: Buffer, read_only: bool = False,
+                      backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                      snapshot: bool = False, columnar: bool = False) -> List[ExcelProcessingResult]:
+        """Process xlsx content in memory without copying it or writing it to disk.
+
+        Args:
+            data (Buffer): bytes, bytearray or memoryview of xlsx content.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            List of ExcelProcessingResult, one for each of processors in the same order.
+        """
+        return self.process_excel(open_excel_source(data), read_only=read_only, backend=backend, snapshot=snapshot,
+                                  columnar=columnar)
+
+    def process_stream(self, stream: BinaryIO, read_only: bool = False,
+                       backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL,
+                       snapshot: bool = False, columnar: bool = False) -> List[ExcelProcessingResult]:
+        """Process xlsx content from a seekable binary stream. The stream is not closed.
+
+        Args:
+            stream (BinaryIO): seekable binary stream. Ex: an uploaded file.
+            read_only (bool): Optional. Default False. See process_excel.
+            backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See process_excel.
+            snapshot (bool): Optional. Default False. See process_excel.
+            columnar (bool): Optional. Default False. See process_excel.
+
+        Returns:
+            List of ExcelProcessingResult, one for each of processors in the same order.
+        """
+        return self.process_excel(stream, read_only=read_only, backend=backend, snapshot=snapshot, columnar=columnar)
@@ -8,6 +8,7 @@ from exco.extractor.parser.built_in.value_parser import ValueParser
 
 @dataclass
 class DateParser(ValueParser[date]):
+    column_dtype = 'datetime64[D]'
 
     def parse_value(self, v: Any) -> date:
         if isinstance(v, datetime):
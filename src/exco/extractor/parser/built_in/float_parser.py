@@ -7,6 +7,7 @@ from exco.extractor.parser.built_in.value_parser import ValueParser
 
 @dataclass
 class FloatParser(ValueParser[float]):
+    column_dtype = 'float64'
 
     def parse_value(self, v: Any) -> float:
         try:
@@ -7,6 +7,7 @@ from exco.extractor.parser.built_in.value_parser import ValueParser
 
 @dataclass
 class IntParser(ValueParser[int]):
+    column_dtype = 'int64'
 
     def parse_value(self, v: Any) -> int:
         try:
@@ -11,6 +11,9 @@ T = TypeVar('T')
 
 
 class Parser(Actor, abc.ABC, Generic[T]):
+    column_dtype = 'object'
+    """numpy dtype of the column of a columnar table result. See exco.extractor.columnar_table_result"""
+
     @abc.abstractmethod
     def parse(self, cfp: CellFullPath, fallback: T) -> ParsingResult[T]:
         raise NotImplementedError()
@@ -0,0 +1,117 @@
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from exco.extractor.cell_extraction_task import CellExtractionTaskResult
+from exco.extractor.columnar_table_result import ColumnarTableResult
+from exco.extractor.table_extraction_task import TableExtractionTaskResult
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+if TYPE_CHECKING:
+    from exco.extractor.excel_processor import ExcelProcessingResult
+
+# column key -> (values, validity mask or None if every cell is ok)
+Columns = Dict[str, Tuple[Union['np.ndarray', List[Any]], Optional['np.ndarray']]]
+
+
+def _table_columns(result: Union[TableExtractionTaskResult, ColumnarTableResult]) -> Columns:
+    """Column data of a table. Arrays of a columnar result are passed as they are."""
+    if isinstance(result, ColumnarTableResult):
+        return {k: (column.values, None if column.is_ok else column.valid) for k, column in result.columns.items()}
+    keys = result.column_keys or (list(result.row_results[0].cell_results) if result.row_results else [])
+    return {k: _cell_columns([row.cell_results[k] for row in result.row_results]) for k in keys}
+
+
+def _cell_columns(cell_results: List[CellExtractionTaskResult]) -> Tuple[List[Any], Optional['np.ndarray']]:
+    values = [cr.get_value() if cr.is_ok else None for cr in cell_results]
+    valid = [cr.is_ok for cr in cell_results]
+    return values, None if all(valid) else np.array(valid, dtype=bool)
+
+
+# missing value of the numpy dtypes without a pandas masked array
+_MISSING = {'M': np.datetime64('NaT'), 'm': np.timedelta64('NaT')} if np is not None else {}
+
+
+def _columns(result: 'ExcelProcessingResult', cells_key: str) -> Dict[str, Columns]:
+    """Column data of every table, by table key, and of the cell results, as one row, under cells_key."""
+    if np is None:
+        raise ImportError('numpy is required to export results. Install it with pip install exco[numpy].')
+    ret = {}
+    for results in result.table_results.values():
+        for table_result in results:
+            if table_result.key == cells_key:
+                raise ValueError(f'Table key {table_result.key} is the same as cells_key. Pass another cells_key.')
+            ret[table_result.key] = _table_columns(table_result)
+    ret[cells_key] = {cr.key: _cell_columns([cr]) for crs in result.cell_results.values() for cr in crs}
+    return ret
+
+
+def _series(values: Union['np.ndarray', List[Any]], valid: Optional['np.ndarray']) -> Any:
+    if not isinstance(values, np.ndarray):
+        return pd.Series(values, dtype=object if valid is not None else None)  # failed cells are None
+    if valid is None:
+        return values
+    # failed cells are missing whatever placeholder (0, False, nan) their slot holds. Values are not copied
+    kind = values.dtype.kind
+    if kind in 'iu':
+        return pd.arrays.IntegerArray(values, ~valid)
+    if kind == 'b':
+        return pd.arrays.BooleanArray(values, ~valid)
+    if kind == 'f':
+        return pd.arrays.FloatingArray(values, ~valid)
+    return np.where(valid, values, _MISSING.get(kind))
+
+
+def to_dataframes(result: 'ExcelProcessingResult', cells_key: str = 'cells') -> Dict[str, 'pd.DataFrame']:
+    """Build a pandas DataFrame for each table from its column data, without going through a dict per row.
+    Columns of columnar table results (see ExcelProcessor.process_excel) are used without copying.
+    Failed cells are missing values whatever the dtype of the column (int, bool and float columns
+    become pandas nullable arrays). A table without row keeps its columns.
+
+    Args:
+        result (ExcelProcessingResult):
+        cells_key (str): Optional. Default cells. Key of the single row frame of the cell results.
+
+    Returns:
+        Dict of table key (and cells_key) to DataFrame.
+    """
+    if pd is None:
+        raise ImportError('pandas is required for to_dataframes. Install it with pip install exco[pandas].')
+    return {key: pd.DataFrame({k: _series(values, valid) for k, (values, valid) in columns.items()}, copy=False)
+            for key, columns in _columns(result, cells_key).items()}
+
+
+def _arrow_array(values: Union['np.ndarray', List[Any]], valid: Optional['np.ndarray']) -> 'pa.Array':
+    mask = None if valid is None else ~valid
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return pa.array(values, mask=mask)  # numbers without failure are not copied. datetime64[D] is date32
+    return pa.array(list(values), mask=mask)
+
+
+def to_arrow(result: 'ExcelProcessingResult', cells_key: str = 'cells') -> Dict[str, 'pa.RecordBatch']:
+    """Build an Arrow RecordBatch for each table from its column data. See to_dataframes.
+
+    Args:
+        result (ExcelProcessingResult):
+        cells_key (str): Optional. Default cells. Key of the single row batch of the cell results.
+
+    Returns:
+        Dict of table key (and cells_key) to RecordBatch.
+    """
+    if pa is None:
+        raise ImportError('pyarrow is required for to_arrow. Install it with pip install exco[arrow].')
+    return {key: pa.RecordBatch.from_arrays([_arrow_array(values, valid) for values, valid in columns.values()],
+                                            names=list(columns))
+            for key, columns in _columns(result, cells_key).items()}
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from exco.extractor.table_end_conditions.table_end_condition_param import TableEndConditionParam
 from exco.extractor.table_end_conditions.table_end_condition_result import TableEndConditionResult
 from exco.extractor.table_end_conditions.table_end_condition import TableEndCondition
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class AllBlankTableEndCondition(TableEndCondition):
@@ -25,3 +29,10 @@ class AllBlankTableEndCondition(TableEndCondition):
             should_terminate=all_blanks,
             is_inclusive=False
         )
+
+    def test_many(self, values: 'np.ndarray', row_counts: 'np.ndarray', blank: Optional['np.ndarray'] = None,
+                  numeric: Optional[Tuple['np.ndarray', 'np.ndarray']] = None) -> Optional['np.ndarray']:
+        if blank is None:
+            import numpy as np
+            blank = np.equal(values, None)
+        return blank.all(axis=1)
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
+from numbers import Number
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from exco.extractor.table_end_conditions.table_end_condition_param import TableEndConditionParam
 from exco.extractor.table_end_conditions.table_end_condition_result import TableEndConditionResult
 from exco.extractor.table_end_conditions.table_end_condition import TableEndCondition
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class CellValueTableEndCondition(TableEndCondition):
@@ -22,3 +27,20 @@ class CellValueTableEndCondition(TableEndCondition):
             if matching_cell_value:
                 break
         return matching_cell_value
+
+    def test_many(self, values: 'np.ndarray', row_counts: 'np.ndarray', blank: Optional['np.ndarray'] = None,
+                  numeric: Optional[Tuple['np.ndarray', 'np.ndarray']] = None) -> Optional['np.ndarray']:
+        if blank is None or numeric is None:
+            return (values == self.cell_value).any(axis=1)
+        if self.cell_value is None:
+            return blank.any(axis=1)
+        import numpy as np
+        numbers, is_number = numeric
+        # numbers only equal numbers (and booleans), so the object comparison is left for the other cells
+        if isinstance(self.cell_value, Number):
+            matches = is_number & (numbers == self.cell_value)
+        else:
+            matches = np.zeros(values.shape, dtype=bool)
+        rest = ~(blank | is_number)
+        matches[rest] = np.asarray(values[rest] == self.cell_value, dtype=bool)
+        return matches.any(axis=1)
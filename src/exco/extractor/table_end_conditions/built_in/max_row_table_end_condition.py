@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
 
 from exco.extractor.table_end_conditions.table_end_condition_param import TableEndConditionParam
 from exco.extractor.table_end_conditions.table_end_condition_result import TableEndConditionResult
 from exco.extractor.table_end_conditions.table_end_condition import TableEndCondition
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class MaxRowTableEndCondition(TableEndCondition):
@@ -27,3 +31,9 @@ class MaxRowTableEndCondition(TableEndCondition):
             should_terminate=max_row_reached,
             is_inclusive=self.inclusive
         )
+
+    def passing_result(self) -> TableEndConditionResult:
+        return TableEndConditionResult.good(should_terminate=False, is_inclusive=self.inclusive)
+
+    def test_many(self, values: 'np.ndarray', row_counts: 'np.ndarray') -> Optional['np.ndarray']:
+        return row_counts >= self.n
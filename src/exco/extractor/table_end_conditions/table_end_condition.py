@@ -1,9 +1,13 @@
 import abc
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from exco.extractor.actor import Actor
 from exco.extractor.table_end_conditions.table_end_condition_param import TableEndConditionParam
 from exco.extractor.table_end_conditions.table_end_condition_result import TableEndConditionResult
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class TableEndCondition(Actor, abc.ABC):
     """Abstract class for TableEndCondition"""
@@ -12,3 +16,35 @@ class TableEndCondition(Actor, abc.ABC):
     def test(self, param: TableEndConditionParam) -> TableEndConditionResult:
         """abstract method on how each implementation decides where the table should end"""
         raise NotImplementedError()
+
+    def passing_result(self) -> TableEndConditionResult:
+        """Result test returns for a row the condition does not terminate at. It stands for test on the rows
+        test_many passes. Conditions whose test returns another is_inclusive for those rows override this.
+
+        Returns:
+            TableEndConditionResult
+        """
+        return TableEndConditionResult.good(should_terminate=False, is_inclusive=False)
+
+    def test_many(self, values: 'np.ndarray', row_counts: 'np.ndarray', blank: Optional['np.ndarray'] = None,
+                  numeric: Optional[Tuple['np.ndarray', 'np.ndarray']] = None) -> Optional['np.ndarray']:
+        """Vectorized test over a block of table rows. The table uses it, when numpy is available, to find
+        the terminating row without building a TableEndConditionParam for every row.
+        It must agree with test: the terminating row is then tested again with test. It is only used when
+        the class defining it also defines test, so a subclass overriding test alone is tested row by row.
+
+        Args:
+            values (np.ndarray): 2-D object array. values[i, j] is the value of column j (in the order of
+                the table's columns) of the i-th row of the block. Blank cells are None.
+            row_counts (np.ndarray): 1-D int array. row count (see TableEndConditionParam) of each row.
+            blank (Optional[np.ndarray]): Optional. Boolean array, True where values is None. Given when the
+                table is read from a workbook snapshot (see SheetSnapshot.null_mask) and only to overrides
+                declaring blank and numeric.
+            numeric (Optional[Tuple[np.ndarray, np.ndarray]]): Optional. float64 array and boolean mask of the
+                numeric values, given with blank. See SheetSnapshot.numeric_view.
+
+        Returns:
+            Boolean array, True where the condition terminates the table. None if the condition can only be
+            tested row by row. Default None.
+        """
+        return None
@@ -1,11 +1,17 @@
+import functools
+import inspect
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Type, Union
 
 from exco import CellLocation
+from exco.cell_full_path import CellFullPath
 from exco.cell_location import CellOffset
+from exco.cell_source import AliasedSheetSource, SheetSource, SnapshotSheetSource, WindowCell, as_workbook_source
 from exco.exception import TooManyRowRead, NoEndConditionError
+from exco.extractor.locator.built_in.at_comment_cell_locator import AtCommentCellLocator
 from exco.extractor.locator.locator import Locator
 from exco.extractor.cell_extraction_task import CellExtractionTaskResult, CellExtractionTask
+from exco.extractor.columnar_table_result import ColumnarTableBuilder, ColumnarTableResult
 from exco.extractor.locator.locating_result import LocatingResult
 from exco.extractor.table_end_conditions.built_in.all_blank_table_end_condition import AllBlankTableEndCondition
 from exco.extractor.table_end_conditions.table_end_condition import TableEndCondition
@@ -16,6 +22,11 @@ from exco.extractor_spec.table_extraction_spec import TableItemDirection, TableE
 from openpyxl import Workbook
 from exco import setting as st
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 @dataclass
 class EndConditionCollectionResult:
@@ -49,6 +60,23 @@ class EndConditionCollectionResult:
             ecr.should_terminate and ecr.is_inclusive for ecr in self.end_condition_results)
 
 
+@functools.lru_cache(maxsize=None)
+def _vectorizes_test(cls: Type[TableEndCondition]) -> bool:
+    """True if test_many of cls can stand for its test: both come from the same class. A subclass overriding
+    only test would otherwise be tested with the test_many of its parent.
+    """
+    def owner(name: str) -> type:
+        return next(c for c in cls.__mro__ if name in c.__dict__)
+    return owner('test_many') is owner('test')
+
+
+@functools.lru_cache(maxsize=None)
+def _takes_views(cls: Type[TableEndCondition]) -> bool:
+    """True if test_many of cls accepts the blank and numeric views of a snapshot. See TableEndCondition.test_many"""
+    parameters = inspect.signature(cls.test_many).parameters
+    return 'blank' in parameters and 'numeric' in parameters
+
+
 @dataclass
 class EndConditionCollection:
     """Collection of End Condition.
@@ -64,6 +92,42 @@ class EndConditionCollection:
                                    for ec in self.end_conditions]
         )
 
+    def test_many(self, values: 'np.ndarray', row_counts: 'np.ndarray', blank: Optional['np.ndarray'] = None,
+                  numeric: Optional[Tuple['np.ndarray', 'np.ndarray']] = None) -> Optional['np.ndarray']:
+        """Vectorized test over a block of table rows. See TableEndCondition.test_many.
+
+        Args:
+            values (np.ndarray): 2-D object array. values[i, j] is the value of column j of the i-th row.
+            row_counts (np.ndarray): 1-D int array. row count of each row.
+            blank (Optional[np.ndarray]): Optional. Null mask of values, from a snapshot.
+            numeric (Optional[Tuple[np.ndarray, np.ndarray]]): Optional. Numeric view of values, from a snapshot.
+
+        Returns:
+            Boolean array, True where any end condition terminates the table.
+            None if any end condition can only be tested row by row.
+        """
+        ret = np.zeros(len(row_counts), dtype=bool)
+        for ec in self.end_conditions:
+            if not _vectorizes_test(type(ec)):
+                return None
+            if blank is not None and _takes_views(type(ec)):
+                terminates = ec.test_many(values, row_counts, blank=blank, numeric=numeric)
+            else:
+                terminates = ec.test_many(values, row_counts)
+            if terminates is None:
+                return None
+            ret |= terminates
+        return ret
+
+    def passing_result(self) -> EndConditionCollectionResult:
+        """
+        Returns:
+            EndConditionCollectionResult of a row no end condition terminates at.
+        """
+        return EndConditionCollectionResult(
+            end_condition_results=[ec.passing_result() for ec in self.end_conditions]
+        )
+
     @classmethod
     def from_spec(
             cls,
@@ -101,6 +165,7 @@ class TableExtractionTaskResult:
     row_results: List[RowExtractionTaskResult] = field(default_factory=list)
     end_condition_results: List[EndConditionCollectionResult] = field(
         default_factory=list)
+    column_keys: List[str] = field(default_factory=list)  # keys of the columns, also when there is no row
 
     @property
     def is_ok(self):
@@ -187,24 +252,188 @@ class TableExtractionTask:
         return {cet.key: key_cell.shift(offset) for offset, cet in self.columns.items()}
 
     def process(self, anchor_cell_location: CellLocation,
-                workbook: Workbook) -> TableExtractionTaskResult:
+                workbook: Workbook,
+                columnar: bool = False) -> Union[TableExtractionTaskResult, ColumnarTableResult]:
         """ Extract table from work book as if the anchor location is at anchor_cell_location
 
         Args:
             anchor_cell_location (CellLocation):
             workbook (Workbook):
+            columnar (bool): Optional. Default False. Return ColumnarTableResult, one typed numpy array per
+                column, instead of a result per row. Requires numpy.
 
         Returns:
-
+            TableExtractionTaskResult. ColumnarTableResult if columnar.
         """
+        builder = ColumnarTableBuilder(list(self.columns.values())) if columnar else None
         locating_result = self.locator.locate(anchor_cell_location, workbook)
 
         if locating_result.is_ok:
             anchor_cell_location = locating_result.location
+        elif columnar:
+            return ColumnarTableResult.fail_locating_result(key=self.key, locating_result=locating_result)
         else:
             return TableExtractionTaskResult.fail_locating_result(
                 key=self.key, locating_result=locating_result)
 
+        if self._can_read_windows(anchor_cell_location):
+            return self._process_windows(locating_result, workbook, builder)
+        return self._process_cells(locating_result, workbook, builder)
+
+    def _table_result(self, locating_result: LocatingResult, row_results: List[RowExtractionTaskResult],
+                      end_condition_results: List[EndConditionCollectionResult],
+                      builder: Optional[ColumnarTableBuilder]) -> Union[TableExtractionTaskResult, ColumnarTableResult]:
+        if builder is not None:
+            return builder.build(self.key, locating_result, end_condition_results)
+        return TableExtractionTaskResult(
+            key=self.key,
+            locating_result=locating_result,
+            row_results=row_results,
+            end_condition_results=end_condition_results,
+            column_keys=[cet.key for cet in self.columns.values()]
+        )
+
+    def _can_read_windows(self, anchor_cell_location: CellLocation) -> bool:
+        # every column task reads the cell at its offset and the whole table is inside the sheet
+        return bool(self.columns) and \
+            all(isinstance(cet.locator, AtCommentCellLocator) for cet in self.columns.values()) and \
+            anchor_cell_location.row + min(offset.row for offset in self.columns) >= 1 and \
+            anchor_cell_location.col + min(offset.col for offset in self.columns) >= 1
+
+    def _process_windows(self, locating_result: LocatingResult, workbook: Workbook,
+                         builder: Optional[ColumnarTableBuilder] = None
+                         ) -> Union[TableExtractionTaskResult, ColumnarTableResult]:
+        """Same as _process_cells but the values of the column cells are read in bulk, a window of items
+        at a time, with SheetSource.iter_values. Windows start small and double up to
+        setting.table_window_size items so short tables do not read far past their end.
+
+        With numpy, the end conditions are tested on the whole window at once (see EndConditionCollection.test_many)
+        and only the terminating row, and rows with a hyperlink in a blank cell, are tested with
+        TableEndConditionParam.
+
+        Rows are collected by builder if given. See process.
+        """
+        anchor = locating_result.location
+        source = as_workbook_source(workbook)
+        sheet = source[anchor.sheet_name]
+        downward = self.item_direction == TableItemDirection.DOWNWARD
+        columns = [(offset, cet) for offset, cet in self.columns.items()]
+        passing = self.end_condition.passing_result()
+        snapshot_sheet = sheet.source if isinstance(sheet, AliasedSheetSource) else sheet
+
+        item = 0
+        window_size = st.table_initial_window_size
+        should_terminate = False
+        row_results = []
+        end_condition_results = []
+        while not should_terminate:
+            row_counts = None if np is None else np.arange(item + 1, item + window_size + 1)
+            terminates = None
+            if isinstance(snapshot_sheet, SnapshotSheetSource):
+                # gathered from the snapshot arrays, with their null mask and numeric view for the end conditions
+                rows, cols = self._window_indices(anchor, row_counts - 1)
+                values, blank, numeric = snapshot_sheet.snapshot.window(rows, cols)
+                items = values.tolist()
+                terminates = self.end_condition.test_many(values, row_counts, blank=blank, numeric=numeric)
+            else:
+                items = self._read_window(sheet, anchor, item, window_size)
+                if np is not None:
+                    values = np.empty((window_size, len(columns)), dtype=object)
+                    values[:] = items
+                    terminates = self.end_condition.test_many(values, row_counts)
+            for i, item_values in enumerate(items):
+                irow = item + i + 1
+                if irow >= st.table_infinite_loop_guard:
+                    raise TooManyRowRead(
+                        f'setting.table_infinite_loop_guard ({st.table_infinite_loop_guard}) reached')
+                key_row, key_col = (anchor.row + irow - 1, anchor.col) if downward \
+                    else (anchor.row, anchor.col + irow - 1)
+
+                cfps = {}
+                all_window_cells = True
+                for (offset, cet), value in zip(columns, item_values):
+                    cell = sheet.window_cell(key_row + offset.row, key_col + offset.col, value)
+                    all_window_cells = all_window_cells and isinstance(cell, WindowCell)
+                    cfps[cet.key] = CellFullPath(workbook=source, sheet=sheet, cell=cell)
+
+                # Test end condition. A blank cell with a hyperlink has the link as value so the window can not tell.
+                if terminates is None or terminates[i] or not all_window_cells:
+                    ec_results = self.end_condition.test(TableEndConditionParam(row_count=irow, cfps=cfps))
+                else:
+                    ec_results = passing
+                end_condition_results.append(ec_results)
+                if ec_results.should_terminate_exclusively():
+                    should_terminate = True
+                    break
+
+                # parse
+                cell_results = []
+                for offset, cet in columns:
+                    location = CellLocation(anchor.sheet_name, row=key_row + offset.row, col=key_col + offset.col)
+                    cell_results.append(cet.process_located(LocatingResult.good(location), cfps[cet.key]))
+                if builder is None:
+                    row_results.append(RowExtractionTaskResult(
+                        {cr.key: cr for cr in cell_results}
+                    ))
+                else:
+                    builder.add_row(cell_results)
+                if ec_results.should_terminate_inclusively():
+                    should_terminate = True
+                    break
+
+            item += window_size
+            window_size = min(window_size * 2, st.table_window_size)
+
+        return self._table_result(locating_result, row_results, end_condition_results, builder)
+
+    def _window_indices(self, anchor: CellLocation, items: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+        """Row and column numbers of the column cells of items (0 is the anchor item), in the order of
+        self.columns. See SheetSnapshot.window.
+        """
+        offsets = list(self.columns)
+        row_offsets = np.array([offset.row for offset in offsets])
+        col_offsets = np.array([offset.col for offset in offsets])
+        shape = (len(items), len(offsets))
+        items = items[:, None]
+        if self.item_direction == TableItemDirection.DOWNWARD:
+            return anchor.row + items + row_offsets, np.broadcast_to(anchor.col + col_offsets, shape)
+        return np.broadcast_to(anchor.row + row_offsets, shape), anchor.col + items + col_offsets
+
+    def _read_window(self, sheet: SheetSource, anchor: CellLocation, item: int, size: int) -> List[Sequence[Any]]:
+        """Read the column values of size items starting from item (0 is the anchor item).
+
+        Args:
+            sheet (SheetSource):
+            anchor (CellLocation): location of the key cell of the first item.
+            item (int): index of the first item to read.
+            size (int): number of items.
+
+        Returns:
+            List of the values of each item, in the order of self.columns.
+        """
+        offsets = list(self.columns)
+        min_dr = min(offset.row for offset in offsets)
+        max_dr = max(offset.row for offset in offsets)
+        min_dc = min(offset.col for offset in offsets)
+        max_dc = max(offset.col for offset in offsets)
+        last = item + size - 1
+        if self.item_direction == TableItemDirection.DOWNWARD:
+            window = list(sheet.iter_values(anchor.row + item + min_dr, anchor.row + last + max_dr,
+                                            anchor.col + min_dc, anchor.col + max_dc))
+            return [tuple(window[i + offset.row - min_dr][offset.col - min_dc] for offset in offsets)
+                    for i in range(size)]
+        window = list(sheet.iter_values(anchor.row + min_dr, anchor.row + max_dr,
+                                        anchor.col + item + min_dc, anchor.col + last + max_dc))
+        return [tuple(window[offset.row - min_dr][i + offset.col - min_dc] for offset in offsets)
+                for i in range(size)]
+
+    def _process_cells(self, locating_result: LocatingResult, workbook: Workbook,
+                       builder: Optional[ColumnarTableBuilder] = None
+                       ) -> Union[TableExtractionTaskResult, ColumnarTableResult]:
+        """Extract the table cell by cell, running each column task (locator included) for every item.
+        Rows are collected by builder if given. See process.
+        """
+        anchor_cell_location = locating_result.location
         irow = 0
         should_terminate = False
         key_cell = anchor_cell_location
@@ -231,18 +460,16 @@ class TableExtractionTask:
             for offset, cet in self.columns.items():
                 cell_cl = key_cell.shift(offset)
                 cell_results.append(cet.process(cell_cl, workbook))
-            row_results.append(RowExtractionTaskResult(
-                {cr.key: cr for cr in cell_results}
-            ))
+            if builder is None:
+                row_results.append(RowExtractionTaskResult(
+                    {cr.key: cr for cr in cell_results}
+                ))
+            else:
+                builder.add_row(cell_results)
             if ec_results.should_terminate_inclusively():
                 break
 
             # shift
             key_cell = self.shift_item_direction(key_cell)
 
-        return TableExtractionTaskResult(
-            key=self.key,
-            locating_result=locating_result,
-            row_results=row_results,
-            end_condition_results=end_condition_results
-        )
+        return self._table_result(locating_result, row_results, end_condition_results, builder)
@@ -0,0 +1,242 @@
+"""Versioned, serialized form of a compiled ExcelProcessorSpec.
+
+The artifact is plain JSON. Loading it only needs the standard library: the template is not opened
+and no exco block is parsed as YAML. Every spec keeps where it came from (sheet, cell and the raw block)
+so errors raised by a processor built from the artifact still point at the template.
+"""
+import datetime
+import json
+from typing import Any, Dict, List, Optional
+
+from exco.__version__ import version
+from exco.cell_location import CellLocation, CellOffset
+from exco.exception import CompiledSpecFormatError
+from exco.extractor_spec.apv_spec import APVSpec
+from exco.extractor_spec.assumption_spec import AssumptionSpec
+from exco.extractor_spec.cell_extraction_spec import CellExtractionSpec
+from exco.extractor_spec.excel_processor_spec import ExcelProcessorSpec
+from exco.extractor_spec.locator_spec import LocatorSpec
+from exco.extractor_spec.parser_spec import ParserSpec
+from exco.extractor_spec.spec_source import CompiledSpecSource, SpecSource, UnknownSource
+from exco.extractor_spec.table_extraction_spec import TableEndConditionSpec, TableExtractionSpec, TableItemDirection
+from exco.extractor_spec.validator_spec import ValidatorSpec
+
+format_name = 'exco-compiled-spec'
+format_version = 1
+
+_tagged_types = {
+    '$datetime': (datetime.datetime, datetime.datetime.fromisoformat),
+    '$date': (datetime.date, datetime.date.fromisoformat),
+    '$time': (datetime.time, datetime.time.fromisoformat),
+}
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a YAML value (fallback, params, metadata) to JSON. Values JSON can not represent
+    (dates, non string keys, tuples, ...) are written as single key objects tagged with $.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_encode_value(v) for v in value]
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and not (len(value) == 1 and next(iter(value)).startswith('$')):
+            return {k: _encode_value(v) for k, v in value.items()}
+        return {'$items': [[_encode_value(k), _encode_value(v)] for k, v in value.items()]}
+    for tag, (clz, _) in _tagged_types.items():  # datetime before date since datetime is a date
+        if isinstance(value, clz):
+            return {tag: value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {'$timedelta': value.total_seconds()}
+    if isinstance(value, tuple):
+        return {'$tuple': [_encode_value(v) for v in value]}
+    raise CompiledSpecFormatError(f'Unable to compile value {value!r} of type {type(value).__name__}.')
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        tag, encoded = next(iter(value.items()))
+        if tag in _tagged_types:
+            return _tagged_types[tag][1](encoded)
+        if tag == '$timedelta':
+            return datetime.timedelta(seconds=encoded)
+        if tag == '$tuple':
+            return tuple(_decode_value(v) for v in encoded)
+        if tag == '$items':
+            return {_decode_value(k): _decode_value(v) for k, v in encoded}
+    return {k: _decode_value(v) for k, v in value.items()}
+
+
+def _encode_source(source: SpecSource) -> Optional[Dict[str, Any]]:
+    from exco.exco_template.exco_template import ExcoBlockWithLocation
+    if isinstance(source, UnknownSource):
+        return None
+    d: Dict[str, Any] = {'description': source.describe()}
+    if isinstance(source, CompiledSpecSource):
+        d.update(sheet_name=source.sheet_name, coordinate=source.coordinate,
+                 start_line=source.start_line, end_line=source.end_line)
+    elif isinstance(source, ExcoBlockWithLocation):
+        d.update(sheet_name=source.cell_location.sheet_name, coordinate=source.cell_location.coordinate,
+                 start_line=source.exco_block.start_line, end_line=source.exco_block.end_line)
+    return d
+
+
+def _decode_source(d: Optional[Dict[str, Any]]) -> SpecSource:
+    if d is None:
+        return UnknownSource()
+    return CompiledSpecSource(**d)
+
+
+def _encode_name_params(spec: Any) -> Dict[str, Any]:
+    return {'name': spec.name, 'params': _encode_value(spec.params)}
+
+
+def _encode_apv(apv: APVSpec) -> Dict[str, Any]:
+    return {
+        'key': apv.key,
+        'parser': _encode_name_params(apv.parser),
+        'fallback': _encode_value(apv.fallback),
+        'validations': {k: _encode_name_params(v) for k, v in apv.validations.items()},
+        'assumptions': {k: _encode_name_params(v) for k, v in apv.assumptions.items()},
+        'metadata': _encode_value(apv.metadata),
+        'source': _encode_source(apv.source),
+    }
+
+
+def _decode_apv(d: Dict[str, Any]) -> APVSpec:
+    return APVSpec(
+        key=d['key'],
+        parser=ParserSpec(name=d['parser']['name'], params=_decode_value(d['parser']['params'])),
+        fallback=_decode_value(d['fallback']),
+        validations={k: ValidatorSpec(name=v['name'], params=_decode_value(v['params']))
+                     for k, v in d['validations'].items()},
+        assumptions={k: AssumptionSpec(name=v['name'], params=_decode_value(v['params']))
+                     for k, v in d['assumptions'].items()},
+        metadata=_decode_value(d['metadata']),
+        source=_decode_source(d['source'])
+    )
+
+
+def _encode_cell_spec(spec: CellExtractionSpec) -> Dict[str, Any]:
+    return {
+        'apv': _encode_apv(spec.apv),
+        'locator': _encode_name_params(spec.locator),
+        'source': _encode_source(spec.source),
+    }
+
+
+def _decode_cell_spec(d: Dict[str, Any]) -> CellExtractionSpec:
+    return CellExtractionSpec(
+        apv=_decode_apv(d['apv']),
+        locator=LocatorSpec(name=d['locator']['name'], params=_decode_value(d['locator']['params'])),
+        source=_decode_source(d['source'])
+    )
+
+
+def _encode_table_spec(spec: TableExtractionSpec) -> Dict[str, Any]:
+    return {
+        'key': spec.key,
+        'locator': _encode_name_params(spec.locator),
+        'columns': [{'row': offset.row, 'col': offset.col, 'apv': _encode_apv(apv)}
+                    for offset, apv in spec.columns.items()],
+        'end_conditions': [_encode_name_params(ec) for ec in spec.end_conditions],
+        'item_direction': spec.item_direction.value,
+        'source': _encode_source(spec.source),
+    }
+
+
+def _decode_table_spec(d: Dict[str, Any]) -> TableExtractionSpec:
+    return TableExtractionSpec(
+        key=d['key'],
+        locator=LocatorSpec(name=d['locator']['name'], params=_decode_value(d['locator']['params'])),
+        columns={CellOffset(row=c['row'], col=c['col']): _decode_apv(c['apv']) for c in d['columns']},
+        end_conditions=[TableEndConditionSpec(name=ec['name'], params=_decode_value(ec['params']))
+                        for ec in d['end_conditions']],
+        item_direction=TableItemDirection(d['item_direction']),
+        source=_decode_source(d['source'])
+    )
+
+
+def _encode_locations(specs: Dict[CellLocation, List[Any]], encode: Any) -> List[Dict[str, Any]]:
+    return [{'sheet_name': cl.sheet_name, 'coordinate': cl.coordinate, 'specs': [encode(s) for s in ss]}
+            for cl, ss in specs.items()]
+
+
+def _decode_locations(entries: List[Dict[str, Any]], decode: Any) -> Dict[CellLocation, List[Any]]:
+    return {CellLocation(sheet_name=e['sheet_name'], coordinate=e['coordinate']): [decode(s) for s in e['specs']]
+            for e in entries}
+
+
+def spec_to_dict(spec: ExcelProcessorSpec) -> Dict[str, Any]:
+    """
+    Args:
+        spec (ExcelProcessorSpec): spec compiled from a template. See ExcelProcessorSpec.from_workbook_template.
+
+    Returns:
+        JSON serializable dict of the versioned artifact.
+    """
+    return {
+        'format': format_name,
+        'format_version': format_version,
+        'exco_version': version,
+        'cell_specs': _encode_locations(spec.cell_specs, _encode_cell_spec),
+        'table_specs': _encode_locations(spec.table_specs, _encode_table_spec),
+    }
+
+
+def spec_from_dict(d: Dict[str, Any]) -> ExcelProcessorSpec:
+    """
+    Args:
+        d (Dict[str, Any]): artifact. See spec_to_dict.
+
+    Returns:
+        ExcelProcessorSpec
+
+    Raises:
+        CompiledSpecFormatError: if d is not a compiled spec or its format version is not supported.
+    """
+    if not isinstance(d, dict) or d.get('format') != format_name:
+        raise CompiledSpecFormatError('Not an exco compiled spec.')
+    if d.get('format_version') != format_version:
+        raise CompiledSpecFormatError(
+            f'Compiled spec format version {d.get("format_version")} is not supported. '
+            f'Supported version is {format_version}. Recompile the template with exco {version}.')
+    try:
+        return ExcelProcessorSpec(
+            cell_specs=_decode_locations(d['cell_specs'], _decode_cell_spec),
+            table_specs=_decode_locations(d['table_specs'], _decode_table_spec)
+        )
+    except (LookupError, TypeError, ValueError) as e:
+        raise CompiledSpecFormatError('Malformed compiled spec.') from e
+
+
+def dump_compiled_spec(spec: ExcelProcessorSpec, fname: str):
+    """Write spec as a compiled spec artifact.
+
+    Args:
+        spec (ExcelProcessorSpec):
+        fname (str): output file name.
+    """
+    with open(fname, 'w', encoding='utf-8') as f:
+        json.dump(spec_to_dict(spec), f, ensure_ascii=False, indent=1)
+
+
+def load_compiled_spec(fname: str) -> ExcelProcessorSpec:
+    """Read a compiled spec artifact written by dump_compiled_spec (or exco compile).
+
+    Args:
+        fname (str): artifact file name.
+
+    Returns:
+        ExcelProcessorSpec
+    """
+    with open(fname, encoding='utf-8') as f:
+        try:
+            d = json.load(f)
+        except ValueError as e:
+            raise CompiledSpecFormatError(f'{fname} is not an exco compiled spec.') from e
+    return spec_from_dict(d)
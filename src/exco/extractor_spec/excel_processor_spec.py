@@ -1,12 +1,14 @@
 from dataclasses import dataclass
 from itertools import chain
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Optional, Set, Tuple, Union
 
 from exco import util
 from exco.cell_location import CellLocation
-from exco.dereferator import Dereferator
+from exco.cell_source import WorkbookSource, XmlWorkbookSource
+from exco.dereferator import Dereferator, Plans, ReferenceProbe
 from exco.extractor_spec.cell_extraction_spec import CellExtractionSpec
 from exco.extractor_spec.table_extraction_spec import TableExtractionSpec
+from exco.workbook_loader import ExcelSource, open_excel_source
 from openpyxl import Workbook, load_workbook
 
 
@@ -52,6 +54,33 @@ class ExcelProcessorSpec:
         """
         return self._deref(workbook, Dereferator.spec_to_extractor)
 
+    def extract_time_references(self, plans: Optional[Plans] = None
+                                ) -> Tuple[Dict[Tuple[CellLocation, int], Tuple[str, ...]],
+                                           Dict[Tuple[CellLocation, int], Tuple[str, ...]]]:
+        """Find the specs containing extraction time references (==A1==) and the cells they depend on.
+        Only those specs need spec_to_extractor_deref for each extracted workbook.
+
+        Args:
+            plans (Optional[Plans]): Optional. Default None. Filled with the interpolation plan of every string
+                of the specs, split at the references, so derefing them for each workbook does no regex work.
+                See Dereferator.plans.
+
+        Returns:
+            Tuple of dict of (anchor, index in cell_specs[anchor]) to referenced coordinates (relative to anchor
+            sheet) and the same for table_specs. Specs without references are left out.
+        """
+        def referencing(specs: Dict[CellLocation, list]) -> Dict[Tuple[CellLocation, int], Tuple[str, ...]]:
+            ret = {}
+            for cl, xs in specs.items():
+                for i, spec in enumerate(xs):
+                    probe = ReferenceProbe.spec_to_extractor(anchor=cl, plans=plans)
+                    spec.deref(probe)
+                    if probe.found:
+                        ret[(cl, i)] = tuple(probe.coordinates)
+            return ret
+
+        return referencing(self.cell_specs), referencing(self.table_specs)
+
     def n_total_spec(self) -> int:
         """total number of spec"""
         return self.n_table_spec() + self.n_cell_spec()
@@ -76,6 +105,10 @@ class ExcelProcessorSpec:
         """total number of location with table spec"""
         return len(self.table_specs)
 
+    def sheet_names(self) -> Set[str]:
+        """sheet names of every location with spec"""
+        return {cl.sheet_name for cl in chain(self.cell_specs.keys(), self.table_specs.keys())}
+
     def is_keys_unique(self) -> bool:
         """Check if keys are uniques
         Returns:
@@ -89,11 +122,11 @@ class ExcelProcessorSpec:
         )
 
     @classmethod
-    def from_workbook_template(cls, workbook: Workbook) -> 'ExcelProcessorSpec':
+    def from_workbook_template(cls, workbook: Union[Workbook, WorkbookSource]) -> 'ExcelProcessorSpec':
         """Create and deref spec from workbook template
 
         Args:
-            workbook (Workbook): workbook
+            workbook (Union[Workbook, WorkbookSource]): workbook
 
         Returns:
             ExcelProcessorSpec
@@ -104,13 +137,23 @@ class ExcelProcessorSpec:
         return raw_spec.template_to_spec_deref(workbook)
 
     @classmethod
-    def from_excel_template(cls, fname: str) -> 'ExcelProcessorSpec':
-        """Create and deref spec from workbook template
+    def from_excel_template(cls, fname: ExcelSource, data_only: bool = False) -> 'ExcelProcessorSpec':
+        """Create and deref spec from workbook template.
 
         Args:
-            fname (str): file name
+            fname (ExcelSource): file name, xlsx content or seekable binary stream.
+            data_only (bool): Optional. Default False. Same as openpyxl's data_only: a formula cell dereferenced
+                by a block (<<A1>>) gives its cached value instead of the formula. The template is then read with
+                exco.cell_source.XmlWorkbookSource: exco blocks come from the comment parts of the file and a
+                sheet is only loaded if a block dereferences one of its cells. exco.from_excel reads this way.
 
         Returns:
             ExcelProcessorSpec
         """
-        return cls.from_workbook_template(load_workbook(fname))
+        if not data_only:
+            return cls.from_workbook_template(load_workbook(open_excel_source(fname)))
+        workbook = XmlWorkbookSource(open_excel_source(fname))
+        try:
+            return cls.from_workbook_template(workbook)
+        finally:
+            workbook.close()
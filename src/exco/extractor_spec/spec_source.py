@@ -1,4 +1,6 @@
 import abc
+from dataclasses import dataclass
+from typing import Optional
 
 
 class SpecSource(abc.ABC):
@@ -16,3 +18,18 @@ class UnknownSource(SpecSource):
 
     def describe(self) -> str:
         return 'Unknown Source'
+
+
+@dataclass
+class CompiledSpecSource(SpecSource):
+    """Source of a spec loaded from a compiled spec artifact. Keeps the location of the exco block
+    in the template the artifact was compiled from, so errors still point back at the template.
+    """
+    description: str
+    sheet_name: Optional[str] = None
+    coordinate: Optional[str] = None
+    start_line: Optional[int] = None
+    end_line: Optional[int] = None
+
+    def describe(self) -> str:
+        return self.description
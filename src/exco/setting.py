@@ -25,6 +25,19 @@ k_item_direction = 'item_direction'
 
 table_infinite_loop_guard = 10000
 
+# table items read per window: starts at the initial size and doubles up to table_window_size
+table_initial_window_size = 32
+table_window_size = 4096
+
+# number of distinct exco block yaml strings kept parsed
+yaml_cache_size = 4096
+
+# distinct spec strings kept split at their references. See dereferator.InterpolationPlan
+interpolation_plan_cache_size = 16384
+
+# tasks of specs with ==A1== references kept per processor, keyed by the referenced values
+deref_task_cache_size = 1024
+
 # Note should I make another none like singleton for this?
 default_fallback_value = None
 
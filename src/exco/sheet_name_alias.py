@@ -1,5 +1,9 @@
+import abc
+import fnmatch
+import functools
+import re
 from dataclasses import dataclass
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional, Pattern, Tuple
 
 SheetName = str
 SheetNameAliasChecker = Callable[[SheetName], bool]
@@ -10,3 +14,155 @@ SheetNameAliasCheckers = Dict[SheetName, SheetNameAliasChecker]
 class SheetNameAliasChecker:
     sheet_name: str
     checker: Callable[[SheetName], bool]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(pattern: str, flags: int = 0) -> Pattern:
+    return re.compile(pattern, flags)
+
+
+def _has_global_flags(regex: str) -> bool:
+    # (?i) etc. apply to the whole regex. They must start it, so such a regex can not be embedded in another
+    return _compile(regex).flags != re.UNICODE
+
+
+class SheetNameMatcher(abc.ABC):
+    """Declarative sheet name alias checker. Unlike a lambda it pickles, and matchers of every template
+    sheet are combined into a single regex. See SheetNameAliasMatcher.
+    """
+
+    @property
+    @abc.abstractmethod
+    def pattern(self) -> str:
+        """
+        Returns:
+            Regex source which fully matches the accepted sheet names.
+        """
+        raise NotImplementedError()
+
+    @property
+    def combinable(self) -> bool:
+        """
+        Returns:
+            False if pattern can not be embedded in a combined regex. The matcher is then checked on its own.
+        """
+        return True
+
+    def __call__(self, sheet_name: SheetName) -> bool:
+        return _compile(self.pattern).fullmatch(sheet_name) is not None
+
+
+@dataclass(frozen=True)
+class ExactSheetName(SheetNameMatcher):
+    """Accept the sheet named name."""
+    name: str
+
+    @property
+    def pattern(self) -> str:
+        return re.escape(self.name)
+
+
+@dataclass(frozen=True)
+class CaseInsensitiveSheetName(SheetNameMatcher):
+    """Accept the sheet named name ignoring case. Ex: Summary, SUMMARY"""
+    name: str
+
+    @property
+    def pattern(self) -> str:
+        return f'(?i:{re.escape(self.name)})'
+
+
+@dataclass(frozen=True)
+class GlobSheetName(SheetNameMatcher):
+    """Accept sheet names matching a shell style pattern. Ex: Test *"""
+    glob: str
+    ignore_case: bool = False
+
+    @property
+    def pattern(self) -> str:
+        translated = fnmatch.translate(self.glob)
+        return f'(?i:{translated})' if self.ignore_case else translated
+
+
+@dataclass(frozen=True)
+class RegexSheetName(SheetNameMatcher):
+    """Accept sheet names fully matching regex. A regex starting with global flags, ex: (?i)sheet, is matched
+    on its own instead of as a part of the combined regex.
+    """
+    regex: str
+    ignore_case: bool = False
+
+    @property
+    def pattern(self) -> str:
+        return f'(?i:{self.regex})' if self.ignore_case else f'(?:{self.regex})'
+
+    @property
+    def combinable(self) -> bool:
+        return not _has_global_flags(self.regex)
+
+    def __call__(self, sheet_name: SheetName) -> bool:
+        if self.combinable:
+            return super().__call__(sheet_name)
+        return _compile(self.regex, re.IGNORECASE if self.ignore_case else 0).fullmatch(sheet_name) is not None
+
+
+@dataclass(frozen=True)
+class AnySheetName(SheetNameMatcher):
+    """Accept sheet names accepted by any of matchers."""
+    matchers: Tuple[SheetNameMatcher, ...]
+
+    def __init__(self, *matchers: SheetNameMatcher):
+        object.__setattr__(self, 'matchers', tuple(matchers))
+
+    def __reduce__(self):
+        return AnySheetName, self.matchers
+
+    @property
+    def pattern(self) -> str:
+        return '|'.join(f'(?:{matcher.pattern})' for matcher in self.matchers) or '(?!)'
+
+    @property
+    def combinable(self) -> bool:
+        return all(matcher.combinable for matcher in self.matchers)
+
+    def __call__(self, sheet_name: SheetName) -> bool:
+        if self.combinable:
+            return super().__call__(sheet_name)
+        return any(matcher(sheet_name) for matcher in self.matchers)
+
+
+class SheetNameAliasMatcher:
+    """Find the template sheet name of a sheet name with sheet name checkers.
+    Like checking each checker in order, the first template sheet whose checker accepts the name wins.
+    When every checker is a combinable SheetNameMatcher they are compiled into one regex and a name is matched once.
+    """
+
+    def __init__(self, checkers: SheetNameAliasCheckers):
+        self.checkers = checkers
+        self._template_names: List[SheetName] = list(checkers)
+        self._regex: Optional[Pattern] = None
+        if all(isinstance(checker, SheetNameMatcher) and checker.combinable for checker in checkers.values()):
+            combined = '|'.join(f'(?P<t{i}>{checker.pattern})' for i, checker in enumerate(checkers.values()))
+            try:
+                regex = re.compile(combined)
+            except re.error:  # ex: the same group name in two patterns
+                regex = None
+            # numbered groups (and back references) of the patterns would shift when combined
+            if regex is not None and regex.groups == len(checkers):
+                self._regex = regex
+
+    def match(self, sheet_name: SheetName) -> Optional[SheetName]:
+        """
+        Args:
+            sheet_name (SheetName): sheet name of the workbook to be extracted.
+
+        Returns:
+            Template sheet name of the first checker accepting sheet_name. None if no checker accepts it.
+        """
+        if self._regex is not None:
+            m = self._regex.fullmatch(sheet_name)
+            return None if m is None else self._template_names[int(m.lastgroup[1:])]
+        for template_sheet_name, checker in self.checkers.items():
+            if checker(sheet_name):
+                return template_sheet_name
+        return None
@@ -2,21 +2,25 @@ from exco import ExcelProcessorFactory, ExcelProcessor
 from exco.extractor import Locator, Assumption, Parser, Validator
 from exco.extractor.table_end_conditions.table_end_condition import TableEndCondition
 from exco.sheet_name_alias import SheetNameAliasCheckers
+from exco.template_cache import TemplateCache, default_template_cache
+from exco.workbook_loader import ExcelSource
 from typing import Optional, Dict, Type
 
 
-def from_excel(fname: str,
+def from_excel(fname: ExcelSource,
                sheet_name_checkers: Optional[SheetNameAliasCheckers] = None,
                extra_locators: Optional[Dict[str, Type[Locator]]] = None,
                extra_assumptions: Optional[Dict[str, Type[Assumption]]] = None,
                extra_parsers: Optional[Dict[str, Type[Parser]]] = None,
                extra_validators: Optional[Dict[str, Type[Validator]]] = None,
                extra_table_end_conditions: Optional[Dict[str, Type[TableEndCondition]]] = None,
-               accept_only_visible_sheets: bool = False) -> ExcelProcessor:
+               accept_only_visible_sheets: bool = False,
+               template_cache: Optional[TemplateCache] = default_template_cache) -> ExcelProcessor:
     """ A shortcut to create excel processor.
 
     Args:
-        fname (str): filename
+        fname (ExcelSource): template file name, xlsx content (bytes, bytearray, memoryview) or seekable
+            binary stream.
         sheet_name_checkers (Optional[SheetNameAliasCheckers]): Optional. Default None. sheetname alias checker.
         extra_locators (Optional[Dict[str, Type[Locator]]]): Optional. Default None. Extra locators.
         extra_assumptions (Optional[Dict[str, Type[Assumption]]]): Optional. Default None. Extra Assumptions.
@@ -26,6 +30,10 @@ def from_excel(fname: str,
             Default None. ExtraTableEndCondition.
         accept_only_visible_sheets (bool): true if you want to accept only visible sheets,
             false if you want to accept hidden sheets aswell
+        template_cache (Optional[TemplateCache]): Optional. Default exco.template_cache.default_template_cache
+            (in memory only). Calls with the same template content and extra actors reuse the compiled spec
+            and its tasks. Pass TemplateCache(directory=...) to share it between processes, None to disable.
+            Cache files are unpickled: the directory must only be writable by trusted users.
 
     Returns:
         ExcelProcessor.
@@ -37,5 +45,41 @@ def from_excel(fname: str,
                                         extra_table_end_conditions=extra_table_end_conditions)
     return fac.create_from_template_excel(fname=fname,
                                           sheet_name_checkers=sheet_name_checkers,
-                                          accept_only_visible_sheets=accept_only_visible_sheets
-                                          )
+                                          accept_only_visible_sheets=accept_only_visible_sheets,
+                                          template_cache=template_cache)
+
+
+def from_compiled(fname: str,
+                  sheet_name_checkers: Optional[SheetNameAliasCheckers] = None,
+                  extra_locators: Optional[Dict[str, Type[Locator]]] = None,
+                  extra_assumptions: Optional[Dict[str, Type[Assumption]]] = None,
+                  extra_parsers: Optional[Dict[str, Type[Parser]]] = None,
+                  extra_validators: Optional[Dict[str, Type[Validator]]] = None,
+                  extra_table_end_conditions: Optional[Dict[str, Type[TableEndCondition]]] = None,
+                  accept_only_visible_sheets: bool = False) -> ExcelProcessor:
+    """ A shortcut to create excel processor from a compiled spec artifact (see exco compile).
+    The template is not read and exco blocks are not parsed.
+
+    Args:
+        fname (str): compiled spec file name.
+        sheet_name_checkers (Optional[SheetNameAliasCheckers]): Optional. Default None. sheetname alias checker.
+        extra_locators (Optional[Dict[str, Type[Locator]]]): Optional. Default None. Extra locators.
+        extra_assumptions (Optional[Dict[str, Type[Assumption]]]): Optional. Default None. Extra Assumptions.
+        extra_parsers (Optional[Dict[str, Type[Parser]]]): Optional. Default None. Extra Parsers.
+        extra_validators (Optional[Dict[str, Type[Validator]]]): Optional Default None. Extra Validators
+        extra_table_end_conditions (Optional[Dict[str, Type[TableEndCondition]]]): Optional.
+            Default None. ExtraTableEndCondition.
+        accept_only_visible_sheets (bool): true if you want to accept only visible sheets,
+            false if you want to accept hidden sheets aswell
+
+    Returns:
+        ExcelProcessor.
+    """
+    fac = ExcelProcessorFactory.default(extra_locators=extra_locators,
+                                        extra_assumptions=extra_assumptions,
+                                        extra_parsers=extra_parsers,
+                                        extra_validators=extra_validators,
+                                        extra_table_end_conditions=extra_table_end_conditions)
+    return fac.create_from_compiled_spec(fname=fname,
+                                         sheet_name_checkers=sheet_name_checkers,
+                                         accept_only_visible_sheets=accept_only_visible_sheets)
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from exco.__version__ import version
+from exco.extractor_spec import ExcelProcessorSpec
+from exco.workbook_loader import ExcelSource
+
+if TYPE_CHECKING:
+    from exco.extractor.excel_processor import ExcelProcessor, ExcelProcessorFactory
+
+_chunk_size = 1 << 20
+
+
+class TemplateCache:
+    """Cache of ExcelProcessor built from template excel files.
+
+    The key is the hash of the template content together with the actors registered in the factory
+    (see ExcelProcessorFactory.signature), so editing the template or registering other actors misses the cache.
+    Processors are kept in memory with their tasks built (least recently used are evicted beyond maxsize) and,
+    if directory is given, their specs are written to directory so that other processes can reuse them.
+    Processors created from the same cached template share its spec and its tasks: assign a new spec to a
+    processor rather than modifying the shared one in place. The cache can be used from many threads.
+
+    Cache files are loaded with pickle, which can run arbitrary code. Only use a directory that no one but
+    trusted users can write to; never a world writable or shared download location. A file that can not be
+    loaded, ex: written by another version of exco, is treated as a miss.
+    """
+
+    def __init__(self, directory: Optional[str] = None, maxsize: int = 128):
+        self.directory = directory
+        self.maxsize = maxsize
+        self._processors: 'OrderedDict[str, ExcelProcessor]' = OrderedDict()
+        self._file_hashes: Dict[str, Tuple[int, int, str]] = {}  # path -> (mtime_ns, size, hash)
+        self._lock = threading.Lock()  # guards _processors and _file_hashes
+
+    def content_hash(self, fname: ExcelSource) -> str:
+        """Hash of the template content. The hash of a file is remembered until its mtime or size changes.
+
+        Args:
+            fname (ExcelSource): file name, xlsx content or seekable binary stream. Streams are rewound.
+
+        Returns:
+            sha256 hex digest.
+        """
+        if isinstance(fname, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(fname).hexdigest()
+        if isinstance(fname, str):
+            stat = os.stat(fname)
+            with self._lock:
+                remembered = self._file_hashes.get(fname)
+            if remembered is not None and remembered[:2] == (stat.st_mtime_ns, stat.st_size):
+                return remembered[2]
+            with open(fname, 'rb') as f:
+                digest = self._stream_hash(f)
+            with self._lock:
+                self._file_hashes[fname] = (stat.st_mtime_ns, stat.st_size, digest)
+            return digest
+        position = fname.tell()
+        try:
+            return self._stream_hash(fname)
+        finally:
+            fname.seek(position)
+
+    @staticmethod
+    def _stream_hash(stream: Any) -> str:
+        sha = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(_chunk_size), b''):
+            sha.update(chunk)
+        return sha.hexdigest()
+
+    def key(self, fname: ExcelSource, factory: 'ExcelProcessorFactory') -> str:
+        """
+        Args:
+            fname (ExcelSource): template.
+            factory (ExcelProcessorFactory): factory the processor is created with.
+
+        Returns:
+            Cache key of the template and the actors registered in factory.
+        """
+        sha = hashlib.sha256()
+        sha.update(version.encode())
+        sha.update(self.content_hash(fname).encode())
+        sha.update(repr(factory.signature()).encode())
+        return sha.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def get(self, key: str, factory: 'ExcelProcessorFactory') -> Optional['ExcelProcessor']:
+        """
+        Args:
+            key (str): see key.
+            factory (ExcelProcessorFactory): factory of key. Builds the processor of a spec found in directory.
+
+        Returns:
+            Cached processor with its tasks built. None if not in the cache.
+        """
+        with self._lock:
+            processor = self._processors.get(key)
+            if processor is not None:
+                self._processors.move_to_end(key)
+                return processor
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                spec = pickle.load(f)
+        except Exception:  # missing, truncated or stale (other exco version) files are a miss
+            return None
+        if not isinstance(spec, ExcelProcessorSpec):
+            return None
+        processor = factory.create_from_spec(spec)
+        self._remember(key, processor)
+        return processor
+
+    def put(self, key: str, processor: 'ExcelProcessor'):
+        """
+        Args:
+            key (str): see key.
+            processor (ExcelProcessor): processor created from the spec compiled from the template.
+        """
+        self._remember(key, processor)
+        if self.directory is None:
+            return
+        data = pickle.dumps(processor.spec, protocol=pickle.HIGHEST_PROTOCOL)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))  # atomic, concurrent writers are safe
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _remember(self, key: str, processor: 'ExcelProcessor'):
+        processor._static_processor()  # tasks are built once, not by each processor sharing them
+        with self._lock:
+            self._processors[key] = processor
+            self._processors.move_to_end(key)
+            while len(self._processors) > self.maxsize:
+                self._processors.popitem(last=False)
+
+    def clear(self):
+        """Clear the in memory cache. Files in directory are kept."""
+        with self._lock:
+            self._processors.clear()
+            self._file_hashes.clear()
+
+
+default_template_cache = TemplateCache()
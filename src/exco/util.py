@@ -1,3 +1,4 @@
+import functools
 import itertools
 import textwrap
 from collections import defaultdict
@@ -10,7 +11,7 @@ from openpyxl import Workbook
 from openpyxl.cell import Cell
 from openpyxl.chartsheet.chartsheet import Chartsheet
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.merge import MergedCellRange
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 
 from exco import setting as st
@@ -19,6 +20,7 @@ from exco.cell_full_path import CellFullPath
 T = TypeVar('T')
 CellValue = Union[str, int, date, None]
 CellLocation = 'CellLocation'  # to avoid flake8 code smell
+SheetSource = 'SheetSource'
 
 
 def long_string(s: str) -> str:
@@ -83,7 +85,13 @@ def default_key(clz: Type[Any], suffix):
         default key name: Ex: IntParser -> int
 
     """
-    return stringcase.snakecase(remove_suffix(clz.__name__, suffix))
+    return _snake_key(clz.__name__, suffix)
+
+
+@functools.lru_cache(maxsize=None)
+def _snake_key(name: str, suffix: str) -> str:
+    # factories build their class dictionaries on every ExcelProcessorFactory.default()
+    return stringcase.snakecase(remove_suffix(name, suffix))
 
 
 def extra_keys(d: Dict[str, Any], allowed=Set[str]) -> List[str]:
@@ -143,110 +151,99 @@ def group_by(f: Callable[[T], T2], xs: List[T]) -> Dict[T2, List[T]]:
     return dict(ret)
 
 
-def get_merged_cell(sheet: Worksheet, coordinates: str) -> Optional[MergedCellRange]:
+def _sheet_source(sheet: Union[Worksheet, SheetSource]) -> SheetSource:
+    from exco.cell_source import as_sheet_source
+    return as_sheet_source(sheet)
+
+
+def get_merged_cell(sheet: Union[Worksheet, SheetSource], coordinates: str) -> Optional[CellRange]:
     """Find the merge cell in the whole sheet that contains coordinates
 
     Args:
-        sheet (Worksheet): worksheet
+        sheet (Union[Worksheet, SheetSource]): worksheet
         coordinates (str): coordinates of cell
 
     Returns:
-        MergedCellRange if cell is a part of a merged cell, None if cell is not a merged cell
+        CellRange if cell is a part of a merged cell, None if cell is not a merged cell
     """
-    for merged_cell in sheet.merged_cells.ranges:
-        if coordinates in merged_cell:
-            return merged_cell
-    return None
+    row, col = coordinate_to_tuple(coordinates)
+    return _sheet_source(sheet).merged_range_at(row, col)
 
 
-def get_rightmost_coordinate(sheet: Worksheet, cell: Cell) -> CellLocation:
+def get_rightmost_coordinate(sheet: Union[Worksheet, SheetSource], cell: Cell) -> CellLocation:
     from exco import CellLocation
-    merged_cell = get_merged_cell(sheet=sheet, coordinates=cell.coordinate)
+    merged_cell = _sheet_source(sheet).merged_range_at(cell.row, cell.column)
     if merged_cell is None:
-        return CellLocation(
-            coordinate=cell.coordinate,
-            sheet_name=sheet.title
-        )
-    return CellLocation(
-        coordinate=tuple_to_coordinate(cell.row, merged_cell.max_col),
-        sheet_name=sheet.title
-    )
+        return CellLocation(sheet.title, row=cell.row, col=cell.column)
+    return CellLocation(sheet.title, row=cell.row, col=merged_cell.max_col)
 
 
-def get_bottommost_coordinate(sheet: Worksheet, cell: Cell) -> CellLocation:
+def get_bottommost_coordinate(sheet: Union[Worksheet, SheetSource], cell: Cell) -> CellLocation:
     from exco import CellLocation
-    merged_cell = get_merged_cell(sheet=sheet, coordinates=cell.coordinate)
+    merged_cell = _sheet_source(sheet).merged_range_at(cell.row, cell.column)
     if merged_cell is None:
-        return CellLocation(
-            coordinate=cell.coordinate,
-            sheet_name=sheet.title
-        )
-    return CellLocation(
-        coordinate=tuple_to_coordinate(merged_cell.max_row, cell.column),
-        sheet_name=sheet.title
-    )
+        return CellLocation(sheet.title, row=cell.row, col=cell.column)
+    return CellLocation(sheet.title, row=merged_cell.max_row, col=cell.column)
 
 
-def iter_rows_between(sheet: Worksheet, cell: Cell) -> Generator[Cell, None, None]:
+def iter_rows_between(sheet: Union[Worksheet, SheetSource], cell: Cell) -> Generator[Cell, None, None]:
     """Loops over the cells to the right of the rows between cell (inclusive). This works for cells and merged cells.
 
     Args:
-        sheet (Worksheet): worksheet
+        sheet (Union[Worksheet, SheetSource]): worksheet
         cell (Cell): Cell
 
     Returns:
         Generator of Cells
     """
+    sheet = _sheet_source(sheet)
     merged_cell = get_merged_cell(sheet=sheet, coordinates=cell.coordinate)
-    cell_range = coordinate_to_tuple(cell.coordinate) if merged_cell is None else merged_cell
-    if type(cell_range) is MergedCellRange:
-        min_col = cell_range.max_col
-        min_row = cell_range.min_row
+    if merged_cell is not None:
+        min_col = merged_cell.max_col
+        min_row = merged_cell.min_row
         max_col = sheet.max_column
-        max_row = cell_range.max_row
+        max_row = merged_cell.max_row
     else:
-        min_col = cell_range[1]
-        min_row = cell_range[0]
+        min_row, min_col = coordinate_to_tuple(cell.coordinate)
         max_col = sheet.max_column
-        max_row = cell_range[0]
+        max_row = min_row
     for row in range(min_row, max_row + 1):
         cells = (sheet.cell(row=row, column=column) for column in range(min_col, max_col + 1))
         yield tuple(cells)
 
 
-def iter_cols_between(sheet: Worksheet, cell: Cell) -> Generator[Cell, None, None]:
+def iter_cols_between(sheet: Union[Worksheet, SheetSource], cell: Cell) -> Generator[Cell, None, None]:
     """Loops over the cells beneath the columns between cell (inclusive). This works for cells and merged cells.
 
     Args:
-        sheet (Worksheet): worksheet
+        sheet (Union[Worksheet, SheetSource]): worksheet
         cell (Cell): Cell
 
     Returns:
         Generator of Cells
     """
+    sheet = _sheet_source(sheet)
     merged_cell = get_merged_cell(sheet=sheet, coordinates=cell.coordinate)
-    cell_range = coordinate_to_tuple(cell.coordinate) if merged_cell is None else merged_cell
-    if type(cell_range) is MergedCellRange:
-        min_col = cell_range.min_col
-        min_row = cell_range.max_row
-        max_col = cell_range.max_col
+    if merged_cell is not None:
+        min_col = merged_cell.min_col
+        min_row = merged_cell.max_row
+        max_col = merged_cell.max_col
         max_row = sheet.max_row
     else:
-        min_col = cell_range[1]
-        min_row = cell_range[0]
-        max_col = cell_range[1]
+        min_row, min_col = coordinate_to_tuple(cell.coordinate)
+        max_col = min_col
         max_row = sheet.max_row
     for row in range(min_row + 1, max_row + 1):
         cells = (sheet.cell(row=row, column=column) for column in range(min_col, max_col + 1))
         yield tuple(cells)
 
 
-def search_right_of_scope(sheet: Worksheet, cell: Cell, label: str) -> Optional[Cell]:
+def search_right_of_scope(sheet: Union[Worksheet, SheetSource], cell: Cell, label: str) -> Optional[Cell]:
     """Loop over the cells to the right of the rows between cell (inclusive) and
     find the cell with the specified label.
 
     Args:
-        sheet (Worksheet): worksheet
+        sheet (Union[Worksheet, SheetSource]): worksheet
         cell (Cell): Cell
         label (str): cell name to find
 
@@ -260,12 +257,12 @@ def search_right_of_scope(sheet: Worksheet, cell: Cell, label: str) -> Optional[
     return None
 
 
-def search_below_of_scope(sheet: Worksheet, cell: Cell, label: str) -> Optional[Cell]:
+def search_below_of_scope(sheet: Union[Worksheet, SheetSource], cell: Cell, label: str) -> Optional[Cell]:
     """Loop over the cells beneath the columns between cell (inclusive) and
     find the cell with the specified label.
 
     Args:
-        sheet (Worksheet): worksheet
+        sheet (Union[Worksheet, SheetSource]): worksheet
         cell (Cell): Cell
         label (str): cell name to find
 
@@ -0,0 +1,151 @@
+import io
+from enum import Enum
+from typing import BinaryIO, Callable, Optional, Union
+
+from openpyxl import Workbook
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.worksheet.worksheet import Worksheet
+
+from exco.cell_source import ReadOnlyWorkbookSource, WorkbookSource, XmlWorkbookSource
+from exco.sheet_name_alias import SheetName
+
+SheetFilter = Callable[[SheetName], bool]
+Buffer = Union[bytes, bytearray, memoryview]
+ExcelSource = Union[str, Buffer, BinaryIO]  # file name, xlsx content or seekable binary stream
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable read-only binary stream over bytes, bytearray or memoryview. The buffer is not copied."""
+
+    def __init__(self, buffer: Buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f'Invalid whence {whence}')
+        if pos < 0:
+            raise ValueError(f'Negative seek position {pos}')
+        self._pos = pos
+        return pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes() if end > self._pos else b''
+        self._pos = max(self._pos, end)
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+def open_excel_source(source: ExcelSource) -> Union[str, BinaryIO]:
+    """Turn xlsx content in memory into a stream. File names and streams are returned as is.
+
+    Args:
+        source (ExcelSource): file name, bytes, bytearray, memoryview or seekable binary stream.
+
+    Returns:
+        File name or seekable binary stream.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return BufferReader(source)
+    return source
+
+
+class WorkbookBackend(Enum):
+    """Library used to read the workbook to be extracted.
+
+    OPENPYXL: openpyxl. Full mode keeps every openpyxl cell; read_only mode keeps values only.
+    XML: exco's own iterparse reader (see exco.cell_source.XmlWorkbookSource). Reads values only,
+        skipping styles, drawings and themes. Usually the fastest for large workbooks.
+    """
+    OPENPYXL = 'openpyxl'
+    XML = 'xml'
+
+    @classmethod
+    def default(cls) -> 'WorkbookBackend':
+        return WorkbookBackend.OPENPYXL
+
+
+class SheetFilteringExcelReader(ExcelReader):
+    """openpyxl's ExcelReader which only parses worksheets accepted by sheet_filter.
+
+    Other worksheets are replaced by empty placeholder worksheets so that sheet titles
+    and visibility are still available.
+    """
+
+    def __init__(self, fn, sheet_filter: SheetFilter, **kwargs):
+        super().__init__(fn, **kwargs)
+        self.sheet_filter = sheet_filter
+
+    def read_worksheets(self):
+        find_sheets = self.parser.find_sheets
+
+        def accepted_sheets():
+            for sheet, rel in find_sheets():
+                if 'chartsheet' in rel.Type or self.sheet_filter(sheet.name):
+                    yield sheet, rel
+                elif rel.target in self.valid_files:
+                    self._add_placeholder(sheet)
+
+        self.parser.find_sheets = accepted_sheets
+        try:
+            super().read_worksheets()
+        finally:
+            self.parser.find_sheets = find_sheets
+
+    def _add_placeholder(self, sheet) -> Worksheet:
+        ws = Worksheet(parent=self.wb, title=sheet.name)
+        ws.sheet_state = sheet.state
+        self.wb._sheets.append(ws)
+        return ws
+
+
+def load_workbook(fname: ExcelSource, read_only: bool = False,
+                  sheet_filter: Optional[SheetFilter] = None,
+                  backend: Union[WorkbookBackend, str] = WorkbookBackend.OPENPYXL) -> Union[Workbook, WorkbookSource]:
+    """Load workbook to be extracted.
+
+    Args:
+        fname (ExcelSource): file name, xlsx content (bytes, bytearray, memoryview) or seekable binary stream.
+        read_only (bool): Optional. Default False. Load with openpyxl's read_only mode.
+            Only cell values, merged cells and hyperlinks are kept which uses far less memory
+            for large workbooks. Each used sheet is still read whole into memory on first access, it is
+            not streamed. See ReadOnlySheetSource. The returned workbook should be closed after use.
+        sheet_filter (Optional[SheetFilter]): Optional. Default None(load every sheet).
+            Only worksheets whose name is accepted by sheet_filter are parsed. The others are
+            loaded as empty worksheets with the same title and visibility.
+        backend (Union[WorkbookBackend, str]): Optional. Default openpyxl. See WorkbookBackend.
+            read_only only applies to the openpyxl backend; the xml backend is always values only.
+
+    Returns:
+        Workbook for openpyxl full mode, otherwise WorkbookSource.
+    """
+    fname = open_excel_source(fname)
+    if WorkbookBackend(backend) == WorkbookBackend.XML:
+        return XmlWorkbookSource(fname, sheet_filter=sheet_filter)
+    sheet_filter = sheet_filter if sheet_filter is not None else (lambda sheet_name: True)
+    reader = SheetFilteringExcelReader(fname, sheet_filter=sheet_filter, read_only=read_only, data_only=True)
+    reader.read()
+    if read_only:
+        return ReadOnlyWorkbookSource(reader.wb)
+    return reader.wb
@@ -0,0 +1,143 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join, dirname
+
+import pytest
+from openpyxl import Workbook
+
+import exco
+from exco import util
+from exco.cell_source import as_workbook_source, OpenpyxlWorkbookSource, ValueSheetSource, SheetSource
+
+
+class RowsSheetSource(ValueSheetSource):
+    def _load(self):
+        self.add_row(1, ('a', None, 'b'))
+        self.add_row(3, (None, 'c'))
+        self.add_merged_range('A1:B1')
+
+
+class SlowSheetSource(ValueSheetSource):
+    def __init__(self, title: str, fail: bool = False):
+        super().__init__(title=title)
+        self.fail = fail
+        self.loads = 0
+
+    def _load(self):
+        self.loads += 1
+        for row in range(1, 21):
+            self.add_row(row, (row,))
+            time.sleep(0.001)
+            if self.fail:
+                raise IOError('broken sheet')
+
+
+def test_as_workbook_source():
+    wb = Workbook()
+    wb.active['B2'] = 'x'
+    source = as_workbook_source(wb)
+    assert isinstance(source, OpenpyxlWorkbookSource)
+    assert as_workbook_source(source) is source
+    sheet = source['Sheet']
+    assert sheet is source['Sheet']
+    assert sheet.value(2, 2) == 'x'
+    assert sheet.value(5, 5) is None
+    assert (5, 5) not in wb.active._cells
+    assert sheet['B2'] is wb.active['B2']
+    assert sheet.find(lambda value: value == 'x').coordinate == 'B2'
+    assert sheet.find(lambda value: value == 'y') is None
+    assert sheet.freeze_panes is None  # forwarded to the worksheet
+    assert source.active is wb.active  # forwarded to the workbook
+
+
+def test_openpyxl_source_does_not_create_cells():
+    wb = Workbook()
+    wb.active.append(['a', 1])
+    sheet = as_workbook_source(wb)['Sheet']
+    assert sheet.cell(7, 3).value is None and sheet['E9'].coordinate == 'E9'
+    assert [tuple(c.value for c in row) for row in sheet.iter_rows(max_row=3, max_col=3)][0] == ('a', 1, None)
+    assert sheet['A1'] is wb.active['A1']
+    assert (wb.active.max_row, wb.active.max_column, len(wb.active._cells)) == (1, 2, 2)
+
+
+def test_value_sheet_source():
+    sheet = RowsSheetSource(title='rows')
+    assert (sheet.max_row, sheet.max_column) == (3, 3)
+    assert list(sheet.iter_values()) == [('a', None, 'b'), (None, None, None), (None, 'c', None)]
+    assert list(sheet.iter_values(min_row=3, min_col=2, max_col=4)) == [('c', None, None)]
+    assert [tuple(c.value for c in row) for row in sheet.iter_rows(min_row=3)] == [(None, 'c', None)]
+    assert sheet.find(lambda value: value == 'c').coordinate == 'B3'
+    assert [str(r) for r in sheet.merged_ranges()] == ['A1:B1']
+    assert sheet.hyperlink(1, 1) is None
+    assert sheet.comment(1, 1) is None
+
+
+def test_value_index():
+    wb = Workbook()
+    ws = wb.active
+    ws['C1'] = 'label'
+    ws['A2'] = 'label'
+    ws['B2'] = 5
+    ws['A3'] = 5.0
+    sheet = as_workbook_source(wb)['Sheet']
+    assert sheet.find_value('label').coordinate == 'C1'
+    assert sheet.find_value(5.0).coordinate == 'B2'
+    assert sheet.find_value('missing') is None
+    assert sheet.find_value(None).coordinate == 'A1'
+    assert sheet.find_value(['unhashable']) is None
+    index = sheet.value_index()
+    assert index == {'label': (1, 3), 5: (2, 2)}
+    assert sheet.value_index() is index
+
+
+def test_value_index_shared_in_process_workbook(monkeypatch):
+    built = []
+    original = SheetSource.value_index
+
+    def value_index(self):
+        if self._value_index is None:
+            built.append(self.title)
+        return original(self)
+
+    monkeypatch.setattr(SheetSource, 'value_index', value_index)
+    sample_dir = join(dirname(__file__), '../../sample/test/dynamic_location')
+    processor = exco.from_excel(join(sample_dir, 'dynamic_location_template.xlsx'))
+    processor.process_excel(join(sample_dir, 'dynamic_location_data.xlsx'))
+    assert len(built) == len(set(built)) > 0
+
+
+def test_merged_range_at():
+    wb = Workbook()
+    ws = wb.active
+    ws.merge_cells('B2:D4')
+    ws.merge_cells('F3:G3')
+    sheet = as_workbook_source(wb)['Sheet']
+    assert str(sheet.merged_range_at(3, 3)) == 'B2:D4'
+    assert str(sheet.merged_range_at(3, 7)) == 'F3:G3'
+    assert sheet.merged_range_at(3, 5) is None
+    assert sheet.merged_range_at(5, 2) is None
+    assert str(util.get_merged_cell(sheet, 'D4')) == 'B2:D4'
+    assert sorted(sheet._merged_index) == [2, 3, 4]
+
+
+def test_value_sheet_source_shared_by_threads():
+    sheet = SlowSheetSource(title='slow')
+    barrier = threading.Barrier(8)
+
+    def read_last(_):
+        barrier.wait()
+        return sheet.value(20, 1), sheet.max_row
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(read_last, range(8))) == [(20, 20)] * 8
+    assert sheet.loads == 1
+
+
+def test_value_sheet_source_failed_load_is_not_kept():
+    sheet = SlowSheetSource(title='slow', fail=True)
+    with pytest.raises(IOError):
+        sheet.value(1, 1)
+    sheet.fail = False
+    assert sheet.value(20, 1) == 20 and sheet.max_row == 20
+    assert sheet.loads == 2
@@ -0,0 +1,91 @@
+import re
+from dataclasses import asdict
+from os.path import join, dirname
+
+import pytest
+from openpyxl import Workbook
+
+import exco
+from exco import CellLocation
+from exco.extractor.locator.built_in.below_of_locator import BelowOfLocator
+from exco.extractor.locator.built_in.right_of_locator import RightOfLocator
+from exco.extractor.parser.built_in.link_parser import LinkResult
+from exco.cell_source import ReadOnlyWorkbookSource
+from exco.workbook_loader import load_workbook
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+
+
+@pytest.fixture
+def merged_path(tmp_path) -> str:
+    wb = Workbook()
+    ws = wb.active
+    ws.merge_cells('E4:H4')
+    ws['E4'] = 'horizontal'
+    ws['I4'] = 20
+    ws.merge_cells('B6:B11')
+    ws['B6'] = 'vertical'
+    ws['B12'] = 30
+    ws['A20'] = 'last'
+    fname = str(tmp_path / 'merged.xlsx')
+    wb.save(fname)
+    return fname
+
+
+def test_load_read_only(merged_path: str):
+    wb = load_workbook(merged_path, read_only=True)
+    assert isinstance(wb, ReadOnlyWorkbookSource)
+    sheet = wb['Sheet']
+    assert sheet.max_row == 20
+    assert sheet['I4'].value == 20
+    assert sheet.cell(row=4, column=9).coordinate == 'I4'
+    assert sheet['Z99'].value is None
+    assert len(sheet.merged_ranges()) == 2
+    with pytest.raises(KeyError):
+        wb['NotASheet']
+    wb.close()
+
+
+def test_read_only_merged_locator(merged_path: str):
+    wb = load_workbook(merged_path, read_only=True)
+    anchor = CellLocation(sheet_name='Sheet', coordinate='A1')
+    assert RightOfLocator(label='horizontal').locate(anchor, wb).location.coordinate == 'I4'
+    assert BelowOfLocator(label='vertical').locate(anchor, wb).location.coordinate == 'B12'
+    wb.close()
+
+
+def test_read_only_everything():
+    fname = join(sample_dir, 'everything/everything_template.xlsx')
+    processor = exco.from_excel(fname)
+    full = processor.process_excel(fname)
+    read_only = processor.process_excel(fname, read_only=True)
+    assert read_only.is_ok
+    assert read_only.to_dict() == full.to_dict()
+
+
+def test_read_only_hidden_sheets():
+    test_regex = re.compile("(test).*")
+    checkers = {'test': lambda sheet_name: test_regex.fullmatch(sheet_name) is not None}
+    processor = exco.from_excel(join(sample_dir, 'simple_with_hidden_sheets_template.xlsx'),
+                                sheet_name_checkers=checkers,
+                                accept_only_visible_sheets=True)
+    result = processor.process_excel(join(sample_dir, 'simple_with_hidden_sheets.xlsx'), read_only=True)
+    assert result.to_dict() == {'a': 4, 'b': 5, 'c': 6}
+
+
+def test_read_only_link():
+    processor = exco.from_excel(join(sample_dir, 'link/link_template.xlsx'))
+    result = processor.process_excel(join(sample_dir, 'link/good_link.xlsx'), read_only=True)
+    assert result.to_dict() == {'link': asdict(LinkResult(display="This is the link", link="https://www.google.com/"))}
+
+
+def test_read_only_without_parser_api(merged_path: str, monkeypatch):
+    from exco.cell_source import read_only_source
+    monkeypatch.setattr(read_only_source, 'WorkSheetParser', None)
+    wb = load_workbook(merged_path, read_only=True)
+    sheet = wb['Sheet']
+    with pytest.warns(UserWarning, match='iter_rows'):
+        assert sheet.max_row == 20
+    assert sheet['I4'].value == 20 and sheet['B6'].value == 'vertical' and sheet['A20'].value == 'last'
+    assert sheet.merged_ranges() == [] and sheet.comments() == {}
+    wb.close()
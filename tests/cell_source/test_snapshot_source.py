@@ -0,0 +1,71 @@
+from os.path import join, dirname
+
+import pytest
+from openpyxl import Workbook
+
+import exco
+from exco.cell_source import SnapshotWorkbookSource, with_snapshot
+
+np = pytest.importorskip('numpy')
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+
+
+@pytest.fixture
+def workbook() -> Workbook:
+    wb = Workbook()
+    ws = wb.active
+    ws['A1'] = 'label'
+    ws['B1'] = 3
+    ws['C2'] = 1.5
+    ws['A3'] = True
+    ws.merge_cells('A1:A2')
+    wb.create_sheet('unused')['A1'] = 'x'
+    return wb
+
+
+def test_snapshot(workbook: Workbook):
+    source = with_snapshot(workbook)
+    assert with_snapshot(source) is source
+    sheet = source['Sheet']
+    snapshot = sheet.snapshot
+    assert snapshot.shape == (3, 3)
+    assert sheet.value(1, 2) == 3
+    assert sheet.value(10, 10) is None
+    assert sheet['C2'].value == 1.5
+    assert [str(r) for r in sheet.merged_ranges()] == ['A1:A2']
+    assert list(sheet.iter_values(min_row=2, max_row=4, min_col=3, max_col=4)) == \
+        [(1.5, None), (None, None), (None, None)]
+    assert sheet.find(lambda value: value == 1.5).coordinate == 'C2'
+    assert snapshot.null_mask.tolist() == [[False, False, True], [True, True, False], [False, True, True]]
+    numbers, mask = snapshot.numeric_view
+    assert mask.tolist() == [[False, True, False], [False, False, True], [False, False, False]]
+    assert numbers[0, 1] == 3.0 and np.isnan(numbers[0, 0])
+    assert sheet.snapshot is snapshot
+    assert source['unused']._snapshot is None
+
+
+@pytest.mark.parametrize('template, data', [
+    ('everything/everything_template.xlsx', 'everything/everything_template.xlsx'),
+    ('table/table_template.xlsx', 'table/table_template.xlsx'),
+    ('link/link_template.xlsx', 'link/good_link.xlsx'),
+])
+def test_process_excel_with_snapshot(template: str, data: str):
+    processor = exco.from_excel(join(sample_dir, template))
+    expected = processor.process_excel(join(sample_dir, data)).to_dict()
+    assert processor.process_excel(join(sample_dir, data), snapshot=True).to_dict() == expected
+    assert processor.process_excel(join(sample_dir, data), snapshot=True, backend='xml').to_dict() == expected
+
+
+def test_snapshot_shared_by_tasks(monkeypatch):
+    built = []
+    original = SnapshotWorkbookSource.__init__
+
+    def init(self, source):
+        built.append(source)
+        original(self, source)
+
+    monkeypatch.setattr(SnapshotWorkbookSource, '__init__', init)
+    processor = exco.from_excel(join(sample_dir, 'everything/everything_template.xlsx'))
+    processor.process_excel(join(sample_dir, 'everything/everything_template.xlsx'), snapshot=True)
+    assert len(built) == 1
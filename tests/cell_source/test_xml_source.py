@@ -0,0 +1,133 @@
+import gc
+import glob
+import io
+import zipfile
+from datetime import datetime
+from os.path import join, dirname
+
+import openpyxl
+import pytest
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+import exco
+from exco.cell_source import XmlWorkbookSource, ValueSheetSource, xml_source
+from exco.workbook_loader import load_workbook, WorkbookBackend
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+sample_files = sorted(glob.glob(join(sample_dir, '**/*.xlsx'), recursive=True))
+
+
+@pytest.mark.parametrize('fname', sample_files)
+def test_same_as_openpyxl(fname: str):
+    expected = openpyxl.load_workbook(fname, data_only=True)
+    wb = XmlWorkbookSource(fname)
+    assert wb.sheetnames == [ws.title for ws in expected.worksheets]
+    for ews in expected.worksheets:
+        sheet = wb[ews.title]
+        assert sheet.sheet_state == ews.sheet_state
+        assert {str(r) for r in sheet.merged_ranges()} == {str(r) for r in ews.merged_cells.ranges}
+        for row in ews.iter_rows():
+            for cell in row:
+                assert sheet.value(cell.row, cell.column) == cell.value, cell.coordinate
+                link = sheet.hyperlink(cell.row, cell.column)
+                assert (link and link.target) == (cell.hyperlink and cell.hyperlink.target)
+                assert sheet.comment(cell.row, cell.column) == (cell.comment and cell.comment.text)
+    wb.close()
+
+
+def test_sheet_filter(tmp_path):
+    wb = Workbook()
+    wb.active['A1'] = 'used'
+    wb.create_sheet('other')['A1'] = 'skipped'
+    fname = str(tmp_path / 'filter.xlsx')
+    wb.save(fname)
+    source = load_workbook(fname, sheet_filter=lambda sheet_name: sheet_name == 'Sheet', backend='xml')
+    assert isinstance(source, XmlWorkbookSource)
+    assert source.sheetnames == ['Sheet', 'other']
+    assert source['Sheet'].value(1, 1) == 'used'
+    assert type(source['other']) is ValueSheetSource
+    assert source['other'].value(1, 1) is None
+    source.close()
+
+
+def test_date_1904(tmp_path):
+    wb = Workbook()
+    wb.epoch = CALENDAR_MAC_1904
+    wb.active['A1'] = datetime(2020, 1, 2)
+    fname = str(tmp_path / 'date1904.xlsx')
+    wb.save(fname)
+    source = XmlWorkbookSource(fname)
+    assert source['Sheet'].value(1, 1) == datetime(2020, 1, 2)
+    source.close()
+
+
+def test_inline_string_without_reference(tmp_path):
+    fname = str(tmp_path / 'inline.xlsx')
+    wb = Workbook()
+    wb.save(fname)
+    with zipfile.ZipFile(fname) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+    parts['xl/worksheets/sheet1.xml'] = (
+        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        b'<row><c t="inlineStr"><is><t>a</t></is></c><c t="b"><v>1</v></c></row>'
+        b'<row r="3"><c r="C3" t="inlineStr"><is><r><t>b</t></r><r><t>c</t></r></is></c></row>'
+        b'</sheetData></worksheet>')
+    with zipfile.ZipFile(fname, 'w') as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+    sheet = XmlWorkbookSource(fname)['Sheet']
+    assert list(sheet.iter_values()) == [('a', True, None), (None, None, None), (None, None, 'bc')]
+
+
+def test_comment(tmp_path):
+    wb = Workbook()
+    wb.active['B2'].comment = Comment('hello', 'me')
+    fname = str(tmp_path / 'comment.xlsx')
+    wb.save(fname)
+    source = XmlWorkbookSource(fname)
+    assert source['Sheet']['B2'].comment.text == 'hello'
+    assert source['Sheet'].comment(1, 1) is None
+    source.close()
+
+
+def test_template_from_xml_source():
+    fname = join(sample_dir, 'everything/everything_template.xlsx')
+    expected = exco.ExcoTemplate.from_workbook(openpyxl.load_workbook(fname, data_only=True))
+    source = XmlWorkbookSource(fname)
+    assert exco.ExcoTemplate.from_workbook(source).to_raw_excel_processor_spec() == \
+        expected.to_raw_excel_processor_spec()
+    source.close()
+
+
+@pytest.mark.parametrize('template, data', [
+    ('everything/everything_template.xlsx', 'everything/everything_template.xlsx'),
+    ('date/date_template.xlsx', 'date/good_date.xlsx'),
+    ('date/date_template.xlsx', 'date/bad_date.xlsx'),
+    ('link/link_template.xlsx', 'link/good_link.xlsx'),
+    ('table/table_template.xlsx', 'table/table_template.xlsx'),
+    ('dynamic_location/dynamic_location_template.xlsx', 'dynamic_location/dynamic_location_data.xlsx'),
+])
+def test_process_excel_with_xml_backend(template: str, data: str):
+    processor = exco.from_excel(join(sample_dir, template))
+    full = processor.process_excel(join(sample_dir, data))
+    xml = processor.process_excel(join(sample_dir, data), backend=WorkbookBackend.XML)
+    assert xml.is_ok == full.is_ok
+    assert xml.to_dict() == full.to_dict()
+
+
+def test_read_elements_are_detached():
+    ns = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    rows = ''.join(f'<row r="{r}"><c r="A{r}"><v>{r}</v></c></row>' for r in range(1, 4))
+    data = f'<worksheet xmlns="{ns}"><sheetData>{rows}</sheetData>' \
+           f'<mergeCells><mergeCell ref="B1:B2"/></mergeCells></worksheet>'
+    read = []
+    for el in xml_source._iterparse_children(io.BytesIO(data.encode()),
+                                             {f'{{{ns}}}sheetData', f'{{{ns}}}mergeCells'},
+                                             {f'{{{ns}}}row', f'{{{ns}}}mergeCell'}):
+        # while the document is parsed, the elements read before are cleared and no longer in the tree
+        assert all(len(prev) == 0 and not any(isinstance(r, type(prev)) for r in gc.get_referrers(prev))
+                   for prev, _, _ in read)
+        read.append((el, el.get('r') or el.get('ref'), el.findtext(f'.//{{{ns}}}v')))
+    assert [(ref, v) for _, ref, v in read] == [('1', '1'), ('2', '2'), ('3', '3'), ('B1:B2', None)]
@@ -0,0 +1,90 @@
+from datetime import date, datetime
+from os.path import join, dirname
+
+import openpyxl
+import pytest
+
+import exco
+from exco import CellLocation
+from exco.cell_location import CellOffset
+from exco.extractor.cell_extraction_task import CellExtractionTask
+from exco.extractor.columnar_table_result import ColumnarTableResult
+from exco.extractor.locator.built_in.at_comment_cell_locator import AtCommentCellLocator
+from exco.extractor.locator.built_in.right_of_locator import RightOfLocator
+from exco.extractor.parser.built_in.date_parser import DateParser
+from exco.extractor.parser.built_in.float_parser import FloatParser
+from exco.extractor.parser.built_in.int_parser import IntParser
+from exco.extractor.parser.built_in.string_parser import StringParser
+from exco.extractor.table_extraction_task import EndConditionCollection, TableExtractionTask
+
+np = pytest.importorskip('numpy')
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+
+
+@pytest.fixture
+def task() -> TableExtractionTask:
+    columns = [('name', StringParser()), ('count', IntParser()), ('price', FloatParser()), ('day', DateParser())]
+    return TableExtractionTask(
+        key='table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(row=0, col=i): CellExtractionTask.simple(key=key, parser=parser)
+                 for i, (key, parser) in enumerate(columns)},
+        end_condition=EndConditionCollection.default()
+    )
+
+
+@pytest.fixture
+def workbook() -> openpyxl.Workbook:
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.append(['a', 1, 1.5, datetime(2020, 1, 2)])
+    sheet.append(['b', 'two', 2.5, 'yesterday'])
+    sheet.append(['c', 3, None, datetime(2020, 1, 4)])
+    return wb
+
+
+def test_columnar_table_result(task: TableExtractionTask, workbook: openpyxl.Workbook):
+    anchor = CellLocation('Sheet', 'A1')
+    result = task.process(anchor, workbook, columnar=True)
+    assert isinstance(result, ColumnarTableResult)
+    assert len(result) == 3 and not result.is_ok
+    assert result['name'].values.dtype == object and result['name'].is_ok
+    count = result['count']
+    assert count.values.dtype == np.int64
+    assert count.valid.tolist() == [True, False, True]
+    assert count.values[count.valid].tolist() == [1, 3]
+    assert [failure.index for failure in count.failures] == [1]
+    assert not count.failures[0].result.parsing_result.is_ok
+    price = result['price']
+    assert price.values.dtype == np.float64 and np.isnan(price.values[2])
+    day = result['day']
+    assert day.values.dtype == np.dtype('datetime64[D]') and np.isnat(day.values[1])
+    assert day.values[0] == np.datetime64('2020-01-02')
+
+    rows = task.process(anchor, workbook)
+    assert result.get_value() == rows.get_value()
+    assert result['day'].to_list()[0] == date(2020, 1, 2)
+
+
+def test_columnar_falls_back_to_object(task: TableExtractionTask, workbook: openpyxl.Workbook):
+    workbook.active['B1'] = 2 ** 70  # does not fit int64
+    result = task.process(CellLocation('Sheet', 'A1'), workbook, columnar=True)
+    assert result['count'].values.dtype == object
+    assert result['count'].to_list() == [2 ** 70, None, 3]
+
+
+def test_columnar_fail_locating(task: TableExtractionTask, workbook: openpyxl.Workbook):
+    task.locator = RightOfLocator(label='not in the sheet')
+    result = task.process(CellLocation('Sheet', 'A1'), workbook, columnar=True)
+    assert isinstance(result, ColumnarTableResult)
+    assert not result.is_ok and result.get_value() == []
+
+
+def test_process_excel_columnar():
+    fname = join(sample_dir, 'everything/everything_template.xlsx')
+    processor = exco.from_excel(fname)
+    result = processor.process_excel(fname, columnar=True)
+    assert result.to_dict() == processor.process_excel(fname).to_dict()
+    table = result.table_result_for_key('left_table').result
+    assert table['right'].values.tolist() == [1, 2, 3]
@@ -1,12 +1,27 @@
+import asyncio
+import io
+import pickle
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from os.path import dirname, join
+from typing import Any
 
 import openpyxl
 import pytest
 
-from exco import CellLocation, ExcoTemplate, CellExtractionSpec, LocatorSpec, ExcelProcessorSpec
+import exco
+from exco import CellLocation, ExcoTemplate, CellExtractionSpec, LocatorSpec, ExcelProcessorSpec, RegexSheetName
 from exco.exception import ExtractionTaskCreationException, TableExtractionTaskCreationException
-from exco.extractor.excel_processor import ProcessorKey, ExcelProcessingResult, ExcelProcessorFactory
+from exco.extractor.cell_extraction_task import CellExtractionTask, CellExtractionTaskResult
+from exco.extractor.excel_processor import ProcessorKey, ExcelProcessingResult, ExcelProcessorFactory, ExcelProcessor, \
+    ExcelDerefedProcessor
+from exco.extractor.locator.locating_result import LocatingResult
+from exco.extractor.parser.built_in.string_parser import StringParser
+from exco.extractor.parser.built_in.value_parser import ValueParser
+from exco.extractor.parser.parsing_result import ParsingResult
 from exco.extractor_spec.apv_spec import APVSpec
 from exco.extractor_spec.parser_spec import ParserSpec
 from exco.extractor_spec.spec_source import UnknownSource
@@ -50,6 +65,27 @@ def test_processor_key_hash():
 def test_empty_excel_processing_result():
     epr = ExcelProcessingResult(cell_results={}, table_results={})
     assert epr.cell_result_for_key('a') is None
+    assert len(epr) == 0 and 'a' not in epr
+    assert epr  # still truthy, `if result:` does not depend on the keys
+
+
+def test_excel_processing_result_mapping():
+    def cell_result(key: str, value: str) -> CellExtractionTaskResult:
+        return CellExtractionTaskResult(key=key, locating_result=LocatingResult.good(CellLocation('Sheet', 'A1')),
+                                        parsing_result=ParsingResult.good(value), metadata={})
+
+    a1, b1 = CellLocation('Sheet', 'A1'), CellLocation('Sheet', 'B1')
+    epr = ExcelProcessingResult(cell_results={a1: [cell_result('x', 'first'), cell_result('y', 'y')],
+                                              b1: [cell_result('x', 'second')]},
+                                table_results={})
+    assert epr.cell_result_for_key('x').cell_location == a1
+    assert epr.cell_result_for_key('x').result.get_value() == 'first'
+    assert epr.cell_result_for_key('y').result is epr['y']
+    assert epr.table_result_for_key('x') is None
+    assert list(epr) == ['x', 'y'] and 'y' in epr
+    assert epr['x'].get_value() == 'second'  # same as to_dict, the last result wins
+    assert epr.to_dict() == {'x': 'second', 'y': 'y'}
+    assert {k: v.get_value() for k, v in epr.items()} == epr.to_dict()
 
 
 def test_excel_processor(simple_path: str):
@@ -57,6 +93,27 @@ def test_excel_processor(simple_path: str):
     assert processor.__str__() is not None
 
 
+@dataclass
+class UpperParser(ValueParser[str]):
+    def parse_value(self, v: Any) -> str:
+        return str(v).upper()
+
+
+def test_pickle_excel_processor(simple_hidden_sheets_template_path: str, simple_hidden_sheets_path: str):
+    processor = exco.from_excel(simple_hidden_sheets_template_path,
+                                sheet_name_checkers={'test': RegexSheetName('test.*')},
+                                extra_parsers={'upper': UpperParser},
+                                accept_only_visible_sheets=True)
+    expected = processor.process_excel(simple_hidden_sheets_path).to_dict()
+    assert processor._static is not None
+    data = pickle.dumps(processor)
+    copy = pickle.loads(data)
+    assert copy._static is None and not copy._task_memo  # built tasks are not carried
+    assert copy.factory.parser_factory.class_map['upper'] is UpperParser
+    assert copy.process_excel(simple_hidden_sheets_path).to_dict() == expected
+    assert len(pickle.dumps(copy)) == len(data)
+
+
 def test_excel_processor_only_visible(simple_hidden_sheets_template_path: str, simple_hidden_sheets_path: str):
     processor = ExcelProcessorFactory.default().create_from_template_excel(fname=simple_hidden_sheets_template_path,
                                                                            sheet_name_checkers=checkers,
@@ -79,11 +136,35 @@ def test_duplicate_sheet_names(simple_hidden_sheets_template_path: str, simple_h
                                                                            accept_only_visible_sheets=True)
     simple_wb = openpyxl.load_workbook(simple_hidden_sheets_path)
     wb = processor.normalize_workbook_sheet_names(simple_wb)
-    assert "test" in wb.sheetnames
-    duplicate_sheet_name_regex = re.compile("(duplicate_sheet_name).*")
-    duplicate_sheet_names = [sheet_name for sheet_name in wb.sheetnames
-                             if duplicate_sheet_name_regex.fullmatch(sheet_name)]
-    assert len(duplicate_sheet_names) == 1
+    assert wb.sheetnames == ['test']  # the hidden duplicate is left out
+    assert wb['test'].sheet_state == 'visible'
+    assert wb['test']['A1'].value == simple_wb['test1']['A1'].value
+    assert [(ws.title, ws.sheet_state) for ws in simple_wb.worksheets] == [('test', 'hidden'), ('test1', 'visible')]
+
+
+def test_processors_share_workbook(simple_hidden_sheets_template_path: str, simple_hidden_sheets_path: str):
+    visible = ExcelProcessorFactory.default().create_from_template_excel(fname=simple_hidden_sheets_template_path,
+                                                                         sheet_name_checkers=checkers,
+                                                                         accept_only_visible_sheets=True)
+    hidden = ExcelProcessorFactory.default().create_from_template_excel(fname=simple_hidden_sheets_template_path,
+                                                                        sheet_name_checkers=checkers)
+    wb = openpyxl.load_workbook(simple_hidden_sheets_path)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda processor: processor.process_workbook(wb).to_dict(),
+                                    [visible, hidden] * 4))
+    assert results == [{'a': 4, 'b': 5, 'c': 6}, {'a': 1, 'b': 2, 'c': 3}] * 4
+    assert wb.sheetnames == ['test', 'test1']
+
+
+def test_process_workbook_does_not_modify_workbook():
+    wb = openpyxl.Workbook()
+    wb.active.append(['a', 1])
+    wb.active.append(['b', 2])
+    processor = ExcelDerefedProcessor(
+        cell_processors={CellLocation('Sheet', 'C7'): [CellExtractionTask.simple(key='x', parser=StringParser())]},
+        table_processors={})
+    assert processor.process_workbook(wb).to_dict() == {'x': ''}
+    assert (wb.active.max_row, wb.active.max_column, len(wb.active._cells)) == (2, 2, 4)
 
 
 def test_excel_processor_accept_hidden(simple_hidden_sheets_template_path: str, simple_hidden_sheets_path: str):
@@ -151,3 +232,149 @@ def test_fail_table_creation():
 def test_derefed_processor_process_excel(simple_path: str):
     processor = ExcelProcessorFactory.default().create_from_template_excel(simple_path)
     assert processor.deref(None).process_excel(simple_path) is not None
+
+
+def test_sheet_names(simple_hidden_sheets_template_path: str):
+    processor = ExcelProcessorFactory.default().create_from_template_excel(fname=simple_hidden_sheets_template_path,
+                                                                           sheet_name_checkers=checkers)
+    assert processor.spec.sheet_names() == {'test'}
+    assert processor.deref(None).sheet_names() == {'test'}
+    assert processor.is_sheet_used('test')
+    assert processor.is_sheet_used('test_alias')
+    assert not processor.is_sheet_used('other')
+
+
+def test_process_bytes_and_stream(simple_path: str):
+    with open(simple_path, 'rb') as f:
+        data = f.read()
+    processor = ExcelProcessorFactory.default().create_from_template_excel(fname=data)
+    expected = processor.process_excel(simple_path).to_dict()
+    assert processor.process_bytes(data).to_dict() == expected
+    assert processor.process_bytes(memoryview(data), backend='xml').to_dict() == expected
+    stream = io.BytesIO(data)
+    assert processor.process_stream(stream, read_only=True).to_dict() == expected
+    assert not stream.closed
+    assert processor.deref(None).process_bytes(data).to_dict() == expected
+    assert processor.deref(None).process_stream(io.BytesIO(data)).to_dict() == expected
+
+
+@pytest.mark.parametrize('jobs, chunksize, ordered', [(1, 1, True), (2, 1, True), (2, 2, False)])
+def test_process_many(jobs: int, chunksize: int, ordered: bool):
+    sample_dir = join(dirname(__file__), '../../sample/test')
+    template = join(sample_dir, 'everything/everything_template.xlsx')
+    processor = ExcelProcessorFactory.default().create_from_template_excel(template)
+    expected = processor.process_excel(template).to_dict()
+    missing = join(sample_dir, 'no_such_file.xlsx')
+    paths = [template, missing, template, template]
+
+    results = list(processor.process_many(iter(paths), jobs=jobs, chunksize=chunksize, ordered=ordered))
+    if ordered:
+        assert [path for path, _ in results] == paths
+    else:
+        assert sorted(path for path, _ in results) == sorted(paths)
+    for path, result in results:
+        if path == missing:
+            assert isinstance(result, FileNotFoundError)
+        else:
+            assert result.to_dict() == expected
+
+
+def test_process_many_in_process_interleaved(simple_hidden_sheets_template_path: str, simple_hidden_sheets_path: str):
+    visible = ExcelProcessorFactory.default().create_from_template_excel(fname=simple_hidden_sheets_template_path,
+                                                                         sheet_name_checkers=checkers,
+                                                                         accept_only_visible_sheets=True)
+    hidden = ExcelProcessorFactory.default().create_from_template_excel(fname=simple_hidden_sheets_template_path,
+                                                                        sheet_name_checkers=checkers)
+    first = visible.process_many([simple_hidden_sheets_path] * 2, jobs=1)
+    second = hidden.process_many([simple_hidden_sheets_path] * 2, jobs=1)
+    assert next(first)[1].to_dict() == {'a': 4, 'b': 5, 'c': 6}
+    assert next(second)[1].to_dict() == {'a': 1, 'b': 2, 'c': 3}
+    first.close()
+    assert next(second)[1].to_dict() == {'a': 1, 'b': 2, 'c': 3}
+
+
+def test_aprocess_excel():
+    template = join(dirname(__file__), '../../sample/test/everything/everything_template.xlsx')
+    processor = ExcelProcessorFactory.default().create_from_template_excel(template)
+    expected = processor.process_excel(template).to_dict()
+    with open(template, 'rb') as f:
+        data = f.read()
+
+    async def run():
+        with ProcessPoolExecutor(1) as executor:
+            return [await processor.aprocess_excel(template),
+                    await processor.aprocess_excel(data, executor=executor)]
+
+    assert [result.to_dict() for result in asyncio.run(run())] == [expected, expected]
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_aprocess_many(ordered: bool, monkeypatch):
+    template = join(dirname(__file__), '../../sample/test/everything/everything_template.xlsx')
+    processor = ExcelProcessorFactory.default().create_from_template_excel(template)
+    expected = processor.process_excel(template).to_dict()
+    lock = threading.Lock()
+    running, max_running = [0], [0]
+    original = ExcelProcessor.process_excel
+
+    def process_excel(self, fname, **kwargs):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        try:
+            time.sleep(0.01)
+            return original(self, fname, **kwargs)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(ExcelProcessor, 'process_excel', process_excel)
+    paths = [template, 'no_such_file.xlsx'] + [template] * 6
+
+    async def run():
+        with ThreadPoolExecutor(8) as executor:
+            return [x async for x in processor.aprocess_many(paths, executor=executor, concurrency=3,
+                                                              ordered=ordered)]
+
+    results = asyncio.run(run())
+    assert max_running[0] <= 3
+    if ordered:
+        assert [path for path, _ in results] == paths
+    assert sorted(path for path, _ in results) == sorted(paths)
+    assert all(isinstance(result, FileNotFoundError) if path == 'no_such_file.xlsx' else result.to_dict() == expected
+               for path, result in results)
+
+
+def test_aprocess_many_cancel(monkeypatch):
+    template = join(dirname(__file__), '../../sample/test/everything/everything_template.xlsx')
+    processor = ExcelProcessorFactory.default().create_from_template_excel(template)
+    started = []
+    monkeypatch.setattr(ExcelProcessor, 'process_excel', lambda self, fname, **kwargs: started.append(fname))
+
+    async def run():
+        with ThreadPoolExecutor(1) as executor:
+            async for _ in processor.aprocess_many((str(i) for i in range(100)), executor=executor, concurrency=2):
+                break
+
+    asyncio.run(run())
+    assert len(started) <= 3  # the rest was never sent to the executor
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_aprocess_many_cancelled_file(ordered: bool, monkeypatch):
+    processor = ExcelProcessorFactory.default().create_from_template_excel(
+        join(dirname(__file__), '../../sample/test/everything/everything_template.xlsx'))
+
+    async def aprocess_excel(self, fname, executor=None, **kwargs):
+        if fname == 'cancelled':
+            raise asyncio.CancelledError()
+        return fname
+
+    monkeypatch.setattr(ExcelProcessor, 'aprocess_excel', aprocess_excel)
+
+    async def run():
+        return [x async for x in processor.aprocess_many(['a', 'cancelled', 'b'], concurrency=2, ordered=ordered)]
+
+    results = dict(asyncio.run(run()))
+    assert results['a'] == 'a' and results['b'] == 'b'
+    assert isinstance(results['cancelled'], asyncio.CancelledError)
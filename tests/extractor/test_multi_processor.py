@@ -0,0 +1,67 @@
+from os.path import join, dirname
+
+import pytest
+
+import exco
+from exco import ExcelProcessorFactory, MultiProcessor, RegexSheetName
+from exco.extractor import multi_processor
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+everything_path = join(sample_dir, 'everything/everything_template.xlsx')
+hidden_template_path = join(sample_dir, 'simple_with_hidden_sheets_template.xlsx')
+hidden_path = join(sample_dir, 'simple_with_hidden_sheets.xlsx')
+
+
+def hidden_sheets_processors():
+    checkers = {'test': RegexSheetName('test.*')}
+    return [ExcelProcessorFactory.default().create_from_template_excel(
+        fname=hidden_template_path, sheet_name_checkers=checkers, accept_only_visible_sheets=visible)
+        for visible in [True, False]]
+
+
+def test_multi_processor_same_as_each_processor():
+    processors = hidden_sheets_processors()
+    results = MultiProcessor(processors).process_excel(hidden_path)
+    assert [result.to_dict() for result in results] == [{'a': 4, 'b': 5, 'c': 6}, {'a': 1, 'b': 2, 'c': 3}]
+    assert [result.to_dict() for result in results] == [p.process_excel(hidden_path).to_dict() for p in processors]
+
+
+def test_multi_processor_loads_once(monkeypatch: pytest.MonkeyPatch):
+    loaded = []
+    load_workbook = multi_processor.load_workbook
+
+    def counting_load_workbook(fname, **kwargs):
+        loaded.append(fname)
+        return load_workbook(fname, **kwargs)
+
+    monkeypatch.setattr(multi_processor, 'load_workbook', counting_load_workbook)
+    processor = exco.from_excel(everything_path)
+    results = MultiProcessor([processor, processor]).process_excel(everything_path, columnar=True)
+    assert loaded == [everything_path]
+    expected = processor.process_excel(everything_path).to_dict()
+    assert [result.to_dict() for result in results] == [expected, expected]
+
+
+def test_multi_processor_shares_snapshot(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip('numpy')
+    from exco.cell_source.snapshot_source import SheetSnapshot
+    built = []
+    from_sheet = SheetSnapshot.from_sheet
+
+    def counting_from_sheet(sheet):
+        built.append(sheet.title)
+        return from_sheet(sheet)
+
+    monkeypatch.setattr(SheetSnapshot, 'from_sheet', staticmethod(counting_from_sheet))
+    processor = exco.from_excel(everything_path)
+    expected = processor.process_excel(everything_path).to_dict()
+    results = MultiProcessor([processor] * 3).process_excel(everything_path, snapshot=True)
+    assert [result.to_dict() for result in results] == [expected] * 3
+    assert built and len(built) == len(set(built))
+
+
+def test_multi_processor_bytes():
+    with open(hidden_path, 'rb') as f:
+        data = f.read()
+    results = MultiProcessor(hidden_sheets_processors()).process_bytes(data)
+    assert [result.to_dict() for result in results] == [{'a': 4, 'b': 5, 'c': 6}, {'a': 1, 'b': 2, 'c': 3}]
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from os.path import join, dirname
+from typing import Any
+
+import openpyxl
+import pytest
+
+import exco
+from exco import CellLocation
+from exco.cell_location import CellOffset
+from exco.exception import ParsingFailException
+from exco.extractor.cell_extraction_task import CellExtractionTask
+from exco.extractor.excel_processor import ExcelDerefedProcessor
+from exco.extractor.locator.built_in.at_comment_cell_locator import AtCommentCellLocator
+from exco.extractor.parser.built_in.date_parser import DateParser
+from exco.extractor.parser.built_in.int_parser import IntParser
+from exco.extractor.parser.built_in.string_parser import StringParser
+from exco.extractor.parser.built_in.value_parser import ValueParser
+from exco.extractor.table_extraction_task import EndConditionCollection, TableExtractionTask
+
+np = pytest.importorskip('numpy')
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+
+
+@dataclass
+class BoolParser(ValueParser[bool]):
+    column_dtype = 'bool'
+
+    def parse_value(self, v: Any) -> bool:
+        if not isinstance(v, bool):
+            raise ParsingFailException(f'{v} is not a bool')
+        return v
+
+
+def table_processor(columns) -> ExcelDerefedProcessor:
+    table = TableExtractionTask(
+        key='table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(row=0, col=i): CellExtractionTask.simple(key=key, parser=parser)
+                 for i, (key, parser) in enumerate(columns)},
+        end_condition=EndConditionCollection.default()
+    )
+    return ExcelDerefedProcessor(
+        cell_processors={CellLocation('Sheet', 'E1'): [CellExtractionTask.simple(key='title', parser=StringParser())]},
+        table_processors={CellLocation('Sheet', 'A1'): [table]})
+
+
+@pytest.fixture
+def processor() -> ExcelDerefedProcessor:
+    return table_processor([('name', StringParser()), ('count', IntParser()), ('day', DateParser())])
+
+
+@pytest.fixture
+def workbook() -> openpyxl.Workbook:
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.append(['a', 1, datetime(2020, 1, 2), None, 'report'])
+    sheet.append(['b', 'two', datetime(2020, 1, 3)])
+    sheet.append(['c', 3, datetime(2020, 1, 4)])
+    return wb
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_to_dataframes(processor: ExcelDerefedProcessor, workbook: openpyxl.Workbook, columnar: bool):
+    pd = pytest.importorskip('pandas')
+    frames = processor.process_workbook(workbook, columnar=columnar).to_dataframes()
+    assert set(frames) == {'table', 'cells'}
+    table = frames['table']
+    assert list(table.columns) == ['name', 'count', 'day']
+    assert table['name'].tolist() == ['a', 'b', 'c']
+    assert table['count'].isna().tolist() == [False, True, False]
+    assert table['count'].dropna().astype(int).tolist() == [1, 3]
+    assert pd.Timestamp(table['day'][0]).date() == date(2020, 1, 2)
+    assert frames['cells'].to_dict('records') == [{'title': 'report'}]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_to_arrow(processor: ExcelDerefedProcessor, workbook: openpyxl.Workbook, columnar: bool):
+    pytest.importorskip('pyarrow')
+    batches = processor.process_workbook(workbook, columnar=columnar).to_arrow()
+    table = batches['table']
+    assert table.schema.names == ['name', 'count', 'day']
+    assert table.column(1).to_pylist() == [1, None, 3]
+    assert table.column(2).to_pylist()[0] == date(2020, 1, 2)
+    assert batches['cells'].to_pylist() == [{'title': 'report'}]
+
+
+def test_columns_are_not_copied():
+    pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    fname = join(sample_dir, 'everything/everything_template.xlsx')
+    result = exco.from_excel(fname).process_excel(fname, columnar=True)
+    values = result.table_result_for_key('left_table').result['right'].values
+    assert np.shares_memory(result.to_dataframes()['left_table']['right'].to_numpy(), values)
+    assert np.shares_memory(result.to_arrow()['left_table'].column(1).to_numpy(), values)
+
+
+def test_cells_key_conflict(processor: ExcelDerefedProcessor, workbook: openpyxl.Workbook):
+    pytest.importorskip('pandas')
+    result = processor.process_workbook(workbook)
+    with pytest.raises(ValueError):
+        result.to_dataframes(cells_key='table')
+    assert set(result.to_dataframes(cells_key='single')) == {'table', 'single'}
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_failed_cells_of_every_dtype_are_missing(workbook: openpyxl.Workbook, columnar: bool):
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    workbook.active['B1'] = True
+    workbook.active['B3'] = False
+    processor = table_processor([('name', StringParser()), ('flag', BoolParser()), ('day', DateParser())])
+    workbook.active['C2'] = 'not a date'
+    result = processor.process_workbook(workbook, columnar=columnar)
+    table = result.to_dataframes()['table']
+    assert table['flag'].isna().tolist() == [False, True, False]
+    assert table['flag'].dropna().tolist() == [True, False]
+    assert table['day'].isna().tolist() == [False, True, False]
+    assert pd.Timestamp(table['day'][2]).date() == date(2020, 1, 4)
+    batch = result.to_arrow()['table']
+    assert batch.column(1).to_pylist() == [True, None, False]
+    assert batch.column(2).to_pylist() == [date(2020, 1, 2), None, date(2020, 1, 4)]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_empty_table_keeps_columns(processor: ExcelDerefedProcessor, columnar: bool):
+    pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    wb = openpyxl.Workbook()
+    wb.active['E1'] = 'report'
+    result = processor.process_workbook(wb, columnar=columnar)
+    table = result.to_dataframes()['table']
+    assert list(table.columns) == ['name', 'count', 'day']
+    assert len(table) == 0
+    batch = result.to_arrow()['table']
+    assert batch.schema.names == ['name', 'count', 'day']
+    assert batch.num_rows == 0
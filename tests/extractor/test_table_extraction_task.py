@@ -1,7 +1,10 @@
+from dataclasses import dataclass
+
 import openpyxl
 import pytest
 from exco import CellLocation
 from exco.cell_location import CellOffset
+from exco.cell_source import WindowCell, as_workbook_source
 from exco.exception import NoEndConditionError, TooManyRowRead
 from exco.extractor.cell_extraction_task import CellExtractionTask
 from exco.extractor.locator.built_in.at_comment_cell_locator import AtCommentCellLocator
@@ -143,3 +146,176 @@ def test_shift_cell_rightward(cell_loc):
     cl = CellLocation(sheet_name='Sheet', coordinate='A1')
     assert tt.shift_column_direction(cl, 1).coordinate == 'A2'
     assert tt.shift_item_direction(cl, 1).coordinate == 'B1'
+
+
+def _two_column_task(direction: TableItemDirection) -> TableExtractionTask:
+    second = CellOffset(row=0, col=1) if direction == TableItemDirection.DOWNWARD else CellOffset(row=1, col=0)
+    return TableExtractionTask(
+        key='long_table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(row=0, col=0): CellExtractionTask.simple(key='a', parser=StringParser()),
+                 second: CellExtractionTask.simple(key='b', parser=StringParser())},
+        end_condition=EndConditionCollection([AllBlankTableEndCondition()]),
+        item_direction=direction
+    )
+
+
+@pytest.mark.parametrize('direction', [TableItemDirection.DOWNWARD, TableItemDirection.RIGHTWARD])
+def test_window_reads_match_cell_reads(direction: TableItemDirection, monkeypatch):
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    n = 1000  # spans several windows
+    for i in range(n):
+        first = (i + 2, 2) if direction == TableItemDirection.DOWNWARD else (2, i + 2)
+        second = (i + 2, 3) if direction == TableItemDirection.DOWNWARD else (3, i + 2)
+        sheet.cell(*first).value = f'a{i}'
+        if i % 3:
+            sheet.cell(*second).value = i
+    sheet.cell(5, 5).value = 'outside'
+    n_cells = len(sheet._cells)
+    task = _two_column_task(direction)
+    anchor = CellLocation('Sheet', 'B2')
+    result = task.process(anchor, wb)
+    assert len(result.row_results) == n
+    assert result.row_results[4].to_dict() == {'a': 'a4', 'b': '4'}
+    assert len(sheet._cells) == n_cells  # reading windows does not create cells
+
+    monkeypatch.setattr(TableExtractionTask, '_can_read_windows', lambda self, anchor: False)
+    assert task.process(anchor, wb) == result
+
+
+def test_window_cell_forwards_other_attributes():
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet['A1'] = 1.5
+    sheet['A1'].number_format = '0.00'
+    source = as_workbook_source(wb)['Sheet']
+    cell = source.window_cell(1, 1, 1.5)
+    assert isinstance(cell, WindowCell)
+    assert (cell.coordinate, cell.value, cell.number_format) == ('A1', 1.5, '0.00')
+
+
+@pytest.mark.parametrize('end_condition', [
+    AllBlankTableEndCondition(),
+    CellValueTableEndCondition(cell_value='a700'),
+    MaxRowTableEndCondition(n=300),
+    MaxRowTableEndCondition(n=300, inclusive=False),
+])
+def test_vectorized_end_condition(end_condition, monkeypatch):
+    pytest.importorskip('numpy')
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    for i in range(1000):
+        sheet.cell(i + 2, 2).value = f'a{i}'
+    sheet.cell(1002, 3).hyperlink = 'http://example.com'  # blank cell with a link is not blank
+    task = _two_column_task(TableItemDirection.DOWNWARD)
+    task.end_condition = EndConditionCollection([end_condition])
+    tested = []
+    original = EndConditionCollection.test
+
+    def test(self, param):
+        tested.append(param.row_count)
+        return original(self, param)
+
+    monkeypatch.setattr(EndConditionCollection, 'test', test)
+    anchor = CellLocation('Sheet', 'B2')
+    result = task.process(anchor, wb)
+    assert len(tested) <= 2  # only the terminating row and the row with the link
+
+    monkeypatch.setattr(TableExtractionTask, '_can_read_windows', lambda self, anchor: False)
+    assert task.process(anchor, wb) == result
+
+
+def test_custom_end_condition_is_tested_row_by_row(workbook, cell_loc):
+    class EndAtFive(MaxRowTableEndCondition):
+        def test_many(self, values, row_counts):
+            return None
+
+    task = TableExtractionTask(
+        key='some_table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(row=0, col=0): CellExtractionTask.simple(key='some_key', parser=StringParser())},
+        end_condition=EndConditionCollection([EndAtFive(n=5)]),
+    )
+    result = task.process(cell_loc, workbook)
+    assert len(result.row_results) == 5
+    assert [ec.should_terminate_inclusively() for ec in result.end_condition_results] == [False] * 4 + [True]
+
+
+def test_subclass_overriding_test_is_tested_row_by_row(workbook, cell_loc):
+    class BlankOrEnd(AllBlankTableEndCondition):
+        def test(self, param):
+            result = super().test(param)
+            result.should_terminate = result.should_terminate or param.cfps['some_key'].cell.value == 'end'
+            return result
+
+    task = TableExtractionTask(
+        key='some_table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(row=0, col=0): CellExtractionTask.simple(key='some_key', parser=StringParser())},
+        end_condition=EndConditionCollection([BlankOrEnd()]),
+    )
+    assert len(task.process(cell_loc, workbook).row_results) == 10
+
+
+def test_end_condition_with_is_inclusive_field(workbook, cell_loc):
+    @dataclass
+    class EndAt(CellValueTableEndCondition):
+        is_inclusive: bool
+
+        def test(self, param):
+            result = super().test(param)
+            result.is_inclusive = self.is_inclusive
+            return result
+
+    task = TableExtractionTask(
+        key='some_table',
+        locator=AtCommentCellLocator(),
+        columns={CellOffset(row=0, col=0): CellExtractionTask.simple(key='some_key', parser=StringParser())},
+        end_condition=EndConditionCollection([EndAt(cell_value='end', is_inclusive=True)]),
+    )
+    assert len(task.process(cell_loc, workbook).row_results) == 11
+    task.end_condition = EndConditionCollection([EndAt(cell_value='end', is_inclusive=False)])
+    assert len(task.process(cell_loc, workbook).row_results) == 10
+
+
+@pytest.mark.parametrize('cell_value', ['end', 3, 1, True, None])
+def test_end_condition_snapshot_views_agree(cell_value):
+    np = pytest.importorskip('numpy')
+    from exco.cell_source import SheetSnapshot
+    snapshot = SheetSnapshot(np.array([['a', 3, None], [True, 3.0, 'end'], [None, None, None], [1, 'b', 2.5]],
+                                      dtype=object))
+    rows, cols = np.indices((5, 3)) + 1  # the last row is outside the sheet
+    values, blank, numeric = snapshot.window(rows, cols)
+    assert values[4].tolist() == [None] * 3 and blank[4].all() and not numeric[1][4].any()
+    row_counts = np.arange(1, 6)
+    for end_condition in [AllBlankTableEndCondition(), CellValueTableEndCondition(cell_value=cell_value)]:
+        expected = end_condition.test_many(values, row_counts)
+        assert end_condition.test_many(values, row_counts, blank=blank, numeric=numeric).tolist() == \
+            expected.tolist()
+
+
+@pytest.mark.parametrize('direction', [TableItemDirection.DOWNWARD, TableItemDirection.RIGHTWARD])
+def test_snapshot_table_uses_views(direction: TableItemDirection, monkeypatch):
+    pytest.importorskip('numpy')
+    from exco.cell_source import with_snapshot
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    for i in range(100):
+        if direction == TableItemDirection.DOWNWARD:
+            sheet.cell(i + 2, 2).value, sheet.cell(i + 2, 3).value = f'a{i}', i
+        else:
+            sheet.cell(2, i + 2).value, sheet.cell(3, i + 2).value = f'a{i}', i
+    task = _two_column_task(direction)
+    expected = task.process(CellLocation('Sheet', 'B2'), wb)
+    given = []
+    original = AllBlankTableEndCondition.test_many
+
+    def test_many(self, values, row_counts, blank=None, numeric=None):
+        given.append(blank is not None and numeric is not None)
+        return original(self, values, row_counts, blank=blank, numeric=numeric)
+
+    monkeypatch.setattr(AllBlankTableEndCondition, 'test_many', test_many)
+    assert len(expected.row_results) == 100
+    assert task.process(CellLocation('Sheet', 'B2'), with_snapshot(wb)) == expected
+    assert given and all(given)
@@ -0,0 +1,80 @@
+import datetime
+import json
+from os.path import join, dirname
+
+import pytest
+
+import exco
+from exco import cli
+from exco.exception import CompiledSpecFormatError, ExtractionTaskCreationException
+from exco.extractor_spec.compiled_spec import spec_to_dict, spec_from_dict, _encode_value, _decode_value
+from exco.extractor_spec.spec_source import CompiledSpecSource
+
+sample_dir = join(dirname(__file__), '../../sample/test')
+
+
+@pytest.mark.parametrize('template, data', [
+    ('everything/everything_template.xlsx', 'everything/everything_template.xlsx'),
+    ('table/table_template.xlsx', 'table/table_template.xlsx'),
+    ('simple_deref.xlsx', 'simple_deref_to_extract.xlsx'),
+    ('date/date_template.xlsx', 'date/good_date.xlsx'),
+])
+def test_compile_and_load(tmpdir, template: str, data: str):
+    output = str(tmpdir.join('template.exco.json'))
+    assert cli.main(['compile', join(sample_dir, template), '-o', output]) == 0
+    processor = exco.from_compiled(output)
+    expected = exco.from_excel(join(sample_dir, template), template_cache=None)
+    assert spec_to_dict(processor.spec) == spec_to_dict(expected.spec)
+    assert processor.process_excel(join(sample_dir, data)).to_dict() == \
+        expected.process_excel(join(sample_dir, data)).to_dict()
+
+
+def test_source_location_kept():
+    spec = exco.from_excel(join(sample_dir, 'everything/everything_template.xlsx'), template_cache=None).spec
+    loaded = spec_from_dict(json.loads(json.dumps(spec_to_dict(spec))))
+    for cl, specs in loaded.cell_specs.items():
+        for original, ces in zip(spec.cell_specs[cl], specs):
+            assert isinstance(ces.source, CompiledSpecSource)
+            assert ces.source.sheet_name == cl.sheet_name and ces.source.coordinate == cl.coordinate
+            assert ces.source.describe() == original.source.describe()
+
+
+def test_error_points_at_template(tmpdir):
+    spec = exco.from_excel(join(sample_dir, 'everything/everything_template.xlsx'), template_cache=None).spec
+    d = spec_to_dict(spec)
+    d['cell_specs'][0]['specs'][0]['apv']['parser']['name'] = 'no_such_parser'
+    fname = str(tmpdir.join('bad.exco.json'))
+    with open(fname, 'w') as f:
+        json.dump(d, f)
+    processor = exco.from_compiled(fname)
+    with pytest.raises(ExtractionTaskCreationException) as e:
+        processor.process_excel(join(sample_dir, 'everything/everything_template.xlsx'))
+    assert d['cell_specs'][0]['specs'][0]['source']['description'] in e.value.msg
+
+
+def test_format_version(tmpdir):
+    spec = exco.from_excel(join(sample_dir, 'everything/everything_template.xlsx'), template_cache=None).spec
+    d = spec_to_dict(spec)
+    with pytest.raises(CompiledSpecFormatError):
+        spec_from_dict(dict(d, format_version=d['format_version'] + 1))
+    with pytest.raises(CompiledSpecFormatError):
+        spec_from_dict({'cell_specs': []})
+    fname = str(tmpdir.join('not_json'))
+    with open(fname, 'w') as f:
+        f.write('{{--')
+    with pytest.raises(CompiledSpecFormatError):
+        exco.from_compiled(fname)
+
+
+@pytest.mark.parametrize('value', [
+    None, 1, 1.5, 'a', True, [1, 'b'], {'a': {'b': [1]}},
+    datetime.date(2021, 1, 2), datetime.datetime(2021, 1, 2, 3, 4, 5), datetime.time(1, 2),
+    datetime.timedelta(days=1.5), (1, 2), {1: 'a'}, {'$date': 'not a date'},
+])
+def test_encode_value(value):
+    assert _decode_value(json.loads(json.dumps(_encode_value(value)))) == value
+
+
+def test_cli_bad_template(tmpdir, capsys):
+    assert cli.main(['compile', join(sample_dir, 'bad_template.xlsx'),
+                     '-o', str(tmpdir.join('out.json'))]) == 1
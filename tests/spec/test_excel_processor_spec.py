@@ -1,6 +1,9 @@
 from os.path import join, dirname
 
+import openpyxl
 import pytest
+from openpyxl.comments import Comment
+
 import exco
 
 
@@ -18,6 +21,23 @@ def test_from_excel_template():
     assert template is not None
 
 
+def test_from_excel_template_formula_semantics(tmpdir):
+    fname = str(tmpdir.join('formula_template.xlsx'))
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet['A1'] = '=LOWER("KEY")'  # saved by openpyxl, so there is no cached value
+    sheet['B1'].comment = Comment('{{--\nkey: <<A1>>\nparser: int\n--}}', None)
+    wb.save(fname)
+
+    def keys(spec: exco.ExcelProcessorSpec):
+        return [s.key for specs in spec.cell_specs.values() for s in specs]
+
+    assert keys(exco.ExcelProcessorSpec.from_excel_template(fname)) == ['=LOWER("KEY")']
+    cached = exco.ExcelProcessorSpec.from_excel_template(fname, data_only=True)
+    assert cached == exco.ExcelProcessorSpec.from_workbook_template(openpyxl.load_workbook(fname, data_only=True))
+    assert keys(cached) == [None]
+
+
 def test_spec(simple_spec: exco.ExcelProcessorSpec):
     assert simple_spec.n_cell_spec() == 3
     assert simple_spec.n_cell_location() == 2
@@ -1,6 +1,9 @@
+import dataclasses
+import pickle
+
 import exco
 import pytest
-from exco.cell_location import CellOffset
+from exco.cell_location import CellLocation, CellOffset
 
 
 @pytest.fixture
@@ -36,3 +39,38 @@ def test_cell_location_offset_to():
 
     c3 = c1.shift(offset)
     assert c3 == c2
+
+
+def test_cell_location_from_row_col():
+    by_coordinate = CellLocation('Sheet1', 'AB12')
+    by_row_col = CellLocation('Sheet1', row=12, col=28)
+    assert by_coordinate == by_row_col
+    assert hash(by_coordinate) == hash(by_row_col)
+    assert by_row_col.coordinate == 'AB12'
+    assert by_row_col.row_col == (12, 28)
+    assert {by_coordinate: 1}[by_row_col] == 1
+    assert by_coordinate != CellLocation('Sheet2', 'AB12')
+    assert repr(by_row_col) == "CellLocation(sheet_name='Sheet1', coordinate='AB12')"
+    with pytest.raises(TypeError):
+        CellLocation('Sheet1')
+
+
+def test_cell_location_immutable_and_compact():
+    cl = CellLocation('Sheet1', 'B3')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cl.row = 5
+    assert not hasattr(cl, '__dict__')
+    assert pickle.loads(pickle.dumps(cl)) == cl
+    assert cl.shift(CellOffset(2, -1)) == CellLocation('Sheet1', 'A5')
+    assert cl.shift_row(1).coordinate == 'B4' and cl.shift_col(1).coordinate == 'C3'
+    assert cl.offset_to(CellLocation('Sheet1', 'D1')) == CellOffset(-2, 2)
+
+
+def test_cell_location_is_dataclass():
+    cl = CellLocation('Sheet1', 'B3')
+    assert dataclasses.is_dataclass(cl)
+    assert [f.name for f in dataclasses.fields(cl)] == ['sheet_name', 'row', 'col']
+    assert dataclasses.asdict(cl) == {'sheet_name': 'Sheet1', 'row': 3, 'col': 2}
+    assert dataclasses.replace(cl, row=7) == CellLocation('Sheet1', 'B7')
+    assert dataclasses.replace(cl, sheet_name='Sheet2') == CellLocation('Sheet2', 'B3')
+    assert dataclasses.replace(cl, coordinate='D1') == CellLocation('Sheet1', 'D1')
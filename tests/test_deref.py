@@ -1,9 +1,14 @@
+import copy
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join, dirname
 
 import exco
 import openpyxl
-from exco import CellLocation
-from exco.dereferator import Dereferator
+from exco import CellLocation, setting
+from exco.dereferator import Dereferator, InterpolationPlan
 
 
 def test_deref():
@@ -27,3 +32,115 @@ def test_deref_recursive():
         coordinate='A1'
     ))
     assert dereferator.deref(['a', '<<A2>>']) == ['a', 2]
+
+
+def test_static_spec_reuses_derefed_processor():
+    fname = join(dirname(__file__), '../sample/test/simple.xlsx')
+    processor = exco.from_excel(fname)
+    assert processor.spec.extract_time_references() == ({}, {})
+    wb = openpyxl.load_workbook(fname)
+    assert processor.deref(wb) is processor.deref(openpyxl.load_workbook(fname))
+
+
+def test_referencing_tasks_memoized_by_value():
+    processor = exco.from_excel(join(dirname(__file__), '../sample/test/simple_deref.xlsx'))
+    cell_refs, _ = processor.spec.extract_time_references()
+    assert cell_refs
+    data = join(dirname(__file__), '../sample/test/simple_deref_to_extract.xlsx')
+    first = processor.deref(openpyxl.load_workbook(data))
+    assert {task.key for tasks in first.cell_processors.values() for task in tasks} == {'deref_key', 'world'}
+    second = processor.deref(openpyxl.load_workbook(data))
+    assert first.cell_processors == second.cell_processors
+    assert all(task is second.cell_processors[cl][i]
+               for cl, tasks in first.cell_processors.items() for i, task in enumerate(tasks))
+
+    changed = openpyxl.load_workbook(data)
+    (cl, i), coordinates = next(iter(cell_refs.items()))
+    changed[cl.sheet_name][coordinates[0]].value = 'changed'
+    third = processor.deref(changed)
+    for anchor, tasks in first.cell_processors.items():
+        for j, task in enumerate(tasks):
+            assert (task is third.cell_processors[anchor][j]) == ((anchor, j) != (cl, i))
+
+
+def test_extraction_time_plans_compiled_with_tasks(monkeypatch):
+    processor = exco.from_excel(join(dirname(__file__), '../sample/test/simple_deref.xlsx'))
+    data = join(dirname(__file__), '../sample/test/simple_deref_to_extract.xlsx')
+    processor.deref(openpyxl.load_workbook(data))
+    plans = processor._static[4]
+    assert any(plan is not None for plan in plans.values())
+
+    def fail(deref_re, text):
+        raise AssertionError(f'{text!r} should have been compiled with the tasks')
+
+    monkeypatch.setattr(InterpolationPlan, 'compile', fail)
+    processor._task_memo.clear()
+    changed = openpyxl.load_workbook(data)
+    assert processor.process_workbook(changed).to_dict() == {'deref_key': 12, 'world': 34}
+
+
+def test_interpolation_plan():
+    deref_re = setting.template_to_spec_deref_re
+    assert InterpolationPlan.compile(deref_re, 'no reference') is None
+    plan = InterpolationPlan.compile(deref_re, '<<A1>>')
+    assert plan.pure_coordinate == 'A1'
+    assert plan.fill(lambda coordinate: 7) == 7
+    plan = InterpolationPlan.compile(deref_re, 'from <<A1>> to <<B2>>!')
+    assert plan.pure_coordinate is None
+    assert plan.fill({'A1': 1, 'B2': None}.get) == 'from 1 to None!'
+    assert InterpolationPlan.compile(deref_re, '<<A1>><<B2>>').fill({'A1': 1, 'B2': 2}.get) == '12'
+    assert InterpolationPlan.compile(deref_re, 'from <<A1>> to <<B2>>!') is plan
+
+
+def test_deref_text_matches_regex_substitution():
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet['A1'] = 1.5
+    sheet['B2'] = 'text'
+    dereferator = Dereferator.spec_to_extractor(workbook=wb, anchor=CellLocation(sheet.title, 'A1'))
+    assert dereferator.deref_text('==A1==') == 1.5
+    assert dereferator.deref_text(' ==A1==') == ' 1.5'
+    assert dereferator.deref_text('==A1====B2==') == '1.5text'
+    assert dereferator.deref_text('<<A1>>') == '<<A1>>'
+    assert dereferator.deref_text(3) == 3
+    assert dereferator.deref({'a': ['==B2==', {'b': '==C3=='}]}) == {'a': ['text', {'b': None}]}
+
+
+class SlowMemo(OrderedDict):
+    """Task memo yielding to other threads between its steps, to widen any race window."""
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        time.sleep(0.0001)
+        return value
+
+    def clear(self):
+        time.sleep(0.0001)
+        super().clear()
+
+
+def test_referencing_tasks_shared_across_threads(monkeypatch):
+    processor = exco.from_excel(join(dirname(__file__), '../sample/test/simple_deref.xlsx'))
+    cell_refs, _ = processor.spec.extract_time_references()
+    (cl, _), coordinates = next(iter(cell_refs.items()))
+    data = join(dirname(__file__), '../sample/test/simple_deref_to_extract.xlsx')
+    workbooks = []
+    for value in range(2):
+        wb = openpyxl.load_workbook(data)
+        wb[cl.sheet_name][coordinates[0]].value = f'key{value}'
+        workbooks.append(wb)
+    expected = [processor.process_workbook(wb).to_dict() for wb in workbooks]
+    assert len({tuple(result) for result in expected}) == len(workbooks)
+    monkeypatch.setattr(setting, 'deref_task_cache_size', 1)  # evict all the time
+    processor._task_memo = SlowMemo()
+
+    def work(n: int):
+        rng = random.Random(n)
+        for k in range(100):
+            if k % 25 == n:
+                processor.spec = copy.copy(processor.spec)  # tasks are rebuilt
+            i = rng.randrange(len(workbooks))
+            assert processor.process_workbook(workbooks[i]).to_dict() == expected[i]
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, range(8)))
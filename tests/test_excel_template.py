@@ -1,9 +1,12 @@
 from os.path import join, dirname
 
+import openpyxl
 import pytest
+from openpyxl.comments import Comment
 
 import exco
 from exco import ExcoTemplate, ExcoBlock, util
+from exco.cell_source import XmlSheetSource
 from exco.exception import BadTemplateException, MissingTableBlock, TableKeyNotFound, TableHasNoColumn
 from exco.exco_template.exco_template import ExcoBlockWithLocation
 
@@ -96,3 +99,34 @@ def test_table_has_no_column():
 def test_describe():
     got = ExcoBlock(1, 2, 'hello').describe()
     assert 'hello' in got
+
+
+@pytest.mark.parametrize('fname', [
+    'simple.xlsx', 'simple_deref.xlsx', 'simple_with_meta.xlsx', 'chart_sheet_test.xlsx',
+    'everything/everything_template.xlsx', 'table/table_template.xlsx', 'date/date_template.xlsx',
+])
+def test_from_excel_same_as_from_workbook(fname: str):
+    fname = join(dirname(__file__), '../sample/test', fname)
+    expected = ExcoTemplate.from_workbook(openpyxl.load_workbook(fname))
+    template = ExcoTemplate.from_excel(fname)
+    assert template == expected
+
+
+def test_from_excel_comment_on_formula_cell(tmpdir):
+    fname = str(tmpdir.join('formula_template.xlsx'))
+    wb = openpyxl.Workbook()
+    wb.active['A1'] = '=1+1'
+    wb.active['A1'].comment = Comment('{{--\nkey: two\nparser: int\n--}}', None)
+    wb.save(fname)
+    template = ExcoTemplate.from_excel(fname)
+    assert template == ExcoTemplate.from_workbook(openpyxl.load_workbook(fname))
+    assert template.n_exco_blocks() == 1
+
+
+def test_from_excel_reads_only_comments(monkeypatch):
+    def fail(self):
+        raise AssertionError(f'{self.title} cells should not be loaded')
+
+    monkeypatch.setattr(XmlSheetSource, '_load', fail)
+    template = ExcoTemplate.from_excel(join(dirname(__file__), '../sample/test/everything/everything_template.xlsx'))
+    assert template.n_exco_blocks() > 0
@@ -1,7 +1,7 @@
 import exco
 import pytest
 from exco import CellLocation
-from exco.exco_template.exco_block import ExcoBlockCollection, ExcoBlock
+from exco.exco_template.exco_block import ExcoBlockCollection, ExcoBlock, _parse_yaml
 from exco.exco_template.exco_template import ExcoBlockWithLocation
 
 
@@ -94,3 +94,21 @@ def test_exco_block_with_location():
         exco_block=ExcoBlock.simple("key: hello\nparser: int")
     )
     assert isinstance(eb.describe(), str)
+
+
+def test_yaml_parsed_once_per_raw_string():
+    raw = 'table_key: memo_table\nkey: memo_col\nparser: int\nmetadata: {unit: km}'
+    _parse_yaml.cache_clear()
+    blocks = [ExcoBlock.simple(raw, start_line=i) for i in range(3)]
+    assert [b.key for b in blocks] == ['memo_col'] * 3
+    assert [b.table_key() for b in blocks] == ['memo_table'] * 3
+    d = blocks[0].to_dict()
+    d['metadata']['unit'] = 'm'  # to_dict is a copy
+    assert blocks[1].to_dict()['metadata'] == {'unit': 'km'}
+    info = _parse_yaml.cache_info()
+    assert info.misses == 1 and info.hits == 7
+
+
+def test_yaml_parse_error():
+    with pytest.raises(exco.exception.YamlParseError):
+        ExcoBlock.simple('key: @reserved').to_dict()
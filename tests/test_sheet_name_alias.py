@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from exco import ExactSheetName, CaseInsensitiveSheetName, GlobSheetName, RegexSheetName, AnySheetName
+from exco.sheet_name_alias import SheetNameAliasMatcher
+
+
+@pytest.mark.parametrize('matcher, accepted, rejected', [
+    (ExactSheetName('Sheet (1)'), ['Sheet (1)'], ['sheet (1)', 'Sheet (1) ', 'Sheet 1']),
+    (CaseInsensitiveSheetName('Summary'), ['Summary', 'SUMMARY'], ['Summary 2']),
+    (GlobSheetName('Test *'), ['Test 1/1/2021', 'Test '], ['test 1', 'A Test 1']),
+    (GlobSheetName('test *', ignore_case=True), ['Test 1'], ['Test']),
+    (RegexSheetName(r'Q[1-4] \d{4}'), ['Q1 2021'], ['Q5 2021', 'Q1 2021 draft']),
+    (RegexSheetName(r'q[1-4]', ignore_case=True), ['Q1'], ['Q12']),
+    (AnySheetName(ExactSheetName('a'), GlobSheetName('b*')), ['a', 'bcd'], ['ab', 'c']),
+    (AnySheetName(), [], ['a', '']),
+    (RegexSheetName(r'(?i)q[1-4]'), ['Q1', 'q2'], ['Q12']),
+    (AnySheetName(ExactSheetName('a'), RegexSheetName(r'(?i)b')), ['a', 'B'], ['A']),
+])
+def test_sheet_name_matcher(matcher, accepted, rejected):
+    assert all(matcher(name) for name in accepted)
+    assert not any(matcher(name) for name in rejected)
+    copy = pickle.loads(pickle.dumps(matcher))
+    assert copy == matcher
+    assert all(copy(name) for name in accepted)
+
+
+def test_sheet_name_alias_matcher():
+    checkers = {
+        'Summary': CaseInsensitiveSheetName('summary'),
+        'Test': AnySheetName(GlobSheetName('Test *'), RegexSheetName('T[0-9]+')),
+        'Everything': GlobSheetName('*'),
+    }
+    matcher = SheetNameAliasMatcher(checkers)
+    assert matcher._regex is not None  # one regex for every checker
+    assert matcher.match('SUMMARY') == 'Summary'
+    assert matcher.match('Test 1/1/2021') == 'Test'
+    assert matcher.match('T12') == 'Test'
+    assert matcher.match('other') == 'Everything'  # the first checker accepting the name wins
+    assert SheetNameAliasMatcher({'Summary': ExactSheetName('Summary')}).match('other') is None
+
+
+@pytest.mark.parametrize('checker', [
+    lambda name: name.startswith('T'),
+    RegexSheetName(r'(T)\d+'),  # groups would shift in a combined regex
+    RegexSheetName(r'(?i)t\d+'),  # global flags must start the regex
+])
+def test_sheet_name_alias_matcher_checks_one_by_one(checker):
+    matcher = SheetNameAliasMatcher({'Summary': ExactSheetName('Summary'), 'Test': checker})
+    assert matcher._regex is None
+    assert matcher.match('T1') == 'Test'
+    assert matcher.match('Summary') == 'Summary'
+    assert matcher.match('other') is None
+
+
+def test_sheet_name_alias_matcher_global_flags_do_not_leak():
+    matcher = SheetNameAliasMatcher({'Foo': RegexSheetName('(?i)foo'), 'Bar': ExactSheetName('Bar')})
+    assert matcher.match('FOO') == 'Foo'
+    assert matcher.match('Bar') == 'Bar'
+    assert matcher.match('bar') is None
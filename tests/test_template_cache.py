@@ -0,0 +1,100 @@
+import io
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join, dirname
+
+import exco
+from exco import ExcelProcessorFactory, ExcelProcessorSpec
+from exco.extractor.parser.built_in.int_parser import IntParser
+from exco.template_cache import TemplateCache
+
+sample_dir = join(dirname(__file__), '../sample/test')
+template = join(sample_dir, 'everything/everything_template.xlsx')
+
+
+def test_memory_cache(monkeypatch):
+    cache = TemplateCache()
+    p1 = exco.from_excel(template, template_cache=cache)
+    monkeypatch.setattr(ExcelProcessorSpec, 'from_excel_template', None)  # not parsed again
+    monkeypatch.setattr(ExcelProcessorFactory, 'create_extraction_task', None)  # tasks not built again
+    p2 = exco.from_excel(template, template_cache=cache, accept_only_visible_sheets=True)
+    assert p1 is not p2 and p1.spec is p2.spec and p2.accept_only_visible_sheets
+    assert p1._static is not None and p1._static is p2._static
+    monkeypatch.undo()
+    expected = exco.from_excel(template, template_cache=None).process_excel(template).to_dict()
+    assert p2.process_excel(template).to_dict() == expected
+
+    p1.spec = ExcelProcessorSpec(cell_specs={}, table_specs={})  # other processors keep the cached spec
+    assert p1.process_excel(template).to_dict() == {}
+    assert p2.process_excel(template).to_dict() == expected
+    assert exco.from_excel(template, template_cache=cache).process_excel(template).to_dict() == expected
+
+
+def test_memory_cache_threads():
+    cache = TemplateCache()
+    expected = exco.from_excel(template, template_cache=None).process_excel(template).to_dict()
+    factory = ExcelProcessorFactory.default()
+    with open(template, 'rb') as f:
+        data = f.read()
+
+    def work(n: int):
+        for k in range(20):
+            cache.put(f'{n}-{k}', factory.create_from_spec(ExcelProcessorSpec(cell_specs={}, table_specs={})))
+            assert exco.from_excel(data, template_cache=cache).process_excel(template).to_dict() == expected
+
+    cache.maxsize = 2  # evict all the time
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(work, range(4)))
+
+
+def test_key_depends_on_actors():
+    cache = TemplateCache()
+    default = ExcelProcessorFactory.default()
+    extended = ExcelProcessorFactory.default(extra_parsers={'custom_int': IntParser})
+    assert cache.key(template, default) == cache.key(template, ExcelProcessorFactory.default())
+    assert cache.key(template, default) != cache.key(template, extended)
+
+
+def test_key_same_for_path_bytes_and_stream():
+    cache = TemplateCache()
+    factory = ExcelProcessorFactory.default()
+    with open(template, 'rb') as f:
+        data = f.read()
+    stream = io.BytesIO(data)
+    assert cache.key(template, factory) == cache.key(data, factory) == cache.key(stream, factory)
+    assert stream.tell() == 0
+    p = exco.from_excel(stream, template_cache=cache)
+    assert exco.from_excel(data, template_cache=cache).spec == p.spec
+
+
+def test_disk_cache(tmpdir):
+    directory = str(tmpdir.join('cache'))
+    spec = exco.from_excel(template, template_cache=TemplateCache(directory=directory)).spec
+    assert len(tmpdir.join('cache').listdir()) == 1
+    cached = exco.from_excel(template, template_cache=TemplateCache(directory=directory)).spec
+    assert cached == spec
+
+
+def test_disk_cache_bad_file_is_a_miss(tmpdir):
+    directory = str(tmpdir.join('cache'))
+    factory = ExcelProcessorFactory.default()
+    cache = TemplateCache(directory=directory)
+    spec = exco.from_excel(template, template_cache=cache).spec
+    key = cache.key(template, factory)
+    for content in [b'', b'garbage', pickle.dumps(ValueError), b'\x80\x04\x95\x00']:
+        tmpdir.join('cache', f'{key}.pkl').write_binary(content)
+        assert TemplateCache(directory=directory).get(key, factory) is None
+    assert exco.from_excel(template, template_cache=TemplateCache(directory=directory)).spec == spec
+
+
+def test_maxsize():
+    cache = TemplateCache(maxsize=1)
+    factory = ExcelProcessorFactory.default()
+    a = factory.create_from_spec(ExcelProcessorSpec(cell_specs={}, table_specs={}))
+    b = factory.create_from_spec(ExcelProcessorSpec(cell_specs={}, table_specs={}))
+    cache.put('a', a)
+    cache.put('b', b)
+    assert cache.get('a', factory) is None
+    assert cache.get('b', factory) is b
+    cache.clear()
+    assert cache.get('b', factory) is None
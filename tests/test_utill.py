@@ -1,4 +1,7 @@
+import openpyxl
+
 from exco import util
+from exco.cell_source import as_workbook_source
 
 
 def test_long_string():
@@ -41,3 +44,17 @@ def test_default_key():
 def test_flatten_len():
     lol = [[1, 2, 3], [3, 4, 5]]
     assert util.flattened_len(lol) == 6
+
+
+def test_merged_cell_helpers_accept_worksheet():
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.merge_cells('A1:B2')
+    sheet['C1'] = 'right'
+    sheet['A3'] = 'below'
+    for s in [sheet, as_workbook_source(wb)['Sheet']]:
+        assert str(util.get_merged_cell(s, 'B2')) == 'A1:B2'
+        assert util.get_rightmost_coordinate(s, sheet['A1']).short_name == 'Sheet!B1'
+        assert util.get_bottommost_coordinate(s, sheet['A1']).short_name == 'Sheet!A2'
+        assert util.search_right_of_scope(s, sheet['A1'], 'right').coordinate == 'C1'
+        assert util.search_below_of_scope(s, sheet['A1'], 'below').coordinate == 'A3'
@@ -0,0 +1,66 @@
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from exco.workbook_loader import load_workbook, BufferReader
+
+
+@pytest.fixture
+def three_sheets_path(tmp_path) -> str:
+    wb = Workbook()
+    wb.active.title = 'used'
+    wb['used']['A1'] = 1
+    wb.create_sheet('unused')['A1'] = 2
+    hidden = wb.create_sheet('hidden')
+    hidden['A1'] = 3
+    hidden.sheet_state = 'hidden'
+    fname = str(tmp_path / 'three_sheets.xlsx')
+    wb.save(fname)
+    return fname
+
+
+@pytest.mark.parametrize('read_only', [False, True])
+def test_load_only_filtered_sheets(three_sheets_path: str, read_only: bool):
+    wb = load_workbook(three_sheets_path, read_only=read_only,
+                       sheet_filter=lambda sheet_name: sheet_name == 'used')
+    assert wb.sheetnames == ['used', 'unused', 'hidden']
+    assert [ws.sheet_state for ws in wb.worksheets] == ['visible', 'visible', 'hidden']
+    assert wb['used']['A1'].value == 1
+    assert wb['unused']['A1'].value is None
+    assert wb['hidden']['A1'].value is None
+    wb.close()
+
+
+def test_load_all_sheets(three_sheets_path: str):
+    wb = load_workbook(three_sheets_path)
+    assert [ws['A1'].value for ws in wb.worksheets] == [1, 2, 3]
+
+
+@pytest.mark.parametrize('backend', ['openpyxl', 'xml'])
+@pytest.mark.parametrize('to_source', [
+    lambda data: data,
+    lambda data: memoryview(bytearray(data)),
+    lambda data: io.BytesIO(data),
+])
+def test_load_from_memory(three_sheets_path: str, backend: str, to_source):
+    with open(three_sheets_path, 'rb') as f:
+        data = f.read()
+    wb = load_workbook(to_source(data), backend=backend)
+    assert wb['unused']['A1'].value == 2
+    wb.close()
+
+
+def test_buffer_reader():
+    reader = BufferReader(memoryview(b'0123456789'))
+    assert reader.read(3) == b'012'
+    assert reader.seek(-2, io.SEEK_END) == 8
+    assert reader.read() == b'89'
+    assert reader.read(1) == b''
+    reader.seek(1)
+    buffer = bytearray(4)
+    assert reader.readinto(buffer) == 4
+    assert buffer == b'1234'
+    assert reader.tell() == 5
+    with pytest.raises(ValueError):
+        reader.seek(-1)